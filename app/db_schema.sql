@@ -54,6 +54,15 @@ CREATE TABLE candidate_skills (
     FOREIGN KEY (skill_id) REFERENCES skills(skill_id) ON DELETE CASCADE
 );
 
+-- Junction table for the many-to-many relationship between jobs and the skills they require
+CREATE TABLE job_skills (
+    job_id INTEGER NOT NULL,
+    skill_id INTEGER NOT NULL,
+    PRIMARY KEY (job_id, skill_id),
+    FOREIGN KEY (job_id) REFERENCES jobs(job_id) ON DELETE CASCADE,
+    FOREIGN KEY (skill_id) REFERENCES skills(skill_id) ON DELETE CASCADE
+);
+
 -- Table representing a single application from a candidate for a job
 CREATE TABLE applications (
     application_id INTEGER PRIMARY KEY,
@@ -127,6 +136,29 @@ CREATE TABLE decision_logs (
     FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE RESTRICT
 );
 
+-- Indexes on foreign-key columns, so that per-parent lookups and ON DELETE
+-- CASCADE/SET NULL/RESTRICT checks search an index instead of scanning the
+-- child table. Columns that lead a PRIMARY KEY or UNIQUE constraint (e.g.
+-- applications.job_id via UNIQUE (job_id, candidate_id)) are already indexed.
+CREATE INDEX ix_jobs_created_by_user_id ON jobs(created_by_user_id);
+CREATE INDEX ix_jobs_hiring_manager_user_id ON jobs(hiring_manager_user_id);
+CREATE INDEX ix_candidate_skills_skill_id ON candidate_skills(skill_id);
+CREATE INDEX ix_job_skills_skill_id ON job_skills(skill_id);
+CREATE INDEX ix_applications_candidate_id ON applications(candidate_id);
+-- Status filters on GET /applications/ and PATCH /applications/status.
+CREATE INDEX ix_applications_status ON applications(status);
+CREATE INDEX ix_documents_application_id ON documents(application_id);
+CREATE INDEX ix_interviews_application_id ON interviews(application_id);
+CREATE INDEX ix_interviews_scheduled_by_user_id ON interviews(scheduled_by_user_id);
+CREATE INDEX ix_interview_participants_user_id ON interview_participants(user_id);
+-- Range lookups of interviews by time (overlap checks, calendars).
+CREATE INDEX ix_interviews_start_time_end_time ON interviews(start_time, end_time);
+CREATE INDEX ix_feedback_application_id ON feedback(application_id);
+CREATE INDEX ix_feedback_user_id ON feedback(user_id);
+CREATE INDEX ix_feedback_interview_id ON feedback(interview_id);
+CREATE INDEX ix_decision_logs_application_id ON decision_logs(application_id);
+CREATE INDEX ix_decision_logs_user_id ON decision_logs(user_id);
+
 -- Triggers to automatically update the 'updated_at' timestamp on row modification
 CREATE TRIGGER update_users_updated_at
 AFTER UPDATE ON users
@@ -161,4 +193,119 @@ AFTER UPDATE ON interviews
 FOR EACH ROW
 BEGIN
     UPDATE interviews SET updated_at = STRFTIME('%Y-%m-%d %H:%M:%S', 'now') WHERE interview_id = OLD.interview_id;
-END;
\ No newline at end of file
+END;
+
+-- Full-text search indexes (FTS5) over job postings and candidates. They are
+-- external-content tables: only the inverted index is stored, the text is
+-- read back from the content table. The triggers keep them in sync.
+CREATE VIRTUAL TABLE jobs_fts USING fts5(
+    title, description,
+    content='jobs', content_rowid='job_id',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+
+CREATE TRIGGER jobs_fts_ai AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts(rowid, title, description) VALUES (new.job_id, new.title, new.description);
+END;
+
+CREATE TRIGGER jobs_fts_ad AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, description) VALUES ('delete', old.job_id, old.title, old.description);
+END;
+
+CREATE TRIGGER jobs_fts_au AFTER UPDATE OF title, description ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, description) VALUES ('delete', old.job_id, old.title, old.description);
+    INSERT INTO jobs_fts(rowid, title, description) VALUES (new.job_id, new.title, new.description);
+END;
+
+CREATE VIRTUAL TABLE candidates_fts USING fts5(
+    first_name, last_name, email,
+    content='candidates', content_rowid='candidate_id',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+
+CREATE TRIGGER candidates_fts_ai AFTER INSERT ON candidates BEGIN
+    INSERT INTO candidates_fts(rowid, first_name, last_name, email)
+    VALUES (new.candidate_id, new.first_name, new.last_name, new.email);
+END;
+
+CREATE TRIGGER candidates_fts_ad AFTER DELETE ON candidates BEGIN
+    INSERT INTO candidates_fts(candidates_fts, rowid, first_name, last_name, email)
+    VALUES ('delete', old.candidate_id, old.first_name, old.last_name, old.email);
+END;
+
+CREATE TRIGGER candidates_fts_au AFTER UPDATE OF first_name, last_name, email ON candidates BEGIN
+    INSERT INTO candidates_fts(candidates_fts, rowid, first_name, last_name, email)
+    VALUES ('delete', old.candidate_id, old.first_name, old.last_name, old.email);
+    INSERT INTO candidates_fts(rowid, first_name, last_name, email)
+    VALUES (new.candidate_id, new.first_name, new.last_name, new.email);
+END;
+
+-- Hiring funnel summary tables. Triggers on applications keep application
+-- counts per (job, status) and per status, plus a histogram of how long
+-- applications stayed in a status before moving on, so funnel reports read
+-- one row per status instead of scanning applications. Histogram bucket i
+-- counts durations below the i-th bound (1h, 4h, 12h, 1d, 2d, 4d, 7d, 14d,
+-- 30d, 60d, 90d); bucket 11 is open-ended.
+CREATE TABLE job_status_counts (
+    job_id INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (job_id, status)
+);
+
+CREATE TABLE application_status_totals (
+    status TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+
+CREATE TABLE stage_duration_histogram (
+    status TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (status, bucket)
+);
+
+CREATE TRIGGER applications_funnel_ai AFTER INSERT ON applications BEGIN
+    INSERT INTO job_status_counts(job_id, status, count) VALUES (new.job_id, new.status, 1)
+    ON CONFLICT(job_id, status) DO UPDATE SET count = count + 1;
+    INSERT INTO application_status_totals(status, count) VALUES (new.status, 1)
+    ON CONFLICT(status) DO UPDATE SET count = count + 1;
+END;
+
+CREATE TRIGGER applications_funnel_ad AFTER DELETE ON applications BEGIN
+    UPDATE job_status_counts SET count = count - 1 WHERE job_id = old.job_id AND status = old.status;
+    DELETE FROM job_status_counts WHERE job_id = old.job_id AND status = old.status AND count <= 0;
+    UPDATE application_status_totals SET count = count - 1 WHERE status = old.status;
+END;
+
+CREATE TRIGGER applications_funnel_au AFTER UPDATE OF status, job_id ON applications
+WHEN old.status IS NOT new.status OR old.job_id IS NOT new.job_id
+BEGIN
+    UPDATE job_status_counts SET count = count - 1 WHERE job_id = old.job_id AND status = old.status;
+    DELETE FROM job_status_counts WHERE job_id = old.job_id AND status = old.status AND count <= 0;
+    UPDATE application_status_totals SET count = count - 1 WHERE status = old.status;
+    INSERT INTO job_status_counts(job_id, status, count) VALUES (new.job_id, new.status, 1)
+    ON CONFLICT(job_id, status) DO UPDATE SET count = count + 1;
+    INSERT INTO application_status_totals(status, count) VALUES (new.status, 1)
+    ON CONFLICT(status) DO UPDATE SET count = count + 1;
+    INSERT INTO stage_duration_histogram(status, bucket, count)
+    SELECT old.status,
+           CASE
+               WHEN seconds < 3600 THEN 0
+               WHEN seconds < 14400 THEN 1
+               WHEN seconds < 43200 THEN 2
+               WHEN seconds < 86400 THEN 3
+               WHEN seconds < 172800 THEN 4
+               WHEN seconds < 345600 THEN 5
+               WHEN seconds < 604800 THEN 6
+               WHEN seconds < 1209600 THEN 7
+               WHEN seconds < 2592000 THEN 8
+               WHEN seconds < 5184000 THEN 9
+               WHEN seconds < 7776000 THEN 10
+               ELSE 11
+           END,
+           1
+    FROM (SELECT (julianday('now') - julianday(old.updated_at)) * 86400 AS seconds)
+    WHERE old.status IS NOT new.status
+    ON CONFLICT(status, bucket) DO UPDATE SET count = count + 1;
+END;
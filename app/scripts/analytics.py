@@ -0,0 +1,155 @@
+"""
+Hiring analytics computed with vectorized NumPy over `applications` and
+`decision_logs`.
+
+Timestamps are converted to Julian day numbers by SQLite (`julianday()`), so
+rows arrive as plain floats and are loaded in columnar batches straight into
+NumPy arrays; no ORM objects or `datetime`s are built. All statistics are
+then computed with array operations, looping at most over groups (stages,
+weekly cohorts), never over rows.
+"""
+from datetime import date, timedelta
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.engine import Connection
+
+# Rows fetched per round trip while loading columns.
+BATCH_SIZE = 10_000
+
+# Julian day number of Monday 1970-01-05, the origin of the weekly cohorts.
+MONDAY_EPOCH_JD = 2440591.5
+EPOCH_DATE = date(1970, 1, 5)
+
+PERCENTILES = (25, 50, 75, 90)
+
+
+def fetch_columns(connection: Connection, stmt, dtypes: Sequence[Any]) -> List[np.ndarray]:
+    """
+    Runs `stmt` and returns each of its columns as a NumPy array, fetching
+    rows in batches of `BATCH_SIZE`. NULL floats become NaN.
+    """
+    chunks: List[List[np.ndarray]] = [[] for _ in dtypes]
+    result = connection.execution_options(yield_per=BATCH_SIZE).execute(stmt)
+    for partition in result.partitions():
+        for chunk, column, dtype in zip(chunks, zip(*partition), dtypes):
+            chunk.append(np.asarray(column, dtype=dtype))
+    return [np.concatenate(chunk) if chunk else np.empty(0, dtype=dtype) for chunk, dtype in zip(chunks, dtypes)]
+
+
+def distribution(days: np.ndarray) -> Dict[str, Any]:
+    """Summarizes durations in days as a count, mean and percentiles."""
+    if not len(days):
+        return {"count": 0, "mean_days": None, **{f"p{p}_days": None for p in PERCENTILES}}
+    percentiles = np.percentile(days, PERCENTILES)
+    return {
+        "count": int(len(days)),
+        "mean_days": float(days.mean()),
+        **{f"p{p}_days": float(value) for p, value in zip(PERCENTILES, percentiles)},
+    }
+
+
+def first_event_per_key(keys: np.ndarray, times: np.ndarray):
+    """Returns the unique keys and, for each, its earliest time."""
+    order = np.lexsort((times, keys))
+    keys, times = keys[order], times[order]
+    first = np.ones(len(keys), dtype=bool)
+    first[1:] = keys[1:] != keys[:-1]
+    return keys[first], times[first]
+
+
+def time_to_hire_report(connection: Connection, applications, decision_logs) -> Dict[str, Any]:
+    """
+    Computes the time-to-hire distribution, median time per stage and weekly
+    cohorts.
+
+    Args:
+        connection: Connection to read from.
+        applications: The `applications` table.
+        decision_logs: The `decision_logs` table.
+
+    Returns:
+        A dict with `time_to_hire`, `stage_medians` and `weekly_cohorts`:
+        - time to hire runs from `applied_at` to the application's first
+          `hire` decision;
+        - a stage starts at `applied_at` (stage `applied`) or at a decision
+          (stage named after it) and ends at the application's next decision;
+        - cohorts group applications by the Monday-based week they were
+          submitted in.
+    """
+    app_ids, applied_jd = fetch_columns(
+        connection,
+        select(applications.c.application_id, func.julianday(applications.c.applied_at))
+        .order_by(applications.c.application_id),
+        (np.int64, np.float64),
+    )
+    # Decisions are compared and sorted as strings, so rows without one (only
+    # possible in databases not created from the schema) are left out.
+    log_app_ids, log_decisions, log_jd = fetch_columns(
+        connection,
+        select(decision_logs.c.application_id, decision_logs.c.decision, func.julianday(decision_logs.c.created_at))
+        .where(decision_logs.c.decision.is_not(None)),
+        (np.int64, object, np.float64),
+    )
+
+    # Time to hire: first hire decision of each application minus its applied_at.
+    is_hire = log_decisions == "hire"
+    hired_ids, hired_jd = first_event_per_key(log_app_ids[is_hire], log_jd[is_hire])
+    positions = np.searchsorted(app_ids, hired_ids)
+    found = positions < len(app_ids)
+    found[found] = app_ids[positions[found]] == hired_ids[found]
+    positions, hired_jd = positions[found], hired_jd[found]
+    time_to_hire = hired_jd - applied_jd[positions]
+    valid = ~np.isnan(time_to_hire)
+    time_to_hire, hired_positions = time_to_hire[valid], positions[valid]
+
+    # Stages: sort every event by (application, time); consecutive events of the
+    # same application delimit a stage labelled by the event that opened it.
+    labels, label_codes = np.unique(
+        np.concatenate([np.full(len(app_ids), "applied", dtype=object), log_decisions]), return_inverse=True
+    )
+    event_app_ids = np.concatenate([app_ids, log_app_ids])
+    event_jd = np.concatenate([applied_jd, log_jd])
+    order = np.lexsort((event_jd, event_app_ids))
+    event_app_ids, event_jd, label_codes = event_app_ids[order], event_jd[order], label_codes[order]
+    same_application = event_app_ids[1:] == event_app_ids[:-1]
+    stage_days = (event_jd[1:] - event_jd[:-1])[same_application]
+    stage_codes = label_codes[:-1][same_application]
+    valid = ~np.isnan(stage_days)
+    stage_days, stage_codes = stage_days[valid], stage_codes[valid]
+    stage_medians = []
+    for code in np.unique(stage_codes):
+        days = stage_days[stage_codes == code]
+        stage_medians.append(
+            {"stage": str(labels[code]), "transitions": int(len(days)), "median_days": float(np.median(days))}
+        )
+
+    # Weekly cohorts by submission week.
+    submitted = ~np.isnan(applied_jd)
+    weeks = np.full(len(app_ids), -1, dtype=np.int64)
+    weeks[submitted] = np.floor((applied_jd[submitted] - MONDAY_EPOCH_JD) / 7).astype(np.int64)
+    cohort_weeks, cohort_index = np.unique(weeks[submitted], return_inverse=True)
+    applications_per_week = np.bincount(cohort_index, minlength=len(cohort_weeks))
+    hire_weeks = np.searchsorted(cohort_weeks, weeks[hired_positions])
+    hires_per_week = np.bincount(hire_weeks, minlength=len(cohort_weeks))
+    order = np.argsort(hire_weeks, kind="stable")
+    per_week_hire_days = np.split(time_to_hire[order], np.cumsum(hires_per_week)[:-1]) if len(cohort_weeks) else []
+    weekly_cohorts = [
+        {
+            "week_start": EPOCH_DATE + timedelta(weeks=int(week)),
+            "applications": int(n_applications),
+            "hires": int(n_hires),
+            "hire_rate": float(n_hires / n_applications),
+            "median_time_to_hire_days": float(np.median(days)) if len(days) else None,
+        }
+        for week, n_applications, n_hires, days in zip(
+            cohort_weeks, applications_per_week, hires_per_week, per_week_hire_days
+        )
+    ]
+
+    return {
+        "time_to_hire": distribution(time_to_hire),
+        "stage_medians": stage_medians,
+        "weekly_cohorts": weekly_cohorts,
+    }
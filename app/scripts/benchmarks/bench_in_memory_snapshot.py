@@ -0,0 +1,68 @@
+"""
+Benchmark for snapshot persistence of the in-memory backend.
+
+The script fills `main_in_memory` with synthetic rows (1,000,000 by default:
+candidates, plus one application per two candidates), then times taking a
+snapshot, and restoring it into an empty store the way a restart does
+(`load_snapshot`, which also rebuilds the indexes). It prints the snapshot
+size and both timings.
+
+Usage:
+    python benchmarks/bench_in_memory_snapshot.py [--rows N] [--path FILE]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Make the application modules importable when run from the benchmarks folder.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import main_in_memory as store  # noqa: E402
+from main_in_memory import Application, ApplicationStatus, Candidate  # noqa: E402
+
+
+def fill(n_rows: int) -> None:
+    """Inserts `n_rows` rows without request validation, as a reseed would end up with."""
+    now = store.get_utc_now()
+    n_candidates = n_rows * 2 // 3
+    for candidate_id in range(1, n_candidates + 1):
+        store.insert_row("candidates", candidate_id, Candidate.model_construct(
+            candidate_id=candidate_id, first_name="Bench", last_name=str(candidate_id),
+            email=f"candidate{candidate_id}@example.com", phone=None, created_at=now, updated_at=now,
+        ))
+    for application_id in range(1, n_rows - n_candidates + 1):
+        store.insert_row("applications", application_id, Application.model_construct(
+            application_id=application_id, job_id=application_id % 500 + 1, candidate_id=application_id * 2 - 1,
+            status=ApplicationStatus.APPLIED, applied_at=now, updated_at=now,
+        ))
+    store.id_counters["candidates"] = n_candidates
+    store.id_counters["applications"] = n_rows - n_candidates
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Number of rows to snapshot.")
+    parser.add_argument("--path", help="Snapshot file to write; defaults to a temporary file.")
+    args = parser.parse_args()
+
+    store.SNAPSHOT_PATH = args.path or os.path.join(tempfile.mkdtemp(), "bench_snapshot.pickle")
+    fill(args.rows)
+
+    start = time.perf_counter()
+    store.take_snapshot()
+    print(f"Snapshot of {args.rows:,} rows: {os.path.getsize(store.SNAPSHOT_PATH) / 2**20:.1f} MiB "
+          f"in {time.perf_counter() - start:.2f} s")
+
+    for rows in store.db.values():
+        rows.clear()
+    store.rebuild_indexes()
+    start = time.perf_counter()
+    store.load_snapshot()
+    print(f"Restored {sum(map(len, store.db.values())):,} rows and rebuilt the indexes "
+          f"in {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark for the write-ahead log of the in-memory backend.
+
+The script creates candidates (20,000 by default) through the
+`create_candidate` endpoint function of `main_in_memory` from several
+threads, as the Uvicorn thread pool would, with the write-ahead log open in
+a temporary directory. Every call returns only once its record is fsynced.
+It prints the write throughput, the number of fsyncs and the average number
+of records each fsync made durable (the group commit batch size), then the
+time taken to replay the log into an empty store.
+
+Usage:
+    python benchmarks/bench_in_memory_wal.py [--writes N] [--threads N]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Make the application modules importable when run from the benchmarks folder.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import main_in_memory as store  # noqa: E402
+from main_in_memory import CandidateCreate, create_candidate  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--writes", type=int, default=20_000, help="Number of candidates to create.")
+    parser.add_argument("--threads", type=int, default=16, help="Number of concurrent writers.")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    store.SNAPSHOT_PATH = os.path.join(directory, "bench_snapshot.pickle")
+    store.WAL_PATH = os.path.join(directory, "bench.wal")
+    store.recover()
+
+    payloads = [
+        CandidateCreate(first_name="Bench", last_name=str(i), email=f"candidate{i}@example.com")
+        for i in range(args.writes)
+    ]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        list(pool.map(create_candidate, payloads))
+    elapsed = time.perf_counter() - start
+    fsyncs = store.wal.fsyncs
+    print(f"{args.writes:,} durable writes from {args.threads} threads in {elapsed:.2f} s "
+          f"({args.writes / elapsed:,.0f} writes/s)")
+    print(f"  {fsyncs:,} fsyncs, {args.writes / fsyncs:.1f} records per fsync")
+
+    store.wal.close()
+    store.wal = None
+    store.db["candidates"].clear()
+    store.rebuild_indexes()
+    start = time.perf_counter()
+    store.recover()
+    print(f"Replayed {len(store.db['candidates']):,} records in {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Benchmark for the foreign-key and status indexes declared on the ORM models in `main.py`.
+
+The script builds a throwaway SQLite database from the ORM metadata, loads it
+with synthetic data (1,000,000 applications by default), and then runs the
+per-parent lookups that back the API and the ON DELETE actions, and the
+status filter of GET /applications/, twice: once with the secondary indexes
+dropped and once with them in place. For each query it prints the
+`EXPLAIN QUERY PLAN` output and the mean latency.
+
+Usage:
+    python benchmarks/bench_indexes.py [--applications N] [--repeat N]
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+# Make the application modules importable when run from the benchmarks folder.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine  # noqa: E402
+
+from main import Base  # noqa: E402
+
+# Statuses of the synthetic applications, most common first; a status filter
+# is selective for the rare ones at the end.
+STATUSES = ["applied"] * 12 + ["rejected"] * 5 + ["screening", "interviewing", "hired"]
+
+# (label, SQL, table whose primary keys are used as the parameter, or the values to draw it from)
+QUERIES = [
+    ("applications by job", "SELECT * FROM applications WHERE job_id = ?", "jobs"),
+    ("applications by candidate", "SELECT * FROM applications WHERE candidate_id = ?", "candidates"),
+    ("jobs by creator", "SELECT * FROM jobs WHERE created_by_user_id = ?", "users"),
+    ("decision_logs by application", "SELECT * FROM decision_logs WHERE application_id = ?", "applications"),
+    ("documents by application", "SELECT * FROM documents WHERE application_id = ?", "applications"),
+    ("interviews by application", "SELECT * FROM interviews WHERE application_id = ?", "applications"),
+    ("feedback by application", "SELECT * FROM feedback WHERE application_id = ?", "applications"),
+    ("applications by status", "SELECT * FROM applications WHERE status = ?", ("hired", "interviewing")),
+]
+
+
+def populate(conn: sqlite3.Connection, n_applications: int) -> dict:
+    """Loads synthetic users, jobs, candidates, applications and decision logs."""
+    n_users = 50
+    n_jobs = 2_000
+    apps_per_candidate = 4
+    n_candidates = n_applications // apps_per_candidate
+
+    conn.executemany(
+        "INSERT INTO users (user_id, first_name, last_name, email, role) VALUES (?, ?, ?, ?, ?)",
+        ((i, "User", str(i), f"user{i}@example.com", "HR Manager") for i in range(1, n_users + 1)),
+    )
+    conn.executemany(
+        "INSERT INTO jobs (job_id, title, description, created_by_user_id) VALUES (?, ?, ?, ?)",
+        ((i, f"Job {i}", "Synthetic job.", (i % n_users) + 1) for i in range(1, n_jobs + 1)),
+    )
+    conn.executemany(
+        "INSERT INTO candidates (candidate_id, first_name, last_name, email) VALUES (?, ?, ?, ?)",
+        ((i, "Candidate", str(i), f"candidate{i}@example.com") for i in range(1, n_candidates + 1)),
+    )
+    # Each candidate applies to `apps_per_candidate` distinct jobs.
+    conn.executemany(
+        "INSERT INTO applications (application_id, job_id, candidate_id, status) VALUES (?, ?, ?, ?)",
+        (
+            (i + 1, ((i // apps_per_candidate) + (i % apps_per_candidate) * 7) % n_jobs + 1,
+             (i // apps_per_candidate) + 1, STATUSES[i % len(STATUSES)])
+            for i in range(n_candidates * apps_per_candidate)
+        ),
+    )
+    conn.executemany(
+        "INSERT INTO decision_logs (application_id, user_id, decision) VALUES (?, ?, 'move_to_next_stage')",
+        ((i, (i % n_users) + 1) for i in range(1, n_candidates * apps_per_candidate + 1)),
+    )
+    conn.commit()
+    return {
+        "users": n_users,
+        "jobs": n_jobs,
+        "candidates": n_candidates,
+        "applications": n_candidates * apps_per_candidate,
+    }
+
+
+def run_queries(conn: sqlite3.Connection, sizes: dict, repeat: int) -> None:
+    """Prints the query plan and mean latency of every benchmark query."""
+    rng = random.Random(42)
+    for label, sql, param_source in QUERIES:
+        if isinstance(param_source, str):
+            params = [rng.randint(1, sizes[param_source]) for _ in range(repeat)]
+        else:
+            params = [rng.choice(param_source) for _ in range(repeat)]
+        plan = "; ".join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", (params[0],)))
+        start = time.perf_counter()
+        for param in params:
+            conn.execute(sql, (param,)).fetchall()
+        elapsed_ms = (time.perf_counter() - start) * 1000 / repeat
+        print(f"  {label:<30} {elapsed_ms:10.3f} ms   {plan}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--applications", type=int, default=1_000_000, help="Number of applications to load.")
+    parser.add_argument("--repeat", type=int, default=20, help="Executions per query.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "bench_indexes.db")
+        engine = create_engine(f"sqlite:///{db_path}")
+        Base.metadata.create_all(bind=engine)
+        engine.dispose()
+
+        indexes = [index for table in Base.metadata.sorted_tables for index in table.indexes]
+        conn = sqlite3.connect(db_path)
+        for index in indexes:
+            conn.execute(f"DROP INDEX {index.name}")
+
+        print(f"Loading {args.applications:,} applications...")
+        start = time.perf_counter()
+        sizes = populate(conn, args.applications)
+        print(f"Loaded in {time.perf_counter() - start:.1f} s\n")
+
+        print("Without secondary indexes:")
+        run_queries(conn, sizes, args.repeat)
+
+        start = time.perf_counter()
+        for index in indexes:
+            columns = ", ".join(column.name for column in index.columns)
+            conn.execute(f"CREATE INDEX {index.name} ON {index.table.name} ({columns})")
+        conn.execute("ANALYZE")
+        print(f"\nCreated {len(indexes)} indexes in {time.perf_counter() - start:.1f} s\n")
+
+        print("With secondary indexes:")
+        run_queries(conn, sizes, args.repeat)
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark for the interval index behind the interview conflict checks and
+`GET /users/{id}/availability`.
+
+The script loads an `IntervalIndex` with a quarter of synthetic interviews
+(50,000 by default, one candidate and one to three interviewers each, on
+weekday business hours), then times conflict checks for random proposed
+bookings: one overlap query per candidate and interviewer, as done by
+`POST /interviews/`. It prints the load time and the p50/p95/max latency.
+
+Usage:
+    python benchmarks/bench_interview_conflicts.py [--interviews N] [--users N] [--repeat N]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+# Make the application modules importable when run from the benchmarks folder.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from interval_index import IntervalIndex  # noqa: E402
+
+QUARTER_START = datetime(2030, 1, 7)
+
+
+def random_slot(rng: random.Random):
+    """Returns a 30 to 90 minute slot on a weekday of the quarter, between 08:00 and 18:00."""
+    day = QUARTER_START + timedelta(days=rng.randrange(13 * 7))
+    while day.weekday() >= 5:
+        day += timedelta(days=1)
+    start = day + timedelta(hours=8, minutes=15 * rng.randrange(32))
+    return start, start + timedelta(minutes=rng.choice((30, 45, 60, 90)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--interviews", type=int, default=50_000, help="Number of interviews to index.")
+    parser.add_argument("--users", type=int, default=200, help="Number of interviewers.")
+    parser.add_argument("--repeat", type=int, default=10_000, help="Number of bookings to check.")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    items = []
+    for interview_id in range(1, args.interviews + 1):
+        start, end = random_slot(rng)
+        keys = [("candidate", rng.randrange(args.interviews // 2))]
+        keys += [("user", user_id) for user_id in rng.sample(range(args.users), rng.randint(1, 3))]
+        items.append((interview_id, keys, start, end))
+
+    index = IntervalIndex()
+    start = time.perf_counter()
+    index.load(items)
+    print(f"Indexed {args.interviews:,} interviews in {(time.perf_counter() - start) * 1000:.0f} ms\n")
+
+    latencies = []
+    conflicts = 0
+    for _ in range(args.repeat):
+        slot_start, slot_end = random_slot(rng)
+        keys = [("candidate", rng.randrange(args.interviews // 2))]
+        keys += [("user", user_id) for user_id in rng.sample(range(args.users), 3)]
+        start = time.perf_counter()
+        found = [entry for key in keys for entry in index.overlapping(key, slot_start, slot_end)]
+        latencies.append((time.perf_counter() - start) * 1_000_000)
+        conflicts += bool(found)
+
+    latencies.sort()
+    print(f"Checked {args.repeat:,} bookings, {conflicts:,} with a conflict")
+    print(f"  p50 {statistics.median(latencies):8.1f} us")
+    print(f"  p95 {latencies[int(len(latencies) * 0.95) - 1]:8.1f} us")
+    print(f"  max {latencies[-1]:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
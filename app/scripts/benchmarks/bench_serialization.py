@@ -0,0 +1,119 @@
+"""
+Micro-benchmark for the JSON serialization of the list endpoints in `main.py`.
+
+The script loads synthetic applications into an in-memory SQLite database and
+serializes one page of them (10,000 rows by default) along two paths:
+
+- ORM: ORM objects -> `from_attributes` Pydantic models -> `jsonable_encoder`
+  -> `json.dumps`, which is what a `response_model` list endpoint used to do.
+- Rows: column `select()` -> `Row` mappings -> `FastJSONResponse` (orjson when
+  installed), which is what `fast_paginate` does now.
+
+For each path it prints the mean time spent querying and serializing.
+
+Usage:
+    python benchmarks/bench_serialization.py [--rows N] [--repeat N]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from typing import List
+
+# Make the application modules importable when run from the benchmarks folder.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy import create_engine, insert, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from main import (  # noqa: E402
+    Application,
+    Base,
+    FastJSONResponse,
+    orjson,
+    schema_columns,
+    sqa_Application,
+    sqa_Candidate,
+    sqa_Job,
+    sqa_User,
+)
+
+
+def populate(session: Session, n_rows: int) -> None:
+    """Loads one user, 100 jobs and `n_rows` candidates with one application each."""
+    n_jobs = 100
+    session.execute(
+        insert(sqa_User),
+        [{"user_id": 1, "first_name": "Bench", "last_name": "User", "email": "bench@example.com", "role": "HR Manager"}],
+    )
+    session.execute(
+        insert(sqa_Job),
+        [{"job_id": i, "title": f"Job {i}", "description": "Synthetic job.", "created_by_user_id": 1}
+         for i in range(1, n_jobs + 1)],
+    )
+    session.execute(
+        insert(sqa_Candidate),
+        [{"candidate_id": i, "first_name": "Candidate", "last_name": str(i), "email": f"candidate{i}@example.com"}
+         for i in range(1, n_rows + 1)],
+    )
+    session.execute(
+        insert(sqa_Application),
+        [{"application_id": i, "job_id": i % n_jobs + 1, "candidate_id": i, "status": "applied"}
+         for i in range(1, n_rows + 1)],
+    )
+    session.commit()
+
+
+def orm_path(session: Session, adapter: TypeAdapter) -> bytes:
+    """ORM objects -> Pydantic models -> jsonable_encoder -> json.dumps."""
+    rows = session.query(sqa_Application).order_by(sqa_Application.application_id).all()
+    models = adapter.validate_python(rows, from_attributes=True)
+    body = json.dumps(jsonable_encoder(models)).encode()
+    session.expunge_all()
+    return body
+
+
+def row_path(session: Session) -> bytes:
+    """Column select() -> Row mappings -> FastJSONResponse."""
+    stmt = select(*schema_columns(sqa_Application, Application)).order_by(sqa_Application.application_id)
+    rows = session.execute(stmt).all()
+    return FastJSONResponse([row._asdict() for row in rows]).body
+
+
+def measure(label: str, func, repeat: int) -> float:
+    """Prints and returns the mean wall time of `func` in milliseconds."""
+    func()  # Warm up statement caches.
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed_ms = (time.perf_counter() - start) * 1000 / repeat
+    print(f"  {label:<45} {elapsed_ms:10.2f} ms")
+    return elapsed_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000, help="Number of applications to serialize.")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per path.")
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    adapter = TypeAdapter(List[Application])
+
+    with Session(engine) as session:
+        populate(session, args.rows)
+        encoder = "orjson" if orjson is not None else "json (orjson not installed)"
+        print(f"Serializing {args.rows:,} applications, encoder: {encoder}\n")
+        orm_ms = measure("ORM -> Pydantic -> jsonable_encoder -> json", lambda: orm_path(session, adapter), args.repeat)
+        row_ms = measure("Row mappings -> FastJSONResponse", lambda: row_path(session), args.repeat)
+        assert json.loads(orm_path(session, adapter)) == json.loads(row_path(session))
+
+    print(f"\nSpeed-up: {orm_ms / row_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark for the skills inverted index behind `GET /jobs/{job_id}/matches`.
+
+The script loads a `SkillIndex` with synthetic candidate skills (500,000
+candidates by default, each with a handful of skills drawn from a skewed
+popularity distribution), then times `match` for random jobs that require
+several skills. It prints the load time and the p50/p95/max match latency
+against the 50 ms budget.
+
+Usage:
+    python benchmarks/bench_skill_matches.py [--candidates N] [--skills N] [--job-skills N] [--repeat N]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+# Make the application modules importable when run from the benchmarks folder.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import skills_index  # noqa: E402
+from skills_index import SkillIndex  # noqa: E402
+
+BUDGET_MS = 50.0
+
+
+def synthetic_pairs(n_candidates: int, n_skills: int, rng: random.Random):
+    """Yields `(skill_id, candidate_id)` pairs; low skill IDs are the most popular."""
+    weights = [1 / rank for rank in range(1, n_skills + 1)]
+    skill_ids = list(range(1, n_skills + 1))
+    for candidate_id in range(1, n_candidates + 1):
+        for skill_id in set(rng.choices(skill_ids, weights, k=rng.randint(3, 8))):
+            yield skill_id, candidate_id
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--candidates", type=int, default=500_000, help="Number of candidates to index.")
+    parser.add_argument("--skills", type=int, default=300, help="Number of distinct skills.")
+    parser.add_argument("--job-skills", type=int, default=6, help="Skills required by each benchmark job.")
+    parser.add_argument("--repeat", type=int, default=50, help="Number of jobs to match.")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    index = SkillIndex()
+    start = time.perf_counter()
+    index.load(synthetic_pairs(args.candidates, args.skills, rng))
+    print(f"Indexed {args.candidates:,} candidates in {time.perf_counter() - start:.1f} s")
+    print(f"Merging with: {'numpy' if skills_index.np is not None else 'Counter (numpy not installed)'}\n")
+
+    # Bias jobs towards popular skills, the expensive case.
+    jobs = [rng.sample(range(1, min(args.skills, 30) + 1), args.job_skills) for _ in range(args.repeat)]
+    index.match(jobs[0], limit=20)  # Warm up.
+    latencies = []
+    for skill_ids in jobs:
+        start = time.perf_counter()
+        index.match(skill_ids, limit=20)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"  p50 {statistics.median(latencies):8.2f} ms")
+    print(f"  p95 {p95:8.2f} ms")
+    print(f"  max {latencies[-1]:8.2f} ms   (budget {BUDGET_MS:.0f} ms: {'OK' if p95 <= BUDGET_MS else 'OVER'})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+In-process read-through cache for the hot single-row GET endpoints.
+
+`TTLCache` is a bounded LRU map whose entries also expire after a fixed time
+to live. It keeps hit/miss/eviction counters so the API can expose how much
+read load it takes off the database. All operations are guarded by a lock, as
+FastAPI runs sync endpoints on a thread pool.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class TTLCache:
+    """
+    A thread-safe LRU cache with a per-entry time to live.
+
+    Args:
+        maxsize: Maximum number of entries; the least recently used entry is
+            evicted when a new one would exceed it.
+        ttl: Seconds an entry stays valid after it was stored. This bounds how
+            stale an entry can get if an invalidation is ever missed.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns the value stored under `key`, or None if it is missing or
+        expired. Counts the lookup as a hit or a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Stores `value` under `key`, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drops the entry stored under `key`, if any."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_namespace(self, namespace: str) -> None:
+        """Drops every entry whose key is a `(namespace, ...)` tuple."""
+        with self._lock:
+            for key in [key for key in self._entries if isinstance(key, tuple) and key[0] == namespace]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drops every entry. The counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns the counters and current size of the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+            }
@@ -0,0 +1,145 @@
+"""
+In-memory interval index for interview scheduling.
+
+`IntervalIndex` keeps, for every key (an interviewer or a candidate), the
+intervals booked for it sorted by start time. An overlap query binary
+searches that list: an interval overlapping `[start, end)` must start before
+`end` and no earlier than `start` minus the longest interval stored under the
+key, so only that slice is inspected however many interviews a key has.
+"""
+import threading
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+# (start, end, item_id); tuples sort by start first.
+Entry = Tuple[datetime, datetime, int]
+
+
+class IntervalIndex:
+    """
+    A thread-safe map from keys to sorted-by-start lists of half-open
+    `[start, end)` intervals, each belonging to an item (an interview).
+    """
+
+    def __init__(self):
+        self._entries: Dict[Hashable, List[Entry]] = {}
+        self._max_length: Dict[Hashable, timedelta] = {}
+        self._items: Dict[int, Tuple[Sequence[Hashable], datetime, datetime]] = {}
+        self._lock = threading.RLock()
+        self._pending: Optional[list] = None  # Changes committed while a load reads the database.
+        self.loaded = False
+
+    def start_load(self) -> None:
+        """
+        Starts queuing the changes passed to `apply` until `load` finishes.
+        Call it before reading the items to load, so an interview committed
+        while they are read is replayed over them instead of lost.
+        """
+        with self._lock:
+            self._pending = []
+
+    def load(self, items: Iterable[Tuple[int, Sequence[Hashable], datetime, datetime]]) -> None:
+        """Replaces the whole index with `(item_id, keys, start, end)` tuples, then replays the queued changes."""
+        with self._lock:
+            self._entries, self._max_length, self._items = {}, {}, {}
+            for item_id, keys, start, end in items:
+                self._add(item_id, keys, start, end)
+            for entries in self._entries.values():
+                entries.sort()
+            self.loaded = True
+            pending, self._pending = self._pending or (), None
+            self.apply(pending)
+
+    def apply(self, changes: Iterable[tuple]) -> None:
+        """
+        Applies committed `(method, *args)` changes: queued during a load,
+        dropped while the index is not loaded (the next load reads them).
+        """
+        with self._lock:
+            if self._pending is not None:
+                self._pending.extend(changes)
+            elif self.loaded:
+                for method, *args in changes:
+                    method(*args)
+
+    def clear(self) -> None:
+        """Empties the index, marks it as not loaded and abandons any load in progress."""
+        with self._lock:
+            self._entries, self._max_length, self._items = {}, {}, {}
+            self._pending = None
+            self.loaded = False
+
+    def add(self, item_id: int, keys: Sequence[Hashable], start: datetime, end: datetime) -> None:
+        """Stores an item's interval under each of `keys`, replacing any previous version of the item."""
+        with self._lock:
+            self._remove(item_id)
+            self._add(item_id, keys, start, end, keep_sorted=True)
+
+    def remove(self, item_id: int) -> None:
+        """Removes an item from every key it is stored under."""
+        with self._lock:
+            self._remove(item_id)
+
+    def remove_key(self, key: Hashable) -> None:
+        """Drops `key` from every item stored under it; the items stay under their other keys."""
+        with self._lock:
+            for _, _, item_id in self._entries.pop(key, ()):
+                keys, start, end = self._items[item_id]
+                self._items[item_id] = (tuple(k for k in keys if k != key), start, end)
+            self._max_length.pop(key, None)
+
+    def overlapping(
+        self, key: Hashable, start: datetime, end: datetime, exclude: Optional[int] = None
+    ) -> List[Entry]:
+        """Returns the entries of `key` overlapping `[start, end)`, ignoring item `exclude`."""
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                return []
+            lo = bisect_left(entries, (start - self._max_length[key],))
+            hi = bisect_left(entries, (end,))
+            return [entry for entry in entries[lo:hi] if entry[1] > start and entry[2] != exclude]
+
+    def _add(self, item_id, keys, start, end, keep_sorted: bool = False) -> None:
+        keys = tuple(dict.fromkeys(keys))
+        self._items[item_id] = (keys, start, end)
+        for key in keys:
+            entries = self._entries.setdefault(key, [])
+            if keep_sorted:
+                insort(entries, (start, end, item_id))
+            else:
+                entries.append((start, end, item_id))
+            # Only ever grows, so it stays a safe bound after removals.
+            self._max_length[key] = max(self._max_length.get(key, timedelta(0)), end - start)
+
+    def _remove(self, item_id) -> None:
+        stored = self._items.pop(item_id, None)
+        if stored is None:
+            return
+        keys, start, end = stored
+        for key in keys:
+            entries = self._entries[key]
+            i = bisect_left(entries, (start, end, item_id))
+            if i < len(entries) and entries[i] == (start, end, item_id):
+                del entries[i]
+
+
+def free_slots(
+    busy: Iterable[Tuple[datetime, datetime]], start: datetime, end: datetime, min_length: timedelta
+) -> List[Tuple[datetime, datetime]]:
+    """
+    Returns the gaps of at least `min_length` between the `busy` intervals
+    inside `[start, end)`. `busy` may overlap and need not be sorted.
+    """
+    slots = []
+    cursor = start
+    for busy_start, busy_end in sorted(busy):
+        if busy_start > cursor and min(busy_start, end) - cursor >= min_length:
+            slots.append((cursor, min(busy_start, end)))
+        cursor = max(cursor, busy_end)
+        if cursor >= end:
+            break
+    if end - cursor >= min_length:
+        slots.append((cursor, end))
+    return slots
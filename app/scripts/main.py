@@ -20,39 +20,83 @@ Key Features:
 """
 from __future__ import annotations
 
+import base64
+import csv
+import hashlib
+import io
+import json
+import threading
 import uvicorn
 from contextlib import asynccontextmanager
-from datetime import datetime
+from datetime import date, datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
 from enum import Enum
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional
 
-from fastapi import FastAPI, HTTPException, status, Depends
-from pydantic import BaseModel, Field, EmailStr, ConfigDict
+from fastapi import FastAPI, HTTPException, status, Body, Depends, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, EmailStr, ConfigDict, create_model, field_validator, model_validator
 from sqlalchemy import (
     create_engine,
     Column,
     ForeignKey,
+    Index,
     Integer,
     Table,
     Text,
     UniqueConstraint,
+    event,
+    func,
+    insert,
+    inspect as sa_inspect,
+    or_,
+    select,
     text,
+    tuple_,
+    update,
 )
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, sessionmaker, Session
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    Session,
+    mapped_column,
+    relationship,
+    selectinload,
+    sessionmaker,
+)
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from cache import TTLCache
+from database import SQLITE_PRAGMAS, apply_sqlite_pragmas
+from interval_index import IntervalIndex, free_slots
+from skills_index import SkillIndex
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; list endpoints fall back to the standard library encoder.
+    orjson = None
+
+try:
+    import analytics
+except ImportError:  # NumPy is optional; /analytics/time-to-hire answers 503 without it.
+    analytics = None
+
 # --- Database Setup ---
 
 # Define the database URL for a local SQLite database file.
 SQLALCHEMY_DATABASE_URL = "sqlite:///./recruitment_app.db"
 
-# Create the SQLAlchemy engine.
+# Create the SQLAlchemy engine and apply the SQLite performance pragmas
+# (WAL, synchronous=NORMAL, mmap, cache, ...) to each of its connections.
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
 )
+apply_sqlite_pragmas(engine, SQLITE_PRAGMAS)
 
 # Create a SessionLocal class. Each instance will be a database session.
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -70,7 +114,15 @@ candidate_skills_table = Table(
     "candidate_skills",
     Base.metadata,
     Column("candidate_id", ForeignKey("candidates.candidate_id", ondelete="CASCADE"), primary_key=True),
-    Column("skill_id", ForeignKey("skills.skill_id", ondelete="CASCADE"), primary_key=True),
+    Column("skill_id", ForeignKey("skills.skill_id", ondelete="CASCADE"), primary_key=True, index=True),
+)
+
+# Association table for the many-to-many relationship between jobs and the skills they require
+job_skills_table = Table(
+    "job_skills",
+    Base.metadata,
+    Column("job_id", ForeignKey("jobs.job_id", ondelete="CASCADE"), primary_key=True),
+    Column("skill_id", ForeignKey("skills.skill_id", ondelete="CASCADE"), primary_key=True, index=True),
 )
 
 # Association table for the many-to-many relationship between interviews and users (participants)
@@ -78,7 +130,7 @@ interview_participants_table = Table(
     "interview_participants",
     Base.metadata,
     Column("interview_id", ForeignKey("interviews.interview_id", ondelete="CASCADE"), primary_key=True),
-    Column("user_id", ForeignKey("users.user_id", ondelete="CASCADE"), primary_key=True),
+    Column("user_id", ForeignKey("users.user_id", ondelete="CASCADE"), primary_key=True, index=True),
 )
 
 
@@ -129,9 +181,11 @@ class sqa_Application(Base):
     __table_args__ = (UniqueConstraint("job_id", "candidate_id", name="uq_job_candidate"),)
 
     application_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    # job_id is the leading column of uq_job_candidate, which already serves lookups by job.
     job_id: Mapped[int] = mapped_column(ForeignKey("jobs.job_id", ondelete="CASCADE"))
-    candidate_id: Mapped[int] = mapped_column(ForeignKey("candidates.candidate_id", ondelete="CASCADE"))
-    status: Mapped[str] = mapped_column(Text, nullable=False, server_default="applied")
+    candidate_id: Mapped[int] = mapped_column(ForeignKey("candidates.candidate_id", ondelete="CASCADE"), index=True)
+    # Filtered on by GET /applications/ and PATCH /applications/status.
+    status: Mapped[str] = mapped_column(Text, nullable=False, server_default="applied", index=True)
     applied_at: Mapped[datetime] = mapped_column(server_default=text("CURRENT_TIMESTAMP"))
     updated_at: Mapped[datetime] = mapped_column(
         server_default=text("CURRENT_TIMESTAMP"), onupdate=datetime.utcnow
@@ -158,7 +212,7 @@ class sqa_Job(Base):
     job_id: Mapped[int] = mapped_column(Integer, primary_key=True)
     title: Mapped[str] = mapped_column(Text)
     description: Mapped[str] = mapped_column(Text)
-    created_by_user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id", ondelete="RESTRICT"))
+    created_by_user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id", ondelete="RESTRICT"), index=True)
     created_at: Mapped[datetime] = mapped_column(server_default=text("CURRENT_TIMESTAMP"))
     updated_at: Mapped[datetime] = mapped_column(
         server_default=text("CURRENT_TIMESTAMP"), onupdate=datetime.utcnow
@@ -169,6 +223,9 @@ class sqa_Job(Base):
     applications: Mapped[list["sqa_Application"]] = relationship(
         "sqa_Application", back_populates="job", cascade="all, delete-orphan"
     )
+    skills: Mapped[list["sqa_Skill"]] = relationship(
+        "sqa_Skill", secondary=job_skills_table, back_populates="jobs"
+    )
 
 
 class sqa_Skill(Base):
@@ -179,13 +236,16 @@ class sqa_Skill(Base):
     candidates: Mapped[list["sqa_Candidate"]] = relationship(
         "sqa_Candidate", secondary=candidate_skills_table, back_populates="skills"
     )
+    jobs: Mapped[list["sqa_Job"]] = relationship(
+        "sqa_Job", secondary=job_skills_table, back_populates="skills"
+    )
 
 
 class sqa_Document(Base):
     """ORM model for the 'documents' table."""
     __tablename__ = "documents"
     document_id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    application_id: Mapped[int] = mapped_column(ForeignKey("applications.application_id", ondelete="CASCADE"))
+    application_id: Mapped[int] = mapped_column(ForeignKey("applications.application_id", ondelete="CASCADE"), index=True)
     type: Mapped[str] = mapped_column(Text)
     file_path: Mapped[str] = mapped_column(Text, unique=True)
     uploaded_at: Mapped[datetime] = mapped_column(server_default=text("CURRENT_TIMESTAMP"))
@@ -195,8 +255,9 @@ class sqa_Document(Base):
 class sqa_Interview(Base):
     """ORM model for the 'interviews' table."""
     __tablename__ = "interviews"
+    __table_args__ = (Index("ix_interviews_start_time_end_time", "start_time", "end_time"),)
     interview_id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    application_id: Mapped[int] = mapped_column(ForeignKey("applications.application_id", ondelete="CASCADE"))
+    application_id: Mapped[int] = mapped_column(ForeignKey("applications.application_id", ondelete="CASCADE"), index=True)
     interview_stage: Mapped[str] = mapped_column(Text)
     start_time: Mapped[datetime] = mapped_column()
     end_time: Mapped[datetime] = mapped_column()
@@ -205,6 +266,7 @@ class sqa_Interview(Base):
         server_default=text("CURRENT_TIMESTAMP"), onupdate=datetime.utcnow
     )
     application: Mapped["sqa_Application"] = relationship("sqa_Application", back_populates="interviews")
+    participants: Mapped[list["sqa_User"]] = relationship("sqa_User", secondary=interview_participants_table)
     feedback: Mapped[list["sqa_Feedback"]] = relationship("sqa_Feedback", back_populates="interview")
 
 
@@ -212,9 +274,9 @@ class sqa_Feedback(Base):
     """ORM model for the 'feedback' table."""
     __tablename__ = "feedback"
     feedback_id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    application_id: Mapped[int] = mapped_column(ForeignKey("applications.application_id", ondelete="CASCADE"))
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id", ondelete="RESTRICT"))
-    interview_id: Mapped[int | None] = mapped_column(ForeignKey("interviews.interview_id", ondelete="SET NULL"))
+    application_id: Mapped[int] = mapped_column(ForeignKey("applications.application_id", ondelete="CASCADE"), index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id", ondelete="RESTRICT"), index=True)
+    interview_id: Mapped[int | None] = mapped_column(ForeignKey("interviews.interview_id", ondelete="SET NULL"), index=True)
     content: Mapped[str] = mapped_column(Text)
     created_at: Mapped[datetime] = mapped_column(server_default=text("CURRENT_TIMESTAMP"))
     application: Mapped["sqa_Application"] = relationship("sqa_Application", back_populates="feedback")
@@ -226,8 +288,8 @@ class sqa_DecisionLog(Base):
     """ORM model for the 'decision_logs' table."""
     __tablename__ = "decision_logs"
     decision_log_id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    application_id: Mapped[int] = mapped_column(ForeignKey("applications.application_id", ondelete="CASCADE"))
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id", ondelete="RESTRICT"))
+    application_id: Mapped[int] = mapped_column(ForeignKey("applications.application_id", ondelete="CASCADE"), index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id", ondelete="RESTRICT"), index=True)
     decision: Mapped[str] = mapped_column(Text)
     reason: Mapped[str | None] = mapped_column(Text)
     created_at: Mapped[datetime] = mapped_column(server_default=text("CURRENT_TIMESTAMP"))
@@ -235,6 +297,165 @@ class sqa_DecisionLog(Base):
     user: Mapped["sqa_User"] = relationship("sqa_User", back_populates="decision_logs")
 
 
+# --- Full-Text Search Tables ---
+
+# FTS5 index name -> (content table, primary key, indexed columns). Each index is
+# an external-content FTS5 table: it stores only the inverted index and reads
+# the text back from the content table, so the data is not duplicated.
+SEARCH_INDEXES = {
+    "jobs_fts": ("jobs", "job_id", ("title", "description")),
+    "candidates_fts": ("candidates", "candidate_id", ("first_name", "last_name", "email")),
+}
+
+
+def search_index_ddl(fts_table: str) -> List[str]:
+    """Returns the statements creating an FTS5 index and the triggers keeping it in sync."""
+    table, pk, columns = SEARCH_INDEXES[fts_table]
+    cols = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    delete_old = (
+        f"INSERT INTO {fts_table}({fts_table}, rowid, {cols}) VALUES ('delete', old.{pk}, {old_values});"
+    )
+    insert_new = f"INSERT INTO {fts_table}(rowid, {cols}) VALUES (new.{pk}, {new_values});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5("
+        f"{cols}, content='{table}', content_rowid='{pk}', tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ai AFTER INSERT ON {table} BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ad AFTER DELETE ON {table} BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_au AFTER UPDATE OF {cols} ON {table} "
+        f"BEGIN {delete_old} {insert_new} END",
+    ]
+
+
+@event.listens_for(Base.metadata, "after_create")
+def create_search_indexes(target, connection, **kw) -> None:
+    """
+    Creates the FTS5 indexes and their triggers alongside the ORM tables,
+    and fills an index from its content table the first time it is created.
+    """
+    for fts_table in SEARCH_INDEXES:
+        exists = connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": fts_table}
+        ).first()
+        for statement in search_index_ddl(fts_table):
+            connection.exec_driver_sql(statement)
+        if not exists:
+            connection.exec_driver_sql(f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')")
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def drop_search_indexes(target, connection, **kw) -> None:
+    """Drops the FTS5 indexes; their triggers go away with the content tables."""
+    for fts_table in SEARCH_INDEXES:
+        connection.exec_driver_sql(f"DROP TABLE IF EXISTS {fts_table}")
+
+
+# --- Funnel Summary Tables ---
+
+# Application counts per (job, status) and per status, plus a histogram of how
+# long applications stayed in a status before moving on. SQLite triggers on
+# `applications` keep them current for every write path (ORM, bulk UPDATE,
+# raw SQL), so funnel reads touch one row per status instead of every
+# application. No foreign key on job_id: rows are removed by the triggers as
+# the job's applications are deleted.
+job_status_counts_table = Table(
+    "job_status_counts",
+    Base.metadata,
+    Column("job_id", Integer, primary_key=True),
+    Column("status", Text, primary_key=True),
+    Column("count", Integer, nullable=False),
+)
+
+application_status_totals_table = Table(
+    "application_status_totals",
+    Base.metadata,
+    Column("status", Text, primary_key=True),
+    Column("count", Integer, nullable=False),
+)
+
+stage_duration_histogram_table = Table(
+    "stage_duration_histogram",
+    Base.metadata,
+    Column("status", Text, primary_key=True),
+    Column("bucket", Integer, primary_key=True),
+    Column("count", Integer, nullable=False),
+)
+
+# Upper bounds, in seconds, of the stage duration histogram buckets. Bucket i
+# counts durations below STAGE_DURATION_BUCKETS[i] (and at least the previous
+# bound); the last bucket, len(STAGE_DURATION_BUCKETS), is open-ended.
+STAGE_DURATION_BUCKETS = [
+    3600, 4 * 3600, 12 * 3600,
+    86400, 2 * 86400, 4 * 86400, 7 * 86400, 14 * 86400,
+    30 * 86400, 60 * 86400, 90 * 86400,
+]
+
+
+def stage_duration_bucket_sql(seconds: str) -> str:
+    """Returns a SQL CASE expression mapping a duration in seconds to its histogram bucket."""
+    whens = " ".join(f"WHEN {seconds} < {bound} THEN {i}" for i, bound in enumerate(STAGE_DURATION_BUCKETS))
+    return f"CASE {whens} ELSE {len(STAGE_DURATION_BUCKETS)} END"
+
+
+def funnel_trigger_ddl() -> List[str]:
+    """Returns the statements creating the triggers that maintain the funnel summary tables."""
+    def increment(job_id: str, app_status: str) -> str:
+        return (
+            f"INSERT INTO job_status_counts(job_id, status, count) VALUES ({job_id}, {app_status}, 1) "
+            f"ON CONFLICT(job_id, status) DO UPDATE SET count = count + 1; "
+            f"INSERT INTO application_status_totals(status, count) VALUES ({app_status}, 1) "
+            f"ON CONFLICT(status) DO UPDATE SET count = count + 1;"
+        )
+
+    def decrement(job_id: str, app_status: str) -> str:
+        return (
+            f"UPDATE job_status_counts SET count = count - 1 WHERE job_id = {job_id} AND status = {app_status}; "
+            f"DELETE FROM job_status_counts WHERE job_id = {job_id} AND status = {app_status} AND count <= 0; "
+            f"UPDATE application_status_totals SET count = count - 1 WHERE status = {app_status};"
+        )
+
+    # Time spent in the old status: from its last update until now (both UTC).
+    seconds = "((julianday('now') - julianday(old.updated_at)) * 86400)"
+    record_duration = (
+        f"INSERT INTO stage_duration_histogram(status, bucket, count) "
+        f"SELECT old.status, {stage_duration_bucket_sql(seconds)}, 1 WHERE old.status IS NOT new.status "
+        f"ON CONFLICT(status, bucket) DO UPDATE SET count = count + 1;"
+    )
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS applications_funnel_ai AFTER INSERT ON applications "
+        f"BEGIN {increment('new.job_id', 'new.status')} END",
+        f"CREATE TRIGGER IF NOT EXISTS applications_funnel_ad AFTER DELETE ON applications "
+        f"BEGIN {decrement('old.job_id', 'old.status')} END",
+        f"CREATE TRIGGER IF NOT EXISTS applications_funnel_au AFTER UPDATE OF status, job_id ON applications "
+        f"WHEN old.status IS NOT new.status OR old.job_id IS NOT new.job_id "
+        f"BEGIN {decrement('old.job_id', 'old.status')} {increment('new.job_id', 'new.status')} "
+        f"{record_duration} END",
+    ]
+
+
+@event.listens_for(Base.metadata, "after_create")
+def create_funnel_triggers(target, connection, tables=(), **kw) -> None:
+    """
+    Creates the triggers maintaining the funnel summary tables and, when the
+    count tables were just created next to existing applications, fills them
+    from a one-off `GROUP BY`. Past stage durations cannot be recovered, so
+    the histogram starts empty.
+    """
+    for statement in funnel_trigger_ddl():
+        connection.exec_driver_sql(statement)
+    if job_status_counts_table in tables:
+        connection.exec_driver_sql(
+            "INSERT INTO job_status_counts(job_id, status, count) "
+            "SELECT job_id, status, count(*) FROM applications GROUP BY job_id, status"
+        )
+    if application_status_totals_table in tables:
+        connection.exec_driver_sql(
+            "INSERT INTO application_status_totals(status, count) "
+            "SELECT status, count(*) FROM applications GROUP BY status"
+        )
+
+
 # --- FastAPI Dependency for Database Session ---
 
 def get_db():
@@ -255,6 +476,10 @@ async def lifespan(app: FastAPI):
     """Handle startup and shutdown events."""
     # Startup: Create all database tables
     Base.metadata.create_all(bind=engine)
+    # Add indexes declared after an existing database's tables were created.
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
     yield
     # Shutdown: Add any cleanup code here if needed
 
@@ -284,6 +509,7 @@ app.add_middleware(
     allow_credentials=True,      # Allow cookies
     allow_methods=["*"],         # Allow all methods (GET, POST, PUT, DELETE, etc.)
     allow_headers=["*"],         # Allow all headers
+    expose_headers=["X-Next-Cursor", "ETag", "Last-Modified"],  # Let the frontend read cursors and validators
 )
 
 
@@ -316,6 +542,11 @@ class Decision(str, Enum):
     ON_HOLD = 'on_hold'
 
 
+class ExportFormat(str, Enum):
+    NDJSON = 'ndjson'
+    CSV = 'csv'
+
+
 # --- Pydantic Models (Schemas) ---
 
 # User Schemas
@@ -419,69 +650,970 @@ class Application(ApplicationBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class ApplicationWithCandidate(Application):
+    candidate: Candidate
+
+
+class JobWithApplicants(Job):
+    applications: List[ApplicationWithCandidate]
+
+
+# Skill Schemas
+class SkillBase(BaseModel):
+    name: str = Field(..., min_length=1, description="Unique name of the skill.")
+
+
+class SkillCreate(SkillBase):
+    pass
+
+
+class Skill(SkillBase):
+    skill_id: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SkillAssignment(BaseModel):
+    skill_ids: List[int] = Field(..., description="The complete set of skills; replaces the current one.")
+
+
+class CandidateMatch(BaseModel):
+    candidate: Candidate
+    matched_skill_ids: List[int] = Field(..., description="Required skills of the job the candidate has.")
+    overlap: int = Field(..., description="Number of required skills the candidate has.")
+    score: float = Field(..., description="Share of the job's required skills the candidate has, from 0 to 1.")
+
+
+# Bulk Operation Schemas
+class BulkCreateResult(BaseModel):
+    index: int = Field(..., description="Position of the row in the request body.")
+    status_code: int = Field(..., description="201 if the row was created, otherwise why it was skipped.")
+    id: Optional[int] = Field(None, description="Primary key of the created row.")
+    detail: Optional[str] = None
+
+
+class ApplicationStatusBulkUpdate(BaseModel):
+    status: ApplicationStatus = Field(..., description="Status to move the selected applications to.")
+    application_ids: Optional[List[int]] = Field(
+        None, max_length=10_000, description="Applications to update. Combined with the filters below."
+    )
+    job_id: Optional[int] = Field(None, description="Only update applications for this job.")
+    current_status: Optional[ApplicationStatus] = Field(
+        None, description="Only update applications currently in this status."
+    )
+    decision: Optional[Decision] = Field(
+        None, description="If set, a decision log entry is written for every updated application."
+    )
+    decided_by_user_id: Optional[int] = Field(None, description="User recorded on the decision log entries.")
+    reason: Optional[str] = None
+
+    @model_validator(mode="after")
+    def check_selection_and_decision(self):
+        """Refuses to update every application and requires a user for decision logs."""
+        if self.application_ids is None and self.job_id is None and self.current_status is None:
+            raise ValueError("Provide application_ids or at least one of job_id / current_status.")
+        if self.decision is not None and self.decided_by_user_id is None:
+            raise ValueError("decided_by_user_id is required when a decision is given.")
+        return self
+
+
+class ApplicationStatusBulkResult(BaseModel):
+    status: ApplicationStatus
+    updated: int = Field(..., description="Number of applications whose status was set.")
+    application_ids: List[int]
+
+
+# Interview Schemas
+def to_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Converts an offset-aware datetime to naive UTC, the form interview times are stored in."""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class InterviewBase(BaseModel):
+    application_id: int
+    interview_stage: str = Field(..., min_length=1, description="E.g. 'Phone screen' or 'On-site'.")
+    start_time: datetime = Field(..., description="Start of the interview. Times with an offset are stored as UTC.")
+    end_time: datetime = Field(..., description="End of the interview, exclusive.")
+
+    @field_validator("start_time", "end_time")
+    @classmethod
+    def normalize_time(cls, value: datetime) -> datetime:
+        return to_naive_utc(value)
+
+
+class InterviewCreate(InterviewBase):
+    participant_user_ids: List[int] = Field(
+        default_factory=list,
+        description="Interviewers. None of them, nor the candidate, may be booked at the same time.",
+    )
+
+    @model_validator(mode="after")
+    def check_times(self):
+        if self.end_time <= self.start_time:
+            raise ValueError("end_time must be after start_time.")
+        return self
+
+
+class InterviewUpdate(BaseModel):
+    interview_stage: Optional[str] = Field(None, min_length=1)
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    participant_user_ids: Optional[List[int]] = Field(None, description="The complete set of interviewers.")
+
+    @field_validator("start_time", "end_time")
+    @classmethod
+    def normalize_time(cls, value: Optional[datetime]) -> Optional[datetime]:
+        return to_naive_utc(value)
+
+
+class Interview(InterviewBase):
+    interview_id: int
+    participant_user_ids: List[int]
+    created_at: datetime
+    updated_at: datetime
+
+
+class TimeSlot(BaseModel):
+    start: datetime
+    end: datetime
+
+
+class BookedSlot(TimeSlot):
+    interview_id: int
+
+
+class UserAvailability(BaseModel):
+    user_id: int
+    start: datetime
+    end: datetime
+    busy: List[BookedSlot] = Field(..., description="Interviews of the user overlapping the window.")
+    free: List[TimeSlot] = Field(..., description="Gaps of at least `min_minutes` between them, inside the window.")
+
+
+# Dashboard Schemas
+class JobSummary(Job):
+    applicant_count: int = Field(..., description="Total number of applications for the job.")
+    status_counts: Dict[ApplicationStatus, int] = Field(
+        ..., description="Number of applications for the job in each status."
+    )
+
+
+# Analytics Schemas
+class DurationDistribution(BaseModel):
+    count: int
+    mean_days: Optional[float] = None
+    p25_days: Optional[float] = None
+    p50_days: Optional[float] = None
+    p75_days: Optional[float] = None
+    p90_days: Optional[float] = None
+
+
+class StageMedian(BaseModel):
+    stage: str = Field(..., description="'applied' or the decision that opened the stage.")
+    transitions: int = Field(..., description="Number of completed stages measured.")
+    median_days: float
+
+
+class WeeklyCohort(BaseModel):
+    week_start: date = Field(..., description="Monday of the week the applications were submitted in.")
+    applications: int
+    hires: int
+    hire_rate: float
+    median_time_to_hire_days: Optional[float] = None
+
+
+class TimeToHireReport(BaseModel):
+    time_to_hire: DurationDistribution
+    stage_medians: List[StageMedian]
+    weekly_cohorts: List[WeeklyCohort]
+
+
+class StageDuration(BaseModel):
+    status: ApplicationStatus
+    transitions: int = Field(..., description="Number of times an application left this status.")
+    p50_hours: Optional[float] = Field(
+        None,
+        description="Upper bound of the histogram bucket holding the median time spent in the status "
+        "(buckets end at 1, 4 and 12 hours, then 1, 2, 4, 7, 14, 30, 60 and 90 days).",
+    )
+    p90_hours: Optional[float] = Field(
+        None, description="Upper bound of the histogram bucket holding the 90th percentile, as for p50_hours."
+    )
+
+
+class FunnelReport(BaseModel):
+    job_id: Optional[int] = Field(None, description="Job the counts are for; null for all jobs.")
+    total: int = Field(..., description="Total number of applications.")
+    status_counts: Dict[ApplicationStatus, int]
+    stage_durations: List[StageDuration] = Field(
+        ..., description="Time-in-stage percentiles across all jobs, bounded by a histogram's buckets."
+    )
+
+
+class SearchHit(BaseModel):
+    id: int
+    rank: float = Field(..., description="BM25 score; lower is more relevant.")
+    snippet: str = Field(..., description="Best matching fragment, with matched terms wrapped in <mark> tags.")
+
+
+class JobSearchHit(SearchHit):
+    title: str
+
+
+class CandidateSearchHit(SearchHit):
+    first_name: str
+    last_name: str
+    email: str
+
+
+class SearchResults(BaseModel):
+    jobs: List[JobSearchHit]
+    candidates: List[CandidateSearchHit]
+
+
+class CacheMetrics(BaseModel):
+    hits: int = Field(..., description="Lookups answered from the cache.")
+    misses: int = Field(..., description="Lookups that fell through to the database.")
+    hit_ratio: float
+    evictions: int = Field(..., description="Entries dropped because the cache was full.")
+    size: int
+    maxsize: int
+    ttl_seconds: float
+
+
+# --- Pagination Helpers ---
+
+# Response header carrying the opaque cursor for the next page of a list endpoint.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Largest page a list endpoint returns; `limit` is validated against it.
+MAX_PAGE_SIZE = 1000
+
+
+def encode_cursor(last_id: int) -> str:
+    """Encodes the primary key of the last row on a page as an opaque cursor."""
+    return base64.urlsafe_b64encode(json.dumps({"after": last_id}).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    """
+    Decodes a cursor produced by `encode_cursor` back into a primary key.
+
+    Raises:
+        HTTPException: 400 Bad Request if the cursor is malformed.
+    """
+    try:
+        return int(json.loads(base64.urlsafe_b64decode(cursor.encode()))["after"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid pagination cursor.")
+
+
+def apply_keyset_pagination(query, pk_column, skip: int, limit: int, cursor: Optional[str]):
+    """
+    Orders an ORM query or `select()` statement by `pk_column` and restricts
+    it to one page.
+
+    When a `cursor` is given the page starts right after the primary key it
+    encodes, so SQLite seeks straight to it through the primary key index no
+    matter how deep the page is. Without a cursor the legacy `skip` offset is
+    honoured. One extra row is requested so `trim_page` can tell whether
+    another page exists.
+    """
+    query = query.order_by(pk_column)
+    if cursor is not None:
+        query = query.filter(pk_column > decode_cursor(cursor))
+    elif skip:
+        query = query.offset(skip)
+    return query.limit(limit + 1)
+
+
+def trim_page(rows: list, pk_column, response: Response, limit: int) -> list:
+    """
+    Drops the look-ahead row fetched by `apply_keyset_pagination` and, if it
+    was present, returns the cursor for the next page in the `X-Next-Cursor`
+    response header.
+    """
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(getattr(rows[-1], pk_column.key))
+    return rows
+
+
+def paginate(query, pk_column, response: Response, skip: int, limit: int, cursor: Optional[str]) -> list:
+    """Runs an ORM query with keyset pagination on `pk_column`."""
+    rows = apply_keyset_pagination(query, pk_column, skip, limit, cursor).all()
+    return trim_page(rows, pk_column, response, limit)
+
+
+# --- Fast JSON Responses ---
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response for content that is already made of plain dicts and lists.
+
+    Rendered with orjson when it is installed, which encodes the datetimes in
+    database rows natively; otherwise the content goes through
+    `jsonable_encoder` and the standard library encoder.
+    """
+
+    def render(self, content) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content)
+        return super().render(jsonable_encoder(content))
+
+
+def schema_columns(model, schema: type[BaseModel], field_names: Optional[tuple] = None) -> list:
+    """
+    Returns the ORM columns of `model` that back the fields of `schema`, in
+    field order, or only those in `field_names` when a selection is given.
+    """
+    return [getattr(model, name) for name in (field_names or schema.model_fields)]
+
+
+def fast_paginate(
+    db: Session, stmt, pk_column, response: Response, skip: int, limit: int, cursor: Optional[str]
+) -> FastJSONResponse:
+    """
+    Runs a column `select()` with keyset pagination and serializes the `Row`
+    mappings straight to JSON.
+
+    This skips building an ORM object and a Pydantic model per row, which on
+    large pages costs more CPU than the query itself. The statement must
+    select the fields of the endpoint's response model, or a `fields=`
+    selection of them (see `schema_columns`), since the rows are no longer
+    validated against it.
+    """
+    rows = db.execute(apply_keyset_pagination(stmt, pk_column, skip, limit, cursor)).all()
+    rows = trim_page(rows, pk_column, response, limit)
+    return with_headers(FastJSONResponse([row._asdict() for row in rows]), response)
+
+
+def with_headers(result: Response, response: Response) -> Response:
+    """
+    Copies the headers set on the injected `response` (pagination cursor,
+    caching validators) onto a Response an endpoint returns directly, which
+    FastAPI would otherwise send without them.
+    """
+    result.headers.update(response.headers)
+    return result
+
+
+# --- Sparse Fieldsets ---
+
+def parse_fields(schema: type[BaseModel], pk_column, fields: Optional[str]) -> Optional[tuple]:
+    """
+    Parses a comma-separated `fields=` query parameter into the names of the
+    `schema` fields to return, in schema order.
+
+    The primary key is always included so rows stay addressable and keyset
+    pagination keeps working.
+
+    Returns:
+        The selected field names, or None when `fields` was not given.
+
+    Raises:
+        HTTPException: 400 Bad Request if a field is not part of `schema`.
+    """
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = sorted(requested - set(schema.model_fields))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(schema.model_fields)}",
+        )
+    requested.add(pk_column.key)
+    return tuple(name for name in schema.model_fields if name in requested)
+
+
+@lru_cache(maxsize=256)
+def sparse_schema(schema: type[BaseModel], field_names: tuple) -> type[BaseModel]:
+    """Builds, once per selection, a response model with only `field_names` of `schema`."""
+    return create_model(
+        f"{schema.__name__}Fields",
+        **{name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in field_names},
+    )
+
+
+def get_sparse(
+    db: Session, model, schema: type[BaseModel], pk_column, pk_value: int, field_names: tuple
+) -> Optional[Response]:
+    """
+    Loads only the `field_names` columns of one row and serializes them
+    through the matching `sparse_schema` model.
+
+    Returns:
+        The JSON response, or None if no row has that primary key.
+    """
+    row = db.execute(select(*schema_columns(model, schema, field_names)).where(pk_column == pk_value)).first()
+    if row is None:
+        return None
+    return sparse_response(schema, field_names, row._asdict())
+
+
+def sparse_response(schema: type[BaseModel], field_names: tuple, values: dict) -> Response:
+    """Serializes `values` through the `sparse_schema` model for `field_names`."""
+    partial = sparse_schema(schema, field_names).model_validate(values)
+    return Response(partial.model_dump_json(), media_type="application/json")
+
+
+# --- HTTP Caching ---
+
+def freshness_select(model, pk_column):
+    """
+    Selects the row count, latest `updated_at` and highest primary key of
+    `model`, which together change whenever a row is inserted, updated or
+    deleted. Narrow it with the same filters as the endpoint's query.
+    """
+    return select(func.count(), func.max(model.updated_at), func.max(pk_column))
+
+
+def etag_matches(if_none_match: str, etag: str, exists: bool) -> bool:
+    """
+    Weakly compares an `If-None-Match` header against `etag`. `*` matches
+    any current representation, so never a missing row.
+    """
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates or ("*" in candidates and exists)
+
+
+def not_modified(
+    request: Request, response: Response, freshness: tuple, collection: bool = False
+) -> Optional[Response]:
+    """
+    Sets `ETag` and `Last-Modified` on `response` from the `(count,
+    max(updated_at), max(pk))` values of a `freshness_select` row, and checks
+    the request's conditional headers against them.
+
+    The ETag hashes the freshness values together with the request path and
+    query string, since pagination and `fields=` change the body too. As in
+    RFC 9110, `If-Modified-Since` is only consulted without `If-None-Match`.
+
+    For a `collection`, deleting a row changes the body without advancing
+    `max(updated_at)`, so neither `Last-Modified` is sent nor
+    `If-Modified-Since` honoured there; only the ETag, which covers the row
+    count, validates a list.
+
+    Returns:
+        An empty 304 Not Modified response if the client's copy is current,
+        otherwise None and the endpoint should build the body as usual.
+    """
+    count, last_updated, max_id = freshness
+    digest = hashlib.sha1(f"{request.url.path}?{request.url.query}:{count}:{last_updated}:{max_id}".encode())
+    response.headers["ETag"] = f'W/"{digest.hexdigest()}"'
+    response.headers["Cache-Control"] = "no-cache"
+    if collection:
+        last_updated = None
+    if last_updated is not None:
+        response.headers["Last-Modified"] = format_datetime(last_updated.replace(tzinfo=timezone.utc), usegmt=True)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        fresh = etag_matches(if_none_match, response.headers["ETag"], exists=count > 0)
+    elif "if-modified-since" in request.headers and last_updated is not None:
+        try:
+            since = parsedate_to_datetime(request.headers["if-modified-since"])
+        except (TypeError, ValueError):
+            return None
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # HTTP dates have one-second resolution.
+        fresh = last_updated.replace(tzinfo=timezone.utc, microsecond=0) <= since
+    else:
+        fresh = False
+    if not fresh:
+        return None
+    return with_headers(Response(status_code=status.HTTP_304_NOT_MODIFIED), response)
+
+
+# --- Read-Through Cache ---
+
+# Single-row GETs of rarely changing rows are answered from memory. Entries are
+# response models, so they can be shared safely across sessions and threads.
+ENTITY_CACHE = TTLCache(maxsize=4096, ttl=60.0)
+
+# ORM model -> response model stored in `ENTITY_CACHE` for it.
+CACHED_MODELS = {sqa_User: User, sqa_Candidate: Candidate, sqa_Job: Job}
+
+
+def get_cached(db: Session, model, pk_value: int) -> Optional[BaseModel]:
+    """
+    Looks a row up in `ENTITY_CACHE`, loading it with `db.get` and storing
+    its response model on a miss.
+
+    Returns:
+        The response model, or None if no row has that primary key.
+    """
+    key = (model.__tablename__, pk_value)
+    cached = ENTITY_CACHE.get(key)
+    if cached is None:
+        db_obj = db.get(model, pk_value)
+        if db_obj is None:
+            return None
+        cached = CACHED_MODELS[model].model_validate(db_obj)
+        ENTITY_CACHE.set(key, cached)
+    return cached
+
+
+@event.listens_for(Session, "after_flush")
+def collect_flushed_cache_keys(session: Session, flush_context) -> None:
+    """Remembers the cached rows a flush wrote, to drop them once the transaction commits."""
+    keys = session.info.setdefault("cache_invalidations", set())
+    for obj in (*session.dirty, *session.deleted):
+        if type(obj) in CACHED_MODELS:
+            keys.add((obj.__tablename__, *sa_inspect(obj).mapper.primary_key_from_instance(obj)))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def collect_statement_cache_keys(orm_execute_state) -> None:
+    """
+    Remembers the cached rows hit by an ORM `update()` or `delete()`
+    statement, which bypasses the flush. A statement names the rows it
+    writes with a `cache_keys` execution option of `ENTITY_CACHE` keys; for
+    an untagged one they are not known here, so every entry of the table is
+    dropped on commit.
+    """
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ in CACHED_MODELS:
+        keys = orm_execute_state.session.info.setdefault("cache_invalidations", set())
+        tagged = orm_execute_state.execution_options.get("cache_keys")
+        if tagged is not None:
+            keys.update(tagged)
+        else:
+            keys.add(mapper.class_.__tablename__)
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_committed_cache_keys(session: Session) -> None:
+    """Drops the entries collected for the committed transaction from `ENTITY_CACHE`."""
+    for key in session.info.pop("cache_invalidations", ()):
+        if isinstance(key, str):
+            ENTITY_CACHE.invalidate_namespace(key)
+        else:
+            ENTITY_CACHE.invalidate(key)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_cache_keys(session: Session) -> None:
+    """Forgets the entries collected for a rolled back transaction; nothing changed."""
+    session.info.pop("cache_invalidations", None)
+
+
+# --- Skills Index ---
+
+# Inverted index skill_id -> sorted candidate IDs behind GET /jobs/{job_id}/matches.
+# It is loaded from candidate_skills on first use and then kept current by the
+# session hooks below, which replay committed skill changes into it.
+SKILL_INDEX = SkillIndex()
+
+# Held while SKILL_INDEX loads, so concurrent first requests load it once.
+SKILL_INDEX_LOAD_LOCK = threading.Lock()
+
+
+def ensure_skill_index(db: Session) -> SkillIndex:
+    """
+    Returns `SKILL_INDEX`, loading it from `candidate_skills` on first use.
+
+    The load reads through a session of its own, begun after the index starts
+    queuing commits: every skill change is then either in what it reads or
+    replayed over it, and none of `db`'s uncommitted writes leak in.
+    """
+    if not SKILL_INDEX.loaded:
+        with SKILL_INDEX_LOAD_LOCK:
+            if not SKILL_INDEX.loaded:
+                SKILL_INDEX.start_load()
+                try:
+                    with Session(db.get_bind()) as load_db:
+                        SKILL_INDEX.load(
+                            load_db.execute(select(candidate_skills_table.c.skill_id, candidate_skills_table.c.candidate_id))
+                        )
+                except BaseException:
+                    SKILL_INDEX.clear()
+                    raise
+    return SKILL_INDEX
+
+
+@event.listens_for(Session, "after_flush")
+def collect_skill_changes(session: Session, flush_context) -> None:
+    """Remembers the candidate skill links a flush added or removed, to replay them on commit."""
+    changes = session.info.setdefault("skill_index_changes", [])
+    for obj in session.deleted:
+        if isinstance(obj, sqa_Candidate):
+            changes.append((SKILL_INDEX.remove_candidate, obj.candidate_id))
+    for obj in (*session.new, *session.dirty):
+        if isinstance(obj, sqa_Candidate):
+            history = sa_inspect(obj).attrs.skills.history
+            changes.extend((SKILL_INDEX.remove, skill.skill_id, obj.candidate_id) for skill in history.deleted or ())
+            changes.extend((SKILL_INDEX.add, skill.skill_id, obj.candidate_id) for skill in history.added or ())
+
+
+@event.listens_for(Session, "after_commit")
+def apply_skill_changes(session: Session) -> None:
+    """Replays the committed skill changes into `SKILL_INDEX` once it has been loaded."""
+    SKILL_INDEX.apply(session.info.pop("skill_index_changes", ()))
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_skill_changes(session: Session) -> None:
+    """Forgets the skill changes of a rolled back transaction."""
+    session.info.pop("skill_index_changes", None)
+
+
+def load_skills(db: Session, skill_ids: List[int]) -> List[sqa_Skill]:
+    """
+    Loads the skills with the given IDs.
+
+    Raises:
+        HTTPException: 404 Not Found if any of the IDs does not exist.
+    """
+    skills = db.scalars(select(sqa_Skill).where(sqa_Skill.skill_id.in_(set(skill_ids)))).all()
+    missing = sorted(set(skill_ids) - {skill.skill_id for skill in skills})
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Skills with IDs {', '.join(map(str, missing))} not found",
+        )
+    return list(skills)
+
+
+# --- Interview Schedule Index ---
+
+# Per-person interval index behind the interview conflict checks and
+# GET /users/{user_id}/availability. Each interview is stored under
+# ("candidate", candidate_id) and ("user", user_id) for every participant. It
+# is loaded on first use and kept current by the session hooks below.
+INTERVIEW_INDEX = IntervalIndex()
+
+# Held from the conflict check to the commit of a booking, so two concurrent
+# requests cannot both claim the same slot. INTERVIEW_INDEX loads under it too.
+INTERVIEW_BOOKING_LOCK = threading.Lock()
+
+
+def interview_keys(candidate_id: int, user_ids) -> List[tuple]:
+    """Returns the `INTERVIEW_INDEX` keys an interview is stored under."""
+    return [("candidate", candidate_id), *(("user", user_id) for user_id in user_ids)]
+
+
+def ensure_interview_index(db: Session) -> IntervalIndex:
+    """
+    Returns `INTERVIEW_INDEX`, loading it from `interviews` and
+    `interview_participants` on first use. Call it with
+    INTERVIEW_BOOKING_LOCK held, so no booking commits mid-load.
+
+    The load reads through a session of its own, begun after the index starts
+    queuing commits: an interview written outside the lock (a cascade, say)
+    while the two tables are read is replayed over them, and none of `db`'s
+    uncommitted writes leak in.
+    """
+    if not INTERVIEW_INDEX.loaded:
+        INTERVIEW_INDEX.start_load()
+        try:
+            with Session(db.get_bind()) as load_db:
+                participants: Dict[int, List[int]] = {}
+                for interview_id, user_id in load_db.execute(
+                    select(interview_participants_table.c.interview_id, interview_participants_table.c.user_id)
+                ):
+                    participants.setdefault(interview_id, []).append(user_id)
+                rows = load_db.execute(
+                    select(sqa_Interview.interview_id, sqa_Application.candidate_id, sqa_Interview.start_time, sqa_Interview.end_time)
+                    .join(sqa_Interview.application)
+                )
+                INTERVIEW_INDEX.load(
+                    (interview_id, interview_keys(candidate_id, participants.get(interview_id, ())), start, end)
+                    for interview_id, candidate_id, start, end in rows
+                )
+        except BaseException:
+            INTERVIEW_INDEX.clear()
+            raise
+    return INTERVIEW_INDEX
+
+
+@event.listens_for(Session, "before_flush")
+def collect_interview_cascades(session: Session, flush_context, instances) -> None:
+    """
+    Remembers the interviews that deleting an application or a candidate takes
+    with it through ON DELETE CASCADE, while they can still be read. Deleting
+    a user only removes them from the participants of their interviews.
+    """
+    application_ids = [obj.application_id for obj in session.deleted if isinstance(obj, sqa_Application)]
+    candidate_ids = [obj.candidate_id for obj in session.deleted if isinstance(obj, sqa_Candidate)]
+    user_ids = [obj.user_id for obj in session.deleted if isinstance(obj, sqa_User)]
+    if not (application_ids or candidate_ids or user_ids):
+        return
+    changes = session.info.setdefault("interview_index_changes", [])
+    if application_ids or candidate_ids:
+        interview_ids = session.scalars(
+            select(sqa_Interview.interview_id)
+            .join(sqa_Interview.application)
+            .where(or_(sqa_Application.application_id.in_(application_ids), sqa_Application.candidate_id.in_(candidate_ids)))
+        )
+        changes.extend((INTERVIEW_INDEX.remove, interview_id) for interview_id in interview_ids)
+    changes.extend((INTERVIEW_INDEX.remove_key, ("user", user_id)) for user_id in user_ids)
+
+
+@event.listens_for(Session, "after_flush")
+def collect_interview_changes(session: Session, flush_context) -> None:
+    """
+    Remembers the interviews a flush wrote, to replay them on commit. An
+    interview written without its participants and application loaded makes
+    the index reload instead.
+    """
+    changes = session.info.setdefault("interview_index_changes", [])
+    for obj in session.deleted:
+        if isinstance(obj, sqa_Interview):
+            changes.append((INTERVIEW_INDEX.remove, obj.interview_id))
+    for obj in (*session.new, *session.dirty):
+        if isinstance(obj, sqa_Interview):
+            loaded = sa_inspect(obj).dict
+            if "participants" in loaded and "application" in loaded:
+                keys = interview_keys(obj.application.candidate_id, [user.user_id for user in obj.participants])
+                changes.append((INTERVIEW_INDEX.add, obj.interview_id, keys, obj.start_time, obj.end_time))
+            else:
+                changes.append((INTERVIEW_INDEX.clear,))
+
+
+@event.listens_for(Session, "after_commit")
+def apply_interview_changes(session: Session) -> None:
+    """Replays the committed interview changes into `INTERVIEW_INDEX` once it has been loaded."""
+    INTERVIEW_INDEX.apply(session.info.pop("interview_index_changes", ()))
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_interview_changes(session: Session) -> None:
+    """Forgets the interview changes of a rolled back transaction."""
+    session.info.pop("interview_index_changes", None)
+
+
+# --- Bulk Helpers ---
+
+# SQLite caps the number of bound parameters per statement (32766 since 3.32),
+# so very large IN lists are split into chunks just below that limit.
+MAX_SQL_PARAMETERS = 32_000
+
+# Most rows a bulk create request may carry. A batch is written in one
+# transaction, holding SQLite's write lock throughout, so larger loads must be
+# split into several requests; a longer body is rejected with 422.
+MAX_BULK_ROWS = 1000
+
+
+def select_matching(db: Session, select_columns: list, key_columns: list, keys: list) -> list:
+    """
+    Returns `select_columns` of every row whose `key_columns` equal one of
+    `keys`.
+
+    Uses one `IN` query per `MAX_SQL_PARAMETERS` bound parameters. With more
+    than one key column, `keys` are tuples and a row-value `IN` is used.
+    """
+    keys = list(dict.fromkeys(keys))
+    target = key_columns[0] if len(key_columns) == 1 else tuple_(*key_columns)
+    chunk_size = MAX_SQL_PARAMETERS // len(key_columns)
+    rows = []
+    for start in range(0, len(keys), chunk_size):
+        rows.extend(db.execute(select(*select_columns).where(target.in_(keys[start:start + chunk_size]))))
+    return rows
+
+
+def find_existing(db: Session, key_columns: list, keys: list) -> set:
+    """Returns the subset of `keys` already present in `key_columns`."""
+    if len(key_columns) == 1:
+        return {row[0] for row in select_matching(db, key_columns, key_columns, keys)}
+    return {tuple(row) for row in select_matching(db, key_columns, key_columns, keys)}
+
+
+def bulk_insert(
+    db: Session,
+    model,
+    pk_column,
+    key_columns: list,
+    results: List[BulkCreateResult],
+    rows: List[dict],
+) -> None:
+    """
+    Inserts the accepted `rows` of a batch in one transaction and fills in the
+    new IDs on their entries in `results`.
+
+    `results` holds a `BulkCreateResult` with status 201 and no ID for every
+    accepted row, in the same order as `rows`. The rows are sent as a single
+    executemany `INSERT`, and the generated IDs are read back with one `IN`
+    query on the rows' unique `key_columns` instead of a `refresh()` per row.
+
+    Raises:
+        HTTPException: 409 Conflict if a concurrent write broke a constraint;
+                       the whole batch is rolled back.
+    """
+    if not rows:
+        return
+    keys = [
+        row[key_columns[0].key] if len(key_columns) == 1 else tuple(row[c.key] for c in key_columns)
+        for row in rows
+    ]
+    try:
+        db.execute(insert(model), rows)
+        new_ids = {
+            (row[1] if len(key_columns) == 1 else tuple(row[1:])): row[0]
+            for row in select_matching(db, [pk_column, *key_columns], key_columns, keys)
+        }
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="The batch conflicts with rows written concurrently; no rows were created.",
+        )
+    accepted = [result for result in results if result.status_code == status.HTTP_201_CREATED]
+    for result, key in zip(accepted, keys):
+        result.id = new_ids[key]
+
+
+def bulk_create_with_unique_email(db: Session, model, pk_column, items: list, noun: str) -> List[BulkCreateResult]:
+    """
+    Creates users or candidates in bulk, skipping rows whose email is already
+    taken in the table or earlier in the same batch.
+    """
+    taken = find_existing(db, [model.email], [item.email for item in items])
+    results, rows = [], []
+    for index, item in enumerate(items):
+        if item.email in taken:
+            results.append(BulkCreateResult(
+                index=index,
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"{noun} with email '{item.email}' already exists.",
+            ))
+            continue
+        taken.add(item.email)
+        results.append(BulkCreateResult(index=index, status_code=status.HTTP_201_CREATED))
+        rows.append(item.model_dump())
+    bulk_insert(db, model, pk_column, [model.email], results, rows)
+    return results
+
+
 # --- User Endpoints ---
 
 @app.post("/users/", response_model=User, status_code=status.HTTP_201_CREATED, tags=["Users"])
-def create_user(user: UserCreate, db: Session = Depends(get_db)) -> sqa_User:
+def create_user(user: UserCreate, db: Session = Depends(get_db)) -> User:
     """
     Creates a new user. The email must be unique.
+
+    The row is written with a single `INSERT ... RETURNING`; a duplicate email
+    is reported by the UNIQUE constraint and mapped to 409 Conflict.
     """
-    db_user = db.query(sqa_User).filter(sqa_User.email == user.email).first()
-    if db_user:
+    try:
+        new_user = db.execute(insert(sqa_User).values(**user.model_dump()).returning(sqa_User)).scalar_one()
+    except IntegrityError:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"User with email '{user.email}' already exists.",
         )
-    new_user = sqa_User(**user.model_dump())
-    db.add(new_user)
+    created = User.model_validate(new_user)
     db.commit()
-    db.refresh(new_user)
-    return new_user
+    return created
+
+
+@app.post("/users/bulk", response_model=List[BulkCreateResult], tags=["Users"])
+def create_users_bulk(
+    users: List[UserCreate] = Body(..., max_length=MAX_BULK_ROWS), db: Session = Depends(get_db)
+) -> List[BulkCreateResult]:
+    """
+    Creates up to `MAX_BULK_ROWS` users in one transaction and reports the
+    outcome of each row.
+
+    Rows whose email already exists are skipped with a 409 result; the rest
+    are inserted together.
+    """
+    return bulk_create_with_unique_email(db, sqa_User, sqa_User.user_id, users, "User")
 
 
 @app.get("/users/", response_model=List[User], tags=["Users"])
-def get_all_users(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)) -> List[sqa_User]:
+def get_all_users(
+    request: Request,
+    response: Response,
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    db: Session = Depends(get_db),
+) -> FastJSONResponse:
     """
     Retrieves a list of all users with pagination.
+
+    Pass the `X-Next-Cursor` header of the previous response as `cursor` to
+    fetch the next page at constant cost. Pass `fields` (e.g.
+    `fields=email,role`) to return only those fields.
     """
-    return db.query(sqa_User).offset(skip).limit(limit).all()
+    field_names = parse_fields(User, sqa_User.user_id, fields)
+    unchanged = not_modified(
+        request, response, db.execute(freshness_select(sqa_User, sqa_User.user_id)).one(), collection=True
+    )
+    if unchanged is not None:
+        return unchanged
+    stmt = select(*schema_columns(sqa_User, User, field_names))
+    return fast_paginate(db, stmt, sqa_User.user_id, response, skip, limit, cursor)
 
 
 @app.get("/users/{user_id}", response_model=User, tags=["Users"])
-def get_user(user_id: int, db: Session = Depends(get_db)) -> sqa_User:
+def get_user(
+    user_id: int, request: Request, response: Response, fields: Optional[str] = None, db: Session = Depends(get_db)
+) -> User:
     """
     Retrieves a single user by their ID.
+
+    Served from the in-process read-through cache; see `get_cached`.
+
+    Pass `fields` (e.g. `fields=email,role`) to return only those fields.
     """
-    db_user = db.get(sqa_User, user_id)
-    if not db_user:
+    field_names = parse_fields(User, sqa_User.user_id, fields)
+    cached = get_cached(db, sqa_User, user_id)
+    if cached is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"User with ID {user_id} not found")
-    return db_user
+    unchanged = not_modified(request, response, (1, cached.updated_at, user_id))
+    if unchanged is not None:
+        return unchanged
+    if field_names is not None:
+        return with_headers(sparse_response(User, field_names, cached.model_dump(include=set(field_names))), response)
+    return cached
 
 
 @app.put("/users/{user_id}", response_model=User, tags=["Users"])
-def update_user(user_id: int, user_update: UserUpdate, db: Session = Depends(get_db)) -> sqa_User:
+def update_user(user_id: int, user_update: UserUpdate, db: Session = Depends(get_db)) -> User:
     """
     Updates an existing user's details.
-    """
-    db_user = db.get(sqa_User, user_id)
-    if not db_user:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"User with ID {user_id} not found")
 
+    The change is applied with a single `UPDATE ... RETURNING`; a duplicate
+    email is reported by the UNIQUE constraint and mapped to 409 Conflict.
+    """
     update_data = user_update.model_dump(exclude_unset=True)
-    if 'email' in update_data:
-        existing_user = db.query(sqa_User).filter(sqa_User.email == update_data['email']).first()
-        if existing_user and existing_user.user_id != user_id:
+    if not update_data:
+        db_user = db.get(sqa_User, user_id)
+    else:
+        stmt = (
+            update(sqa_User)
+            .where(sqa_User.user_id == user_id)
+            .values(**update_data)
+            .returning(sqa_User)
+            .execution_options(synchronize_session=False, cache_keys=[("users", user_id)])
+        )
+        try:
+            db_user = db.execute(stmt).scalar_one_or_none()
+        except IntegrityError:
+            db.rollback()
+            if 'email' not in update_data:
+                raise
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail=f"User with email '{update_data['email']}' already exists.",
             )
+    if not db_user:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"User with ID {user_id} not found")
 
-    for key, value in update_data.items():
-        setattr(db_user, key, value)
-
+    updated = User.model_validate(db_user)
     db.commit()
-    db.refresh(db_user)
-    return db_user
+    return updated
 
 
 @app.delete("/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT, tags=["Users"])
@@ -508,66 +1640,125 @@ def delete_user(user_id: int, db: Session = Depends(get_db)):
 # --- Candidate Endpoints ---
 
 @app.post("/candidates/", response_model=Candidate, status_code=status.HTTP_201_CREATED, tags=["Candidates"])
-def create_candidate(candidate: CandidateCreate, db: Session = Depends(get_db)) -> sqa_Candidate:
+def create_candidate(candidate: CandidateCreate, db: Session = Depends(get_db)) -> Candidate:
     """
     Creates a new candidate. The email must be unique.
+
+    The row is written with a single `INSERT ... RETURNING`; a duplicate email
+    is reported by the UNIQUE constraint and mapped to 409 Conflict.
     """
-    db_candidate = db.query(sqa_Candidate).filter(sqa_Candidate.email == candidate.email).first()
-    if db_candidate:
+    try:
+        stmt = insert(sqa_Candidate).values(**candidate.model_dump()).returning(sqa_Candidate)
+        new_candidate = db.execute(stmt).scalar_one()
+    except IntegrityError:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Candidate with email '{candidate.email}' already exists.",
         )
-    new_candidate = sqa_Candidate(**candidate.model_dump())
-    db.add(new_candidate)
+    created = Candidate.model_validate(new_candidate)
     db.commit()
-    db.refresh(new_candidate)
-    return new_candidate
+    return created
+
+
+@app.post("/candidates/bulk", response_model=List[BulkCreateResult], tags=["Candidates"])
+def create_candidates_bulk(
+    candidates: List[CandidateCreate] = Body(..., max_length=MAX_BULK_ROWS), db: Session = Depends(get_db)
+) -> List[BulkCreateResult]:
+    """
+    Creates up to `MAX_BULK_ROWS` candidates in one transaction and reports
+    the outcome of each row.
+
+    Rows whose email already exists are skipped with a 409 result; the rest
+    are inserted together.
+    """
+    return bulk_create_with_unique_email(db, sqa_Candidate, sqa_Candidate.candidate_id, candidates, "Candidate")
 
 
 @app.get("/candidates/", response_model=List[Candidate], tags=["Candidates"])
-def get_all_candidates(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)) -> List[sqa_Candidate]:
+def get_all_candidates(
+    request: Request,
+    response: Response,
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    db: Session = Depends(get_db),
+) -> FastJSONResponse:
     """
     Retrieves a list of all candidates with pagination.
+
+    Pass the `X-Next-Cursor` header of the previous response as `cursor` to
+    fetch the next page at constant cost. Pass `fields` (e.g.
+    `fields=first_name,last_name`) to return only those fields.
     """
-    return db.query(sqa_Candidate).offset(skip).limit(limit).all()
+    field_names = parse_fields(Candidate, sqa_Candidate.candidate_id, fields)
+    freshness = freshness_select(sqa_Candidate, sqa_Candidate.candidate_id)
+    unchanged = not_modified(request, response, db.execute(freshness).one(), collection=True)
+    if unchanged is not None:
+        return unchanged
+    stmt = select(*schema_columns(sqa_Candidate, Candidate, field_names))
+    return fast_paginate(db, stmt, sqa_Candidate.candidate_id, response, skip, limit, cursor)
 
 
 @app.get("/candidates/{candidate_id}", response_model=Candidate, tags=["Candidates"])
-def get_candidate(candidate_id: int, db: Session = Depends(get_db)) -> sqa_Candidate:
+def get_candidate(
+    candidate_id: int, request: Request, response: Response, fields: Optional[str] = None, db: Session = Depends(get_db)
+) -> Candidate:
     """
     Retrieves a single candidate by their ID.
+
+    Served from the in-process read-through cache; see `get_cached`.
+
+    Pass `fields` (e.g. `fields=first_name,last_name`) to return only those fields.
     """
-    db_candidate = db.get(sqa_Candidate, candidate_id)
-    if not db_candidate:
+    field_names = parse_fields(Candidate, sqa_Candidate.candidate_id, fields)
+    cached = get_cached(db, sqa_Candidate, candidate_id)
+    if cached is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Candidate with ID {candidate_id} not found")
-    return db_candidate
+    unchanged = not_modified(request, response, (1, cached.updated_at, candidate_id))
+    if unchanged is not None:
+        return unchanged
+    if field_names is not None:
+        return with_headers(sparse_response(Candidate, field_names, cached.model_dump(include=set(field_names))), response)
+    return cached
 
 
 @app.put("/candidates/{candidate_id}", response_model=Candidate, tags=["Candidates"])
-def update_candidate(candidate_id: int, candidate_update: CandidateUpdate, db: Session = Depends(get_db)) -> sqa_Candidate:
+def update_candidate(candidate_id: int, candidate_update: CandidateUpdate, db: Session = Depends(get_db)) -> Candidate:
     """
     Updates an existing candidate's details.
-    """
-    db_candidate = db.get(sqa_Candidate, candidate_id)
-    if not db_candidate:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Candidate with ID {candidate_id} not found")
 
+    The change is applied with a single `UPDATE ... RETURNING`; a duplicate
+    email is reported by the UNIQUE constraint and mapped to 409 Conflict.
+    """
     update_data = candidate_update.model_dump(exclude_unset=True)
-    if 'email' in update_data:
-        existing_candidate = db.query(sqa_Candidate).filter(sqa_Candidate.email == update_data['email']).first()
-        if existing_candidate and existing_candidate.candidate_id != candidate_id:
+    if not update_data:
+        db_candidate = db.get(sqa_Candidate, candidate_id)
+    else:
+        stmt = (
+            update(sqa_Candidate)
+            .where(sqa_Candidate.candidate_id == candidate_id)
+            .values(**update_data)
+            .returning(sqa_Candidate)
+            .execution_options(synchronize_session=False, cache_keys=[("candidates", candidate_id)])
+        )
+        try:
+            db_candidate = db.execute(stmt).scalar_one_or_none()
+        except IntegrityError:
+            db.rollback()
+            if 'email' not in update_data:
+                raise
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail=f"Candidate with email '{update_data['email']}' already exists.",
             )
+    if not db_candidate:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Candidate with ID {candidate_id} not found")
 
-    for key, value in update_data.items():
-        setattr(db_candidate, key, value)
-
+    updated = Candidate.model_validate(db_candidate)
     db.commit()
-    db.refresh(db_candidate)
-    return db_candidate
+    return updated
 
 
 @app.delete("/candidates/{candidate_id}", status_code=status.HTTP_204_NO_CONTENT, tags=["Candidates"])
@@ -584,6 +1775,54 @@ def delete_candidate(candidate_id: int, db: Session = Depends(get_db)):
     return
 
 
+@app.put("/candidates/{candidate_id}/skills", response_model=List[Skill], tags=["Candidates"])
+def set_candidate_skills(
+    candidate_id: int, assignment: SkillAssignment, db: Session = Depends(get_db)
+) -> List[sqa_Skill]:
+    """
+    Replaces the skills of a candidate. The skills index used for job
+    matching picks the change up when it is committed.
+    """
+    db_candidate = db.get(sqa_Candidate, candidate_id)
+    if not db_candidate:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Candidate with ID {candidate_id} not found")
+    db_candidate.skills = load_skills(db, assignment.skill_ids)
+    db.commit()
+    return db_candidate.skills
+
+
+# --- Skill Endpoints ---
+
+@app.post("/skills/", response_model=Skill, status_code=status.HTTP_201_CREATED, tags=["Skills"])
+def create_skill(skill: SkillCreate, db: Session = Depends(get_db)) -> sqa_Skill:
+    """
+    Creates a new skill. Skill names are unique.
+    """
+    db_skill = sqa_Skill(**skill.model_dump())
+    db.add(db_skill)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Skill '{skill.name}' already exists.")
+    db.refresh(db_skill)
+    return db_skill
+
+
+@app.get("/skills/", response_model=List[Skill], tags=["Skills"])
+def get_all_skills(
+    response: Response,
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+) -> List[sqa_Skill]:
+    """
+    Retrieves a list of all skills with pagination.
+    """
+    return paginate(db.query(sqa_Skill), sqa_Skill.skill_id, response, skip, limit, cursor)
+
+
 # --- Job Endpoints ---
 
 @app.post("/jobs/", response_model=Job, status_code=status.HTTP_201_CREATED, tags=["Jobs"])
@@ -606,24 +1845,131 @@ def create_job(job: JobCreate, db: Session = Depends(get_db)) -> sqa_Job:
 
 
 @app.get("/jobs/", response_model=List[Job], tags=["Jobs"])
-def get_all_jobs(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)) -> List[sqa_Job]:
+def get_all_jobs(
+    request: Request,
+    response: Response,
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    db: Session = Depends(get_db),
+) -> FastJSONResponse:
     """
     Retrieves a list of all jobs with pagination.
+
+    Pass the `X-Next-Cursor` header of the previous response as `cursor` to
+    fetch the next page at constant cost. Pass `fields` (e.g.
+    `fields=job_id,title`) to return only those fields.
     """
-    return db.query(sqa_Job).offset(skip).limit(limit).all()
+    field_names = parse_fields(Job, sqa_Job.job_id, fields)
+    unchanged = not_modified(
+        request, response, db.execute(freshness_select(sqa_Job, sqa_Job.job_id)).one(), collection=True
+    )
+    if unchanged is not None:
+        return unchanged
+    stmt = select(*schema_columns(sqa_Job, Job, field_names))
+    return fast_paginate(db, stmt, sqa_Job.job_id, response, skip, limit, cursor)
 
 
 @app.get("/jobs/{job_id}", response_model=Job, tags=["Jobs"])
-def get_job(job_id: int, db: Session = Depends(get_db)) -> sqa_Job:
+def get_job(
+    job_id: int, request: Request, response: Response, fields: Optional[str] = None, db: Session = Depends(get_db)
+) -> Job:
     """
     Retrieves a single job by its ID.
+
+    Served from the in-process read-through cache; see `get_cached`.
+
+    Pass `fields` (e.g. `fields=title`) to return only those fields.
     """
-    db_job = db.get(sqa_Job, job_id)
+    field_names = parse_fields(Job, sqa_Job.job_id, fields)
+    cached = get_cached(db, sqa_Job, job_id)
+    if cached is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Job with ID {job_id} not found")
+    unchanged = not_modified(request, response, (1, cached.updated_at, job_id))
+    if unchanged is not None:
+        return unchanged
+    if field_names is not None:
+        return with_headers(sparse_response(Job, field_names, cached.model_dump(include=set(field_names))), response)
+    return cached
+
+
+@app.get("/jobs/{job_id}/applicants", response_model=JobWithApplicants, tags=["Jobs"])
+def get_job_applicants(job_id: int, db: Session = Depends(get_db)) -> sqa_Job:
+    """
+    Retrieves a job together with all of its applications and the candidate
+    behind each one.
+
+    Applications are loaded with a `selectinload` and their candidates with a
+    `joinedload`, so the whole page costs two indexed queries regardless of
+    the number of applicants.
+    """
+    db_job = (
+        db.query(sqa_Job)
+        .options(selectinload(sqa_Job.applications).joinedload(sqa_Application.candidate))
+        .filter(sqa_Job.job_id == job_id)
+        .first()
+    )
     if not db_job:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Job with ID {job_id} not found")
     return db_job
 
 
+@app.put("/jobs/{job_id}/skills", response_model=List[Skill], tags=["Jobs"])
+def set_job_skills(job_id: int, assignment: SkillAssignment, db: Session = Depends(get_db)) -> List[sqa_Skill]:
+    """
+    Replaces the skills a job requires.
+    """
+    db_job = db.get(sqa_Job, job_id)
+    if not db_job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Job with ID {job_id} not found")
+    db_job.skills = load_skills(db, assignment.skill_ids)
+    db.commit()
+    return db_job.skills
+
+
+@app.get("/jobs/{job_id}/matches", response_model=List[CandidateMatch], tags=["Jobs"])
+def get_job_matches(
+    job_id: int,
+    limit: int = Query(20, ge=1, le=500),
+    min_overlap: int = Query(1, ge=1, description="Minimum number of required skills a candidate must have."),
+    db: Session = Depends(get_db),
+) -> List[CandidateMatch]:
+    """
+    Ranks candidates by how many of the job's required skills they have,
+    best first (ties by candidate ID).
+
+    Matching merges the posting lists of the job's skills in the in-memory
+    skills index, so its cost depends on how many candidates have those
+    skills rather than on the size of `candidate_skills`; only the returned
+    candidates are loaded from the database.
+    """
+    if not db.get(sqa_Job, job_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Job with ID {job_id} not found")
+    skill_ids = db.scalars(select(job_skills_table.c.skill_id).where(job_skills_table.c.job_id == job_id)).all()
+    if not skill_ids:
+        return []
+
+    index = ensure_skill_index(db)
+    ranked = index.match(skill_ids, limit, min_overlap)
+    candidates = {
+        candidate.candidate_id: candidate
+        for candidate in db.scalars(
+            select(sqa_Candidate).where(sqa_Candidate.candidate_id.in_([candidate_id for candidate_id, _ in ranked]))
+        )
+    }
+    return [
+        CandidateMatch(
+            candidate=Candidate.model_validate(candidates[candidate_id]),
+            matched_skill_ids=index.skills_of(candidate_id, skill_ids),
+            overlap=overlap,
+            score=overlap / len(skill_ids),
+        )
+        for candidate_id, overlap in ranked
+        if candidate_id in candidates
+    ]
+
+
 # --- Application Endpoints ---
 
 @app.post("/applications/", response_model=Application, status_code=status.HTTP_201_CREATED, tags=["Applications"])
@@ -651,25 +1997,183 @@ def create_application(application: ApplicationCreate, db: Session = Depends(get
     return new_application
 
 
+@app.post("/applications/bulk", response_model=List[BulkCreateResult], tags=["Applications"])
+def create_applications_bulk(
+    applications: List[ApplicationCreate] = Body(..., max_length=MAX_BULK_ROWS), db: Session = Depends(get_db)
+) -> List[BulkCreateResult]:
+    """
+    Creates up to `MAX_BULK_ROWS` applications in one transaction and reports
+    the outcome of each row.
+
+    Rows referencing a missing job or candidate are skipped with a 404 result,
+    and rows for a (job, candidate) pair that already applied are skipped with
+    a 409 result. Existence and uniqueness are each checked with one `IN`
+    query for the whole batch.
+    """
+    job_ids = find_existing(db, [sqa_Job.job_id], [a.job_id for a in applications])
+    candidate_ids = find_existing(db, [sqa_Candidate.candidate_id], [a.candidate_id for a in applications])
+    taken = find_existing(
+        db,
+        [sqa_Application.job_id, sqa_Application.candidate_id],
+        [(a.job_id, a.candidate_id) for a in applications],
+    )
+
+    results, rows = [], []
+    for index, application in enumerate(applications):
+        pair = (application.job_id, application.candidate_id)
+        if application.job_id not in job_ids:
+            status_code, detail = status.HTTP_404_NOT_FOUND, f"Job with ID {application.job_id} not found"
+        elif application.candidate_id not in candidate_ids:
+            status_code, detail = status.HTTP_404_NOT_FOUND, f"Candidate with ID {application.candidate_id} not found"
+        elif pair in taken:
+            status_code = status.HTTP_409_CONFLICT
+            detail = f"Candidate {application.candidate_id} has already applied for job {application.job_id}."
+        else:
+            taken.add(pair)
+            results.append(BulkCreateResult(index=index, status_code=status.HTTP_201_CREATED))
+            rows.append(application.model_dump())
+            continue
+        results.append(BulkCreateResult(index=index, status_code=status_code, detail=detail))
+
+    bulk_insert(
+        db,
+        sqa_Application,
+        sqa_Application.application_id,
+        [sqa_Application.job_id, sqa_Application.candidate_id],
+        results,
+        rows,
+    )
+    return results
+
+
+def filter_applications(
+    query,
+    job_id: Optional[int],
+    candidate_id: Optional[int],
+    application_status: Optional[ApplicationStatus],
+):
+    """Narrows an applications query or `select()` to the given filters; `None` means no filter."""
+    if job_id is not None:
+        query = query.filter(sqa_Application.job_id == job_id)
+    if candidate_id is not None:
+        query = query.filter(sqa_Application.candidate_id == candidate_id)
+    if application_status is not None:
+        query = query.filter(sqa_Application.status == application_status.value)
+    return query
+
+
 @app.get("/applications/", response_model=List[Application], tags=["Applications"])
-def get_all_applications(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)) -> List[sqa_Application]:
+def get_all_applications(
+    request: Request,
+    response: Response,
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    job_id: Optional[int] = None,
+    candidate_id: Optional[int] = None,
+    application_status: Optional[ApplicationStatus] = Query(None, alias="status"),
+    db: Session = Depends(get_db),
+) -> FastJSONResponse:
     """
     Retrieves a list of all applications with pagination.
+
+    The list can be narrowed server-side by `job_id`, `candidate_id` and
+    `status`, so clients no longer download every application to filter it.
+    Pass the `X-Next-Cursor` header of the previous response as `cursor` to
+    fetch the next page at constant cost. Pass `fields` (e.g.
+    `fields=job_id,status`) to return only those fields.
     """
-    return db.query(sqa_Application).offset(skip).limit(limit).all()
+    field_names = parse_fields(Application, sqa_Application.application_id, fields)
+    freshness = freshness_select(sqa_Application, sqa_Application.application_id)
+    freshness = filter_applications(freshness, job_id, candidate_id, application_status)
+    unchanged = not_modified(request, response, db.execute(freshness).one(), collection=True)
+    if unchanged is not None:
+        return unchanged
+    stmt = select(*schema_columns(sqa_Application, Application, field_names))
+    stmt = filter_applications(stmt, job_id, candidate_id, application_status)
+    return fast_paginate(db, stmt, sqa_Application.application_id, response, skip, limit, cursor)
 
 
 @app.get("/applications/{application_id}", response_model=Application, tags=["Applications"])
-def get_application(application_id: int, db: Session = Depends(get_db)) -> sqa_Application:
+def get_application(
+    application_id: int, request: Request, response: Response, fields: Optional[str] = None, db: Session = Depends(get_db)
+) -> sqa_Application:
     """
     Retrieves a single application by its ID.
+
+    Pass `fields` (e.g. `fields=status`) to return only those fields.
     """
+    field_names = parse_fields(Application, sqa_Application.application_id, fields)
+    freshness = freshness_select(sqa_Application, sqa_Application.application_id).where(
+        sqa_Application.application_id == application_id
+    )
+    unchanged = not_modified(request, response, db.execute(freshness).one())
+    if unchanged is not None:
+        return unchanged
+    if field_names is not None:
+        sparse = get_sparse(db, sqa_Application, Application, sqa_Application.application_id, application_id, field_names)
+        if sparse is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Application with ID {application_id} not found")
+        return with_headers(sparse, response)
     db_application = db.get(sqa_Application, application_id)
     if not db_application:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Application with ID {application_id} not found")
     return db_application
 
 
+@app.patch("/applications/status", response_model=ApplicationStatusBulkResult, tags=["Applications"])
+def update_applications_status(
+    bulk_update: ApplicationStatusBulkUpdate, db: Session = Depends(get_db)
+) -> ApplicationStatusBulkResult:
+    """
+    Moves many applications to a new status in one transaction.
+
+    Applications are selected by `application_ids` and/or the `job_id` and
+    `current_status` filters, and updated with a single
+    `UPDATE ... WHERE ... RETURNING application_id`. Applications already in
+    the target status are left untouched. If a `decision` is given, a
+    matching decision log row is inserted for each updated application in
+    the same transaction.
+    """
+    if bulk_update.decision is not None and not db.get(sqa_User, bulk_update.decided_by_user_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"User with ID {bulk_update.decided_by_user_id} not found",
+        )
+
+    stmt = filter_applications(
+        update(sqa_Application), bulk_update.job_id, None, bulk_update.current_status
+    )
+    if bulk_update.application_ids is not None:
+        stmt = stmt.where(sqa_Application.application_id.in_(bulk_update.application_ids))
+    stmt = (
+        stmt.where(sqa_Application.status != bulk_update.status.value)
+        .values(status=bulk_update.status.value)
+        .returning(sqa_Application.application_id)
+        .execution_options(synchronize_session=False)
+    )
+    updated_ids = sorted(db.scalars(stmt).all())
+
+    if bulk_update.decision is not None and updated_ids:
+        db.execute(
+            insert(sqa_DecisionLog),
+            [
+                {
+                    "application_id": application_id,
+                    "user_id": bulk_update.decided_by_user_id,
+                    "decision": bulk_update.decision.value,
+                    "reason": bulk_update.reason,
+                }
+                for application_id in updated_ids
+            ],
+        )
+    db.commit()
+    return ApplicationStatusBulkResult(
+        status=bulk_update.status, updated=len(updated_ids), application_ids=updated_ids
+    )
+
+
 @app.put("/applications/{application_id}", response_model=Application, tags=["Applications"])
 def update_application(application_id: int, app_update: ApplicationUpdate, db: Session = Depends(get_db)) -> sqa_Application:
     """
@@ -703,6 +2207,458 @@ def delete_application(application_id: int, db: Session = Depends(get_db)):
     return
 
 
+# --- Interview Endpoints ---
+
+# Widest availability window one request may ask for.
+MAX_AVAILABILITY_WINDOW = timedelta(days=92)
+
+
+def load_users(db: Session, user_ids: List[int]) -> List[sqa_User]:
+    """
+    Loads the users with the given IDs.
+
+    Raises:
+        HTTPException: 404 Not Found if any of the IDs does not exist.
+    """
+    users = db.scalars(select(sqa_User).where(sqa_User.user_id.in_(set(user_ids)))).all()
+    missing = sorted(set(user_ids) - {user.user_id for user in users})
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Users with IDs {', '.join(map(str, missing))} not found",
+        )
+    return list(users)
+
+
+def check_interview_conflicts(
+    db: Session,
+    candidate_id: int,
+    user_ids: List[int],
+    start_time: datetime,
+    end_time: datetime,
+    exclude: Optional[int] = None,
+) -> None:
+    """
+    Checks that neither the candidate nor any participant has another
+    interview overlapping `[start_time, end_time)`. Call it with
+    INTERVIEW_BOOKING_LOCK held.
+
+    Raises:
+        HTTPException: 409 Conflict naming every clashing interview.
+    """
+    index = ensure_interview_index(db)
+    conflicts = [
+        f"{kind} {key_id} is booked in interview {interview_id} ({start:%Y-%m-%d %H:%M}-{end:%H:%M})"
+        for kind, key_id in interview_keys(candidate_id, user_ids)
+        for start, end, interview_id in index.overlapping((kind, key_id), start_time, end_time, exclude)
+    ]
+    if conflicts:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=f"Scheduling conflict: {'; '.join(conflicts)}"
+        )
+
+
+def interview_response(db_interview: sqa_Interview) -> Interview:
+    """Builds the response model of an interview, including its participant IDs."""
+    return Interview(
+        interview_id=db_interview.interview_id,
+        application_id=db_interview.application_id,
+        interview_stage=db_interview.interview_stage,
+        start_time=db_interview.start_time,
+        end_time=db_interview.end_time,
+        participant_user_ids=sorted(user.user_id for user in db_interview.participants),
+        created_at=db_interview.created_at,
+        updated_at=db_interview.updated_at,
+    )
+
+
+@app.post("/interviews/", response_model=Interview, status_code=status.HTTP_201_CREATED, tags=["Interviews"])
+def create_interview(interview: InterviewCreate, db: Session = Depends(get_db)) -> Interview:
+    """
+    Schedules an interview. Fails with 409 if the candidate or any
+    participant already has an interview overlapping the requested time.
+    """
+    db_application = db.get(sqa_Application, interview.application_id)
+    if not db_application:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Application with ID {interview.application_id} not found",
+        )
+    participants = load_users(db, interview.participant_user_ids)
+    with INTERVIEW_BOOKING_LOCK:
+        check_interview_conflicts(
+            db, db_application.candidate_id, interview.participant_user_ids, interview.start_time, interview.end_time
+        )
+        db_interview = sqa_Interview(
+            **interview.model_dump(exclude={"participant_user_ids"}),
+            application=db_application,
+            participants=participants,
+        )
+        db.add(db_interview)
+        db.commit()
+    db.refresh(db_interview)
+    return interview_response(db_interview)
+
+
+@app.get("/interviews/{interview_id}", response_model=Interview, tags=["Interviews"])
+def get_interview(interview_id: int, db: Session = Depends(get_db)) -> Interview:
+    """Retrieves a single interview by its ID."""
+    db_interview = db.get(sqa_Interview, interview_id)
+    if not db_interview:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Interview with ID {interview_id} not found")
+    return interview_response(db_interview)
+
+
+@app.put("/interviews/{interview_id}", response_model=Interview, tags=["Interviews"])
+def update_interview(interview_id: int, interview_update: InterviewUpdate, db: Session = Depends(get_db)) -> Interview:
+    """
+    Reschedules an interview or changes its stage or participants. The new
+    time and participants are checked for conflicts like a new booking,
+    ignoring the interview itself.
+    """
+    db_interview = db.get(sqa_Interview, interview_id)
+    if not db_interview:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Interview with ID {interview_id} not found")
+
+    update_data = interview_update.model_dump(exclude_unset=True)
+    start_time = update_data.get("start_time") or db_interview.start_time
+    end_time = update_data.get("end_time") or db_interview.end_time
+    if end_time <= start_time:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="end_time must be after start_time.")
+    if interview_update.participant_user_ids is not None:
+        participants = load_users(db, interview_update.participant_user_ids)
+    else:
+        participants = list(db_interview.participants)
+
+    with INTERVIEW_BOOKING_LOCK:
+        check_interview_conflicts(
+            db,
+            db_interview.application.candidate_id,
+            [user.user_id for user in participants],
+            start_time,
+            end_time,
+            exclude=interview_id,
+        )
+        if "interview_stage" in update_data:
+            db_interview.interview_stage = update_data["interview_stage"]
+        db_interview.start_time = start_time
+        db_interview.end_time = end_time
+        db_interview.participants = participants
+        db.commit()
+    db.refresh(db_interview)
+    return interview_response(db_interview)
+
+
+@app.get("/users/{user_id}/availability", response_model=UserAvailability, tags=["Interviews"])
+def get_user_availability(
+    user_id: int,
+    start: datetime = Query(..., description="Start of the window. Times with an offset are converted to UTC."),
+    end: datetime = Query(..., description="End of the window, exclusive."),
+    min_minutes: int = Query(30, ge=1, le=24 * 60, description="Shortest free slot to report."),
+    db: Session = Depends(get_db),
+) -> UserAvailability:
+    """
+    Lists a user's interviews inside a time window and the free slots of at
+    least `min_minutes` between them, read from the interview index.
+    """
+    start, end = to_naive_utc(start), to_naive_utc(end)
+    if end <= start:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="end must be after start.")
+    if end - start > MAX_AVAILABILITY_WINDOW:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"The window may span at most {MAX_AVAILABILITY_WINDOW.days} days.",
+        )
+    if get_cached(db, sqa_User, user_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"User with ID {user_id} not found")
+
+    with INTERVIEW_BOOKING_LOCK:
+        index = ensure_interview_index(db)
+    booked = index.overlapping(("user", user_id), start, end)
+    return UserAvailability(
+        user_id=user_id,
+        start=start,
+        end=end,
+        busy=[BookedSlot(start=s, end=e, interview_id=interview_id) for s, e, interview_id in booked],
+        free=[
+            TimeSlot(start=s, end=e)
+            for s, e in free_slots([(s, e) for s, e, _ in booked], start, end, timedelta(minutes=min_minutes))
+        ],
+    )
+
+
+# --- Dashboard Endpoints ---
+
+@app.get("/dashboard/jobs", response_model=List[JobSummary], tags=["Dashboard"])
+def get_dashboard_jobs(db: Session = Depends(get_db)) -> List[JobSummary]:
+    """
+    Retrieves every job together with its applicant count and a per-status
+    breakdown of its applications.
+
+    The counts are read from the `job_status_counts` summary table, so the
+    dashboard needs one request instead of one `/applications/` call per job
+    and no scan of `applications`.
+    """
+    counts: Dict[int, Dict[ApplicationStatus, int]] = {}
+    for job_id, app_status, count in db.execute(select(job_status_counts_table)):
+        counts.setdefault(job_id, {})[ApplicationStatus(app_status)] = count
+    summaries = []
+    for db_job in db.scalars(select(sqa_Job).order_by(sqa_Job.job_id)):
+        status_counts = {app_status: 0 for app_status in ApplicationStatus}
+        status_counts.update(counts.get(db_job.job_id, {}))
+        summaries.append(
+            JobSummary(
+                **Job.model_validate(db_job).model_dump(),
+                applicant_count=sum(status_counts.values()),
+                status_counts=status_counts,
+            )
+        )
+    return summaries
+
+
+# --- Analytics Endpoints ---
+
+def histogram_percentile(counts: List[int], fraction: float) -> Optional[float]:
+    """
+    Bounds a percentile, in seconds, from stage duration histogram bucket
+    counts: the result is the upper bound of the bucket the percentile falls
+    in, so it is only as precise as STAGE_DURATION_BUCKETS. Interpolating
+    inside a bucket would invent a value, e.g. half an hour for stays of a
+    few seconds. The open-ended last bucket is reported as its lower bound.
+    """
+    total = sum(counts)
+    if not total:
+        return None
+    target = fraction * total
+    cumulative = 0
+    for bucket, count in enumerate(counts):
+        cumulative += count
+        if count and cumulative >= target:
+            if bucket == len(STAGE_DURATION_BUCKETS):
+                return float(STAGE_DURATION_BUCKETS[-1])
+            return float(STAGE_DURATION_BUCKETS[bucket])
+    return None
+
+
+# Reports keyed on the state of their source tables; a new key means new data.
+ANALYTICS_CACHE = TTLCache(maxsize=8, ttl=24 * 3600)
+
+
+@app.get("/analytics/time-to-hire", response_model=TimeToHireReport, tags=["Analytics"])
+def get_time_to_hire(db: Session = Depends(get_db)) -> dict:
+    """
+    Reports the time-to-hire distribution, the median time spent in each
+    stage and weekly application cohorts.
+
+    The report is computed with vectorized NumPy over columns loaded in
+    batches from `applications` and `decision_logs` (see `analytics`). It is
+    cached until the latest decision log `created_at` or the number of rows
+    in either table changes.
+    """
+    if analytics is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Time-to-hire analytics require NumPy."
+        )
+    key = ("time-to-hire", *db.execute(
+        select(
+            select(func.max(sqa_DecisionLog.created_at)).scalar_subquery(),
+            select(func.count()).select_from(sqa_DecisionLog).scalar_subquery(),
+            select(func.max(sqa_Application.application_id)).scalar_subquery(),
+            select(func.count()).select_from(sqa_Application).scalar_subquery(),
+        )
+    ).one())
+    report = ANALYTICS_CACHE.get(key)
+    if report is None:
+        report = analytics.time_to_hire_report(
+            db.connection(), sqa_Application.__table__, sqa_DecisionLog.__table__
+        )
+        ANALYTICS_CACHE.set(key, report)
+    return report
+
+
+@app.get("/analytics/funnel", response_model=FunnelReport, tags=["Analytics"])
+def get_funnel(job_id: Optional[int] = None, db: Session = Depends(get_db)) -> FunnelReport:
+    """
+    Reports how many applications are in each status, for one job or for
+    all jobs, and how long applications stay in each status.
+
+    Everything is read from summary tables that triggers on `applications`
+    keep current, so the cost grows with the number of statuses rather than
+    the number of applications.
+    """
+    if job_id is None:
+        rows = db.execute(select(application_status_totals_table.c.status, application_status_totals_table.c.count))
+    else:
+        if not db.get(sqa_Job, job_id):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Job with ID {job_id} not found")
+        rows = db.execute(
+            select(job_status_counts_table.c.status, job_status_counts_table.c.count)
+            .where(job_status_counts_table.c.job_id == job_id)
+        )
+    status_counts = {app_status: 0 for app_status in ApplicationStatus}
+    status_counts.update({ApplicationStatus(app_status): count for app_status, count in rows})
+
+    histograms = {app_status: [0] * (len(STAGE_DURATION_BUCKETS) + 1) for app_status in ApplicationStatus}
+    for app_status, bucket, count in db.execute(select(stage_duration_histogram_table)):
+        histograms[ApplicationStatus(app_status)][bucket] = count
+    stage_durations = []
+    for app_status, counts in histograms.items():
+        p50, p90 = histogram_percentile(counts, 0.5), histogram_percentile(counts, 0.9)
+        stage_durations.append(
+            StageDuration(
+                status=app_status,
+                transitions=sum(counts),
+                p50_hours=p50 / 3600 if p50 is not None else None,
+                p90_hours=p90 / 3600 if p90 is not None else None,
+            )
+        )
+
+    return FunnelReport(
+        job_id=job_id,
+        total=sum(status_counts.values()),
+        status_counts=status_counts,
+        stage_durations=stage_durations,
+    )
+
+
+# --- Search Endpoints ---
+
+# bm25() column weights: a match in a job title counts ten times one in its
+# description, and names count more than an email address.
+JOB_SEARCH_SQL = text(
+    """
+    SELECT jobs.job_id AS id, jobs.title,
+           bm25(jobs_fts, 10.0, 1.0) AS rank,
+           snippet(jobs_fts, -1, '<mark>', '</mark>', '…', 16) AS snippet
+    FROM jobs_fts JOIN jobs ON jobs.job_id = jobs_fts.rowid
+    WHERE jobs_fts MATCH :query
+    ORDER BY rank
+    LIMIT :limit
+    """
+)
+CANDIDATE_SEARCH_SQL = text(
+    """
+    SELECT candidates.candidate_id AS id, candidates.first_name, candidates.last_name, candidates.email,
+           bm25(candidates_fts, 5.0, 5.0, 1.0) AS rank,
+           snippet(candidates_fts, -1, '<mark>', '</mark>', '…', 8) AS snippet
+    FROM candidates_fts JOIN candidates ON candidates.candidate_id = candidates_fts.rowid
+    WHERE candidates_fts MATCH :query
+    ORDER BY rank
+    LIMIT :limit
+    """
+)
+
+
+def fts_query(q: str) -> str:
+    """
+    Turns free text into an FTS5 query that matches rows containing every
+    word, each as a prefix. Words are quoted so FTS5 operators and
+    punctuation in the input are searched for literally.
+    """
+    return " ".join('"' + word.replace('"', '""') + '"*' for word in q.split())
+
+
+@app.get("/search", response_model=SearchResults, tags=["Search"])
+def search(
+    q: str = Query(..., min_length=1, description="Words to search for; each matches as a prefix."),
+    limit: int = Query(20, ge=1, le=100, description="Maximum hits per resource."),
+    db: Session = Depends(get_db),
+) -> dict:
+    """
+    Searches job titles/descriptions and candidate names/emails through the
+    FTS5 indexes, best BM25 matches first.
+
+    Snippets contain the raw column text with `<mark>` tags around matched
+    terms; escape the text around the tags before rendering it as HTML.
+    """
+    query = fts_query(q)
+    if not query:
+        return {"jobs": [], "candidates": []}
+    params = {"query": query, "limit": limit}
+    return {
+        "jobs": db.execute(JOB_SEARCH_SQL, params).mappings().all(),
+        "candidates": db.execute(CANDIDATE_SEARCH_SQL, params).mappings().all(),
+    }
+
+
+# --- Metrics Endpoints ---
+
+@app.get("/metrics/cache", response_model=CacheMetrics, tags=["Metrics"])
+def get_cache_metrics() -> dict:
+    """
+    Reports the hit/miss counters of the read-through cache behind
+    `get_user`, `get_candidate` and `get_job`.
+    """
+    return ENTITY_CACHE.stats()
+
+
+# --- Export Endpoints ---
+
+# Rows fetched from the database cursor, and written to the client, per chunk.
+EXPORT_BATCH_SIZE = 1000
+
+
+def _export_json_default(value):
+    """Serializes values `json.dumps` does not handle natively (e.g. datetimes)."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def stream_table_export(bind, table: Table, export_format: ExportFormat):
+    """
+    Yields the rows of `table` as NDJSON or CSV text, one chunk per
+    `EXPORT_BATCH_SIZE` rows.
+
+    Rows are read on a dedicated connection with `yield_per`, so only one
+    batch is held in memory at a time and no ORM objects or Pydantic models
+    are built.
+    """
+    with bind.connect() as conn:
+        result = conn.execution_options(yield_per=EXPORT_BATCH_SIZE).execute(
+            select(table).order_by(*table.primary_key.columns)
+        )
+        if export_format == ExportFormat.CSV:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(result.keys())
+            for partition in result.partitions():
+                writer.writerows(partition)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+            yield buffer.getvalue()
+        else:
+            for partition in result.partitions():
+                yield "".join(
+                    json.dumps(dict(row._mapping), default=_export_json_default) + "\n" for row in partition
+                )
+
+
+@app.get("/export/{table_name}", tags=["Export"])
+def export_table(
+    table_name: str,
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    db: Session = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Streams every row of a table as newline-delimited JSON (default) or CSV.
+
+    The response is produced batch by batch from a server-side cursor, so
+    memory use stays flat regardless of the table size.
+    """
+    table = Base.metadata.tables.get(table_name)
+    if table is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Table '{table_name}' not found")
+
+    media_type = "text/csv" if export_format == ExportFormat.CSV else "application/x-ndjson"
+    return StreamingResponse(
+        stream_table_export(db.get_bind(), table, export_format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{table_name}.{export_format.value}"'},
+    )
+
+
 # --- Welcome Endpoint ---
 @app.get("/", include_in_schema=False)
 def root():
@@ -0,0 +1,483 @@
+"""
+An asynchronous variant of the Hiring/Recruitment System API.
+
+This application serves the same CRUD endpoints as `main.py`, backed by the
+same SQLite database, ORM models and Pydantic schemas, but every endpoint is
+an `async def` running on SQLAlchemy's asyncio extension with the `aiosqlite`
+driver. A request waiting on SQLite no longer pins one of Starlette's
+threadpool workers, so a single worker can keep many more requests in flight.
+
+Key Features:
+- `create_async_engine("sqlite+aiosqlite://...")` with the same per-connection
+  SQLite pragma profile as the synchronous engine.
+- An async `get_db` dependency yielding an `AsyncSession` per request.
+- `async def` versions of the Users, Candidates, Jobs and Applications CRUD
+  handlers, including cursor pagination and application filters.
+
+Requires the optional `aiosqlite` package and SQLAlchemy's asyncio extra
+(`pip install aiosqlite "sqlalchemy[asyncio]"`). Run it in place of `main.py` with:
+    uvicorn main_async:app --port 8081
+"""
+from __future__ import annotations
+
+import uvicorn
+from contextlib import asynccontextmanager
+from typing import List, Optional
+
+from fastapi import FastAPI, HTTPException, status, Depends, Query, Response
+from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from database import SQLITE_PRAGMAS, apply_sqlite_pragmas
+from main import (
+    Application,
+    ApplicationCreate,
+    ApplicationStatus,
+    ApplicationUpdate,
+    Base,
+    Candidate,
+    CandidateCreate,
+    CandidateUpdate,
+    Job,
+    JobCreate,
+    MAX_PAGE_SIZE,
+    NEXT_CURSOR_HEADER,
+    User,
+    UserCreate,
+    UserUpdate,
+    apply_keyset_pagination,
+    filter_applications,
+    origins,
+    sqa_Application,
+    sqa_Candidate,
+    sqa_Job,
+    sqa_User,
+    trim_page,
+)
+
+# --- Database Setup ---
+
+# Same database file as `main.py`, opened through the aiosqlite driver.
+ASYNC_SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./recruitment_app.db"
+
+# Create the async engine. Pragmas are applied through the wrapped sync engine,
+# whose "connect" event fires for every new aiosqlite connection.
+async_engine = create_async_engine(ASYNC_SQLALCHEMY_DATABASE_URL)
+apply_sqlite_pragmas(async_engine.sync_engine, SQLITE_PRAGMAS)
+
+# Create an AsyncSessionLocal class. Each instance will be an async database session.
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False)
+
+
+# --- FastAPI Dependency for Database Session ---
+
+async def get_db():
+    """
+    FastAPI dependency that provides an `AsyncSession` per request.
+    Ensures the session is closed after the request is completed.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# --- Lifespan Event Handler ---
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Handle startup and shutdown events."""
+    # Startup: Create all database tables
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield
+    # Shutdown: Release pooled aiosqlite connections
+    await async_engine.dispose()
+
+
+# --- Application Setup ---
+app = FastAPI(
+    title="Hiring System API (async)",
+    description="An API for managing a recruitment process, using FastAPI and async SQLAlchemy.",
+    version="2.0.0",
+    lifespan=lifespan,
+)
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=origins,
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
+)
+
+
+# --- User Endpoints ---
+
+@app.post("/users/", response_model=User, status_code=status.HTTP_201_CREATED, tags=["Users"])
+async def create_user(user: UserCreate, db: AsyncSession = Depends(get_db)) -> User:
+    """
+    Creates a new user. The email must be unique.
+
+    The row is written with a single `INSERT ... RETURNING`; a duplicate email
+    is reported by the UNIQUE constraint and mapped to 409 Conflict.
+    """
+    try:
+        stmt = insert(sqa_User).values(**user.model_dump()).returning(sqa_User)
+        new_user = (await db.execute(stmt)).scalar_one()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"User with email '{user.email}' already exists.",
+        )
+    created = User.model_validate(new_user)
+    await db.commit()
+    return created
+
+
+@app.get("/users/", response_model=List[User], tags=["Users"])
+async def get_all_users(
+    response: Response,
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+) -> List[sqa_User]:
+    """
+    Retrieves a list of all users with cursor pagination.
+    """
+    stmt = apply_keyset_pagination(select(sqa_User), sqa_User.user_id, skip, limit, cursor)
+    rows = (await db.scalars(stmt)).all()
+    return trim_page(rows, sqa_User.user_id, response, limit)
+
+
+@app.get("/users/{user_id}", response_model=User, tags=["Users"])
+async def get_user(user_id: int, db: AsyncSession = Depends(get_db)) -> sqa_User:
+    """
+    Retrieves a single user by their ID.
+    """
+    db_user = await db.get(sqa_User, user_id)
+    if not db_user:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"User with ID {user_id} not found")
+    return db_user
+
+
+@app.put("/users/{user_id}", response_model=User, tags=["Users"])
+async def update_user(user_id: int, user_update: UserUpdate, db: AsyncSession = Depends(get_db)) -> User:
+    """
+    Updates an existing user's details.
+
+    The change is applied with a single `UPDATE ... RETURNING`; a duplicate
+    email is reported by the UNIQUE constraint and mapped to 409 Conflict.
+    """
+    update_data = user_update.model_dump(exclude_unset=True)
+    if not update_data:
+        db_user = await db.get(sqa_User, user_id)
+    else:
+        stmt = (
+            update(sqa_User)
+            .where(sqa_User.user_id == user_id)
+            .values(**update_data)
+            .returning(sqa_User)
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            db_user = (await db.execute(stmt)).scalar_one_or_none()
+        except IntegrityError:
+            await db.rollback()
+            if 'email' not in update_data:
+                raise
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"User with email '{update_data['email']}' already exists.",
+            )
+    if not db_user:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"User with ID {user_id} not found")
+
+    updated = User.model_validate(db_user)
+    await db.commit()
+    return updated
+
+
+@app.delete("/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT, tags=["Users"])
+async def delete_user(user_id: int, db: AsyncSession = Depends(get_db)):
+    """
+    Deletes a user. Fails if the user is linked to jobs, feedback, or
+    decisions due to RESTRICT constraints.
+    """
+    db_user = await db.get(sqa_User, user_id)
+    if not db_user:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"User with ID {user_id} not found")
+    try:
+        await db.delete(db_user)
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Cannot delete user {user_id}. They are referenced by other records (e.g., jobs, feedback).",
+        )
+    return
+
+
+# --- Candidate Endpoints ---
+
+@app.post("/candidates/", response_model=Candidate, status_code=status.HTTP_201_CREATED, tags=["Candidates"])
+async def create_candidate(candidate: CandidateCreate, db: AsyncSession = Depends(get_db)) -> Candidate:
+    """
+    Creates a new candidate. The email must be unique.
+
+    The row is written with a single `INSERT ... RETURNING`; a duplicate email
+    is reported by the UNIQUE constraint and mapped to 409 Conflict.
+    """
+    try:
+        stmt = insert(sqa_Candidate).values(**candidate.model_dump()).returning(sqa_Candidate)
+        new_candidate = (await db.execute(stmt)).scalar_one()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Candidate with email '{candidate.email}' already exists.",
+        )
+    created = Candidate.model_validate(new_candidate)
+    await db.commit()
+    return created
+
+
+@app.get("/candidates/", response_model=List[Candidate], tags=["Candidates"])
+async def get_all_candidates(
+    response: Response,
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+) -> List[sqa_Candidate]:
+    """
+    Retrieves a list of all candidates with cursor pagination.
+    """
+    stmt = apply_keyset_pagination(select(sqa_Candidate), sqa_Candidate.candidate_id, skip, limit, cursor)
+    rows = (await db.scalars(stmt)).all()
+    return trim_page(rows, sqa_Candidate.candidate_id, response, limit)
+
+
+@app.get("/candidates/{candidate_id}", response_model=Candidate, tags=["Candidates"])
+async def get_candidate(candidate_id: int, db: AsyncSession = Depends(get_db)) -> sqa_Candidate:
+    """
+    Retrieves a single candidate by their ID.
+    """
+    db_candidate = await db.get(sqa_Candidate, candidate_id)
+    if not db_candidate:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Candidate with ID {candidate_id} not found")
+    return db_candidate
+
+
+@app.put("/candidates/{candidate_id}", response_model=Candidate, tags=["Candidates"])
+async def update_candidate(
+    candidate_id: int, candidate_update: CandidateUpdate, db: AsyncSession = Depends(get_db)
+) -> Candidate:
+    """
+    Updates an existing candidate's details.
+
+    The change is applied with a single `UPDATE ... RETURNING`; a duplicate
+    email is reported by the UNIQUE constraint and mapped to 409 Conflict.
+    """
+    update_data = candidate_update.model_dump(exclude_unset=True)
+    if not update_data:
+        db_candidate = await db.get(sqa_Candidate, candidate_id)
+    else:
+        stmt = (
+            update(sqa_Candidate)
+            .where(sqa_Candidate.candidate_id == candidate_id)
+            .values(**update_data)
+            .returning(sqa_Candidate)
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            db_candidate = (await db.execute(stmt)).scalar_one_or_none()
+        except IntegrityError:
+            await db.rollback()
+            if 'email' not in update_data:
+                raise
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Candidate with email '{update_data['email']}' already exists.",
+            )
+    if not db_candidate:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Candidate with ID {candidate_id} not found")
+
+    updated = Candidate.model_validate(db_candidate)
+    await db.commit()
+    return updated
+
+
+@app.delete("/candidates/{candidate_id}", status_code=status.HTTP_204_NO_CONTENT, tags=["Candidates"])
+async def delete_candidate(candidate_id: int, db: AsyncSession = Depends(get_db)):
+    """
+    Deletes a candidate and all their associated data (applications, documents, etc.)
+    due to CASCADE constraints.
+    """
+    db_candidate = await db.get(sqa_Candidate, candidate_id)
+    if not db_candidate:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Candidate with ID {candidate_id} not found")
+    await db.delete(db_candidate)
+    await db.commit()
+    return
+
+
+# --- Job Endpoints ---
+
+@app.post("/jobs/", response_model=Job, status_code=status.HTTP_201_CREATED, tags=["Jobs"])
+async def create_job(job: JobCreate, db: AsyncSession = Depends(get_db)) -> sqa_Job:
+    """
+    Creates a new job posting. The creating user must exist.
+    """
+    creator = await db.get(sqa_User, job.created_by_user_id)
+    if not creator:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"User with ID {job.created_by_user_id} not found.",
+        )
+
+    new_job = sqa_Job(**job.model_dump())
+    db.add(new_job)
+    await db.commit()
+    await db.refresh(new_job)
+    return new_job
+
+
+@app.get("/jobs/", response_model=List[Job], tags=["Jobs"])
+async def get_all_jobs(
+    response: Response,
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+) -> List[sqa_Job]:
+    """
+    Retrieves a list of all jobs with cursor pagination.
+    """
+    stmt = apply_keyset_pagination(select(sqa_Job), sqa_Job.job_id, skip, limit, cursor)
+    rows = (await db.scalars(stmt)).all()
+    return trim_page(rows, sqa_Job.job_id, response, limit)
+
+
+@app.get("/jobs/{job_id}", response_model=Job, tags=["Jobs"])
+async def get_job(job_id: int, db: AsyncSession = Depends(get_db)) -> sqa_Job:
+    """
+    Retrieves a single job by its ID.
+    """
+    db_job = await db.get(sqa_Job, job_id)
+    if not db_job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Job with ID {job_id} not found")
+    return db_job
+
+
+# --- Application Endpoints ---
+
+@app.post("/applications/", response_model=Application, status_code=status.HTTP_201_CREATED, tags=["Applications"])
+async def create_application(application: ApplicationCreate, db: AsyncSession = Depends(get_db)) -> sqa_Application:
+    """
+    Creates a new job application. A candidate can only apply for a given job once.
+    """
+    # Check if foreign keys exist
+    if not await db.get(sqa_Job, application.job_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Job with ID {application.job_id} not found")
+    if not await db.get(sqa_Candidate, application.candidate_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Candidate with ID {application.candidate_id} not found")
+
+    new_application = sqa_Application(**application.model_dump())
+    db.add(new_application)
+    try:
+        await db.commit()
+        await db.refresh(new_application)
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Candidate {application.candidate_id} has already applied for job {application.job_id}.",
+        )
+    return new_application
+
+
+@app.get("/applications/", response_model=List[Application], tags=["Applications"])
+async def get_all_applications(
+    response: Response,
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    job_id: Optional[int] = None,
+    candidate_id: Optional[int] = None,
+    application_status: Optional[ApplicationStatus] = Query(None, alias="status"),
+    db: AsyncSession = Depends(get_db),
+) -> List[sqa_Application]:
+    """
+    Retrieves a list of applications with cursor pagination, optionally
+    filtered by `job_id`, `candidate_id` and `status`.
+    """
+    stmt = filter_applications(select(sqa_Application), job_id, candidate_id, application_status)
+    stmt = apply_keyset_pagination(stmt, sqa_Application.application_id, skip, limit, cursor)
+    rows = (await db.scalars(stmt)).all()
+    return trim_page(rows, sqa_Application.application_id, response, limit)
+
+
+@app.get("/applications/{application_id}", response_model=Application, tags=["Applications"])
+async def get_application(application_id: int, db: AsyncSession = Depends(get_db)) -> sqa_Application:
+    """
+    Retrieves a single application by its ID.
+    """
+    db_application = await db.get(sqa_Application, application_id)
+    if not db_application:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Application with ID {application_id} not found")
+    return db_application
+
+
+@app.put("/applications/{application_id}", response_model=Application, tags=["Applications"])
+async def update_application(
+    application_id: int, app_update: ApplicationUpdate, db: AsyncSession = Depends(get_db)
+) -> sqa_Application:
+    """
+    Updates the status of an application.
+    """
+    db_application = await db.get(sqa_Application, application_id)
+    if not db_application:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Application with ID {application_id} not found")
+
+    update_data = app_update.model_dump(exclude_unset=True)
+    for key, value in update_data.items():
+        setattr(db_application, key, value)
+
+    await db.commit()
+    await db.refresh(db_application)
+    return db_application
+
+
+@app.delete("/applications/{application_id}", status_code=status.HTTP_204_NO_CONTENT, tags=["Applications"])
+async def delete_application(application_id: int, db: AsyncSession = Depends(get_db)):
+    """
+    Deletes an application and all its associated data (documents, interviews, etc.)
+    due to CASCADE constraints.
+    """
+    db_application = await db.get(sqa_Application, application_id)
+    if not db_application:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Application with ID {application_id} not found")
+
+    await db.delete(db_application)
+    await db.commit()
+    return
+
+
+# --- Welcome Endpoint ---
+@app.get("/", include_in_schema=False)
+async def root():
+    """A simple welcome message for the API root."""
+    return {"message": "Welcome to the Hiring System API. Visit /docs for documentation."}
+
+
+# --- Runnable Main Block ---
+if __name__ == "__main__":
+    """
+    This block allows the script to be run directly, starting the Uvicorn server.
+    It's configured to run on port 8081 and be accessible from any network interface.
+    """
+    uvicorn.run(app, host="0.0.0.0", port=8081)
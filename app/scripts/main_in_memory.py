@@ -19,19 +19,57 @@ Key Features:
 - A runnable main block using Uvicorn.
 """
 
+import gc
+import logging
+import os
+import threading
 import uvicorn
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from enum import Enum
+from functools import lru_cache, wraps
+from operator import attrgetter
 from typing import List, Optional, Dict, Any, Set, Tuple
 
-from fastapi import FastAPI, HTTPException, status, Body
-from pydantic import BaseModel, Field, EmailStr, field_validator
+from fastapi import FastAPI, HTTPException, status, Body, Query
+from pydantic import BaseModel, ConfigDict, Field, EmailStr, field_validator
+
+from persistence import WriteAheadLog, log_segments, read_log, read_snapshot, write_snapshot
+
+logger = logging.getLogger(__name__)
+
+# --- Lifespan Event Handler ---
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Restores the latest snapshot and replays the write-ahead log before
+    serving, snapshots periodically while running, and takes a final
+    snapshot on shutdown.
+    """
+    global wal
+    if SNAPSHOT_PATH is None:
+        yield
+        return
+    recover()
+    stop = threading.Event()
+    snapshotter = threading.Thread(target=snapshot_periodically, args=(stop,), name="snapshotter", daemon=True)
+    snapshotter.start()
+    yield
+    stop.set()
+    snapshotter.join()
+    take_snapshot()
+    if wal is not None:
+        with db_lock:
+            wal.close()
+            wal = None
+
 
 # --- Application Setup ---
 app = FastAPI(
     title="Hiring System API",
     description="An API for managing a recruitment process, using an in-memory database.",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # --- In-Memory Database Simulation ---
@@ -55,9 +93,74 @@ db_junction: Dict[str, Set[Tuple[int, int]]] = {
     "interview_participants": set(),
 }
 
+# Hash indexes backing the UNIQUE email constraints: email -> primary key.
+# They turn each uniqueness check into a dict lookup instead of a table scan.
+db_email_index: Dict[str, Dict[str, int]] = {
+    "users": {},
+    "candidates": {},
+}
+
+# Hash index backing UNIQUE (job_id, candidate_id) on applications:
+# (job_id, candidate_id) -> application_id.
+db_application_index: Dict[Tuple[int, int], int] = {}
+
+# Foreign key columns of each table, mirroring the SQL schema.
+FOREIGN_KEY_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "jobs": ("created_by_user_id", "hiring_manager_user_id"),
+    "applications": ("job_id", "candidate_id"),
+    "documents": ("application_id",),
+    "interviews": ("application_id", "scheduled_by_user_id"),
+    "feedback": ("application_id", "user_id", "interview_id"),
+    "decision_logs": ("application_id", "user_id"),
+}
+
+# Reverse foreign key indexes: (table, column) -> {parent ID: {child IDs}}.
+# ON DELETE handling looks the children of a parent up here instead of
+# scanning the child tables, so a delete costs O(children), not O(rows).
+db_fk_index: Dict[Tuple[str, str], Dict[int, Set[int]]] = {
+    (table, column): {} for table, columns in FOREIGN_KEY_COLUMNS.items() for column in columns
+}
+
+# The same for junction tables: (junction, position in the tuple) -> {ID: {links}}.
+db_junction_index: Dict[Tuple[str, int], Dict[int, Set[Tuple[int, int]]]] = {
+    (name, position): {} for name in db_junction for position in (0, 1)
+}
+
 # Counters for auto-incrementing primary keys.
 id_counters: Dict[str, int] = {key: 0 for key in db.keys()}
 
+# Serializes writes, so every write endpoint runs as one unit and snapshots see
+# a consistent state. Reentrant, as cascades call other write helpers.
+db_lock = threading.RLock()
+
+# Number of row and link writes so far; lets snapshots skip an unchanged state.
+db_changes = 0
+
+# Write-ahead log every row and link write is recorded in, while the app is
+# serving with persistence enabled.
+wal: Optional[WriteAheadLog] = None
+
+
+def db_write(func):
+    """
+    Decorator running a write endpoint while holding `db_lock`, then waiting
+    until its log records are durable. The wait happens after the lock is
+    released, so concurrent requests share fsyncs (group commit).
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with db_lock:
+            log = wal
+            start = log.last_lsn if log is not None else 0
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                end = log.last_lsn if log is not None else 0
+        if end > start:
+            log.commit(end)
+        return result
+    return wrapper
+
 
 def get_next_id(table_name: str) -> int:
     """Generates a new auto-incrementing ID for a given table."""
@@ -69,6 +172,135 @@ def get_utc_now() -> str:
     """Returns the current UTC time in a standard ISO format string."""
     return datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
 
+# --- Row and Index Maintenance ---
+# Every write to `db` and `db_junction` goes through these helpers, which keep
+# the secondary indexes above in sync.
+
+def index_row(table: str, row_id: int, row: Any):
+    """Adds a row to the unique and reverse foreign key indexes of its table."""
+    for column in FOREIGN_KEY_COLUMNS.get(table, ()):
+        parent_id = getattr(row, column, None)
+        if parent_id is not None:
+            db_fk_index[(table, column)].setdefault(parent_id, set()).add(row_id)
+    if table in db_email_index:
+        update_email_index(table, row_id, None, row.email)
+    elif table == "applications":
+        db_application_index[(row.job_id, row.candidate_id)] = row_id
+
+
+def unindex_row(table: str, row_id: int, row: Any):
+    """Removes a row from the unique and reverse foreign key indexes of its table."""
+    for column in FOREIGN_KEY_COLUMNS.get(table, ()):
+        index = db_fk_index[(table, column)]
+        parent_id = getattr(row, column, None)
+        children = index.get(parent_id)
+        if children is not None:
+            children.discard(row_id)
+            if not children:
+                del index[parent_id]
+    if table in db_email_index:
+        update_email_index(table, row_id, row.email, None)
+    elif table == "applications" and db_application_index.get((row.job_id, row.candidate_id)) == row_id:
+        del db_application_index[(row.job_id, row.candidate_id)]
+
+
+def log_write(*record):
+    """Appends a write to the write-ahead log, if one is open."""
+    if wal is not None:
+        wal.append(record)
+
+
+def insert_row(table: str, row_id: int, row: Any):
+    """Stores a new row and indexes it."""
+    global db_changes
+    db_changes += 1
+    log_write("put", table, row_id, encode_row(table, row))
+    db[table][row_id] = row
+    index_row(table, row_id, row)
+
+
+def replace_row(table: str, row_id: int, row: Any):
+    """Replaces an existing row with an updated copy and reindexes it."""
+    global db_changes
+    db_changes += 1
+    log_write("put", table, row_id, encode_row(table, row))
+    unindex_row(table, row_id, db[table][row_id])
+    db[table][row_id] = row
+    index_row(table, row_id, row)
+
+
+def delete_row(table: str, row_id: int) -> Any:
+    """Removes a row and its index entries, returning the removed row."""
+    global db_changes
+    db_changes += 1
+    log_write("delete", table, row_id)
+    row = db[table].pop(row_id)
+    unindex_row(table, row_id, row)
+    return row
+
+
+def set_foreign_key_null(table: str, column: str, parent_id: int):
+    """Implements ON DELETE SET NULL: clears `column` on every row of `table` referencing `parent_id`."""
+    for row_id in children_of(table, column, parent_id):
+        replace_row(table, row_id, db[table][row_id].model_copy(update={column: None, "updated_at": get_utc_now()}))
+
+
+def children_of(table: str, column: str, parent_id: int) -> List[int]:
+    """
+    Returns the IDs of the rows of `table` whose `column` references `parent_id`.
+
+    The IDs are returned as a sorted list, so callers may delete the rows while
+    iterating over it.
+    """
+    return sorted(db_fk_index[(table, column)].get(parent_id, ()))
+
+
+def add_junction_link(name: str, link: Tuple[int, int]):
+    """Stores a junction table row and indexes it by both of its IDs."""
+    global db_changes
+    db_changes += 1
+    log_write("link", name, link)
+    db_junction[name].add(link)
+    for position, key in enumerate(link):
+        db_junction_index[(name, position)].setdefault(key, set()).add(link)
+
+
+def remove_junction_link(name: str, link: Tuple[int, int]):
+    """Removes a junction table row and its index entries."""
+    global db_changes
+    db_changes += 1
+    log_write("unlink", name, link)
+    db_junction[name].discard(link)
+    for position, key in enumerate(link):
+        index = db_junction_index[(name, position)]
+        links = index.get(key)
+        if links is not None:
+            links.discard(link)
+            if not links:
+                del index[key]
+
+
+def junction_links(name: str, position: int, key: int) -> List[Tuple[int, int]]:
+    """Returns the rows of a junction table whose ID at `position` is `key`, as a sorted list."""
+    return sorted(db_junction_index[(name, position)].get(key, ()))
+
+
+def rebuild_indexes():
+    """
+    Rebuilds every secondary index from `db` and `db_junction`, for use after
+    the tables were replaced wholesale rather than through the helpers above.
+    """
+    db_application_index.clear()
+    for index in (*db_email_index.values(), *db_fk_index.values(), *db_junction_index.values()):
+        index.clear()
+    for table, rows in db.items():
+        for row_id, row in rows.items():
+            index_row(table, row_id, row)
+    for name, links in db_junction.items():
+        for link in links:
+            for position, key in enumerate(link):
+                db_junction_index[(name, position)].setdefault(key, set()).add(link)
+
 # --- Enums for CHECK Constraints ---
 
 
@@ -167,13 +399,29 @@ def check_email_uniqueness(email: str, table: str, existing_id: Optional[int] =
     Raises:
         HTTPException: 409 Conflict if the email already exists.
     """
-    db_table = db.get(table, {})
-    for item_id, item in db_table.items():
-        if item.email == email and item_id != existing_id:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"A {table[:-1]} with email '{email}' already exists.",
-            )
+    item_id = db_email_index[table].get(email)
+    if item_id is not None and item_id != existing_id:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"A {table[:-1]} with email '{email}' already exists.",
+        )
+
+
+def update_email_index(table: str, item_id: int, old_email: Optional[str], new_email: Optional[str]):
+    """
+    Moves a record's entry in the email index of its table.
+
+    Args:
+        table: The name of the table ('users' or 'candidates').
+        item_id: The ID of the record.
+        old_email: The email the record was indexed under, or None for a new record.
+        new_email: The email to index the record under, or None for a deleted record.
+    """
+    index = db_email_index[table]
+    if old_email is not None and index.get(old_email) == item_id:
+        del index[old_email]
+    if new_email is not None:
+        index[new_email] = item_id
 
 
 def check_foreign_key_exists(fk_id: int, table_name: str):
@@ -196,6 +444,7 @@ def check_foreign_key_exists(fk_id: int, table_name: str):
 # --- User Endpoints ---
 
 @app.post("/users/", response_model=User, status_code=status.HTTP_201_CREATED, tags=["Users"])
+@db_write
 def create_user(user: UserCreate) -> User:
     """
     Creates a new user in the system.
@@ -221,7 +470,7 @@ def create_user(user: UserCreate) -> User:
         updated_at=now,
         **user.model_dump()
     )
-    db["users"][user_id] = new_user
+    insert_row("users", user_id, new_user)
     return new_user
 
 
@@ -260,6 +509,7 @@ def get_user(user_id: int) -> User:
 
 
 @app.put("/users/{user_id}", response_model=User, tags=["Users"])
+@db_write
 def update_user(user_id: int, user_update: UserUpdate) -> User:
     """
     Updates an existing user's details.
@@ -295,7 +545,7 @@ def update_user(user_id: int, user_update: UserUpdate) -> User:
 
     updated_user = db_user.model_copy(update=update_data)
     updated_user.updated_at = get_utc_now()
-    db["users"][user_id] = updated_user
+    replace_row("users", user_id, updated_user)
     return updated_user
 
 
@@ -312,45 +562,36 @@ def handle_user_deletion_constraints(user_id: int):
                      a RESTRICT constraint.
     """
     # ON DELETE RESTRICT checks
-    for job in db["jobs"].values():
-        if job.created_by_user_id == user_id:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Cannot delete user {user_id}. They are the creator of job {job.job_id}.",
-            )
-    for feedback_item in db["feedback"].values():
-        if feedback_item.user_id == user_id:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Cannot delete user {user_id}. They provided feedback {feedback_item.feedback_id}.",
-            )
-    for log in db["decision_logs"].values():
-        if log.user_id == user_id:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Cannot delete user {user_id}. They made decision {log.decision_log_id}.",
-            )
+    job_ids = children_of("jobs", "created_by_user_id", user_id)
+    if job_ids:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Cannot delete user {user_id}. They are the creator of job {job_ids[0]}.",
+        )
+    feedback_ids = children_of("feedback", "user_id", user_id)
+    if feedback_ids:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Cannot delete user {user_id}. They provided feedback {feedback_ids[0]}.",
+        )
+    decision_log_ids = children_of("decision_logs", "user_id", user_id)
+    if decision_log_ids:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Cannot delete user {user_id}. They made decision {decision_log_ids[0]}.",
+        )
 
     # ON DELETE SET NULL logic
-    for job in db["jobs"].values():
-        if job.hiring_manager_user_id == user_id:
-            job.hiring_manager_user_id = None
-            job.updated_at = get_utc_now()
-    for interview in db["interviews"].values():
-        if interview.scheduled_by_user_id == user_id:
-            interview.scheduled_by_user_id = None
-            interview.updated_at = get_utc_now()
+    set_foreign_key_null("jobs", "hiring_manager_user_id", user_id)
+    set_foreign_key_null("interviews", "scheduled_by_user_id", user_id)
 
     # ON DELETE CASCADE logic for junction table
-    participants_to_remove = [
-        (interview_id, u_id) for interview_id, u_id in db_junction["interview_participants"]
-        if u_id == user_id
-    ]
-    for participant in participants_to_remove:
-        db_junction["interview_participants"].remove(participant)
+    for participant in junction_links("interview_participants", 1, user_id):
+        remove_junction_link("interview_participants", participant)
 
 
 @app.delete("/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT, tags=["Users"])
+@db_write
 def delete_user(user_id: int):
     """
     Deletes a user from the system.
@@ -376,7 +617,7 @@ def delete_user(user_id: int):
 
     handle_user_deletion_constraints(user_id)
 
-    del db["users"][user_id]
+    delete_row("users", user_id)
     return
 
 
@@ -411,6 +652,7 @@ class Candidate(CandidateBase):
 
 
 @app.post("/candidates/", response_model=Candidate, status_code=status.HTTP_201_CREATED, tags=["Candidates"])
+@db_write
 def create_candidate(candidate: CandidateCreate) -> Candidate:
     """
     Creates a new candidate.
@@ -435,7 +677,7 @@ def create_candidate(candidate: CandidateCreate) -> Candidate:
         updated_at=now,
         **candidate.model_dump()
     )
-    db["candidates"][candidate_id] = new_candidate
+    insert_row("candidates", candidate_id, new_candidate)
     return new_candidate
 
 
@@ -474,6 +716,7 @@ def get_candidate(candidate_id: int) -> Candidate:
 
 
 @app.put("/candidates/{candidate_id}", response_model=Candidate, tags=["Candidates"])
+@db_write
 def update_candidate(candidate_id: int, candidate_update: CandidateUpdate) -> Candidate:
     """
     Updates an existing candidate's details.
@@ -505,7 +748,7 @@ def update_candidate(candidate_id: int, candidate_update: CandidateUpdate) -> Ca
 
     updated_candidate = db_candidate.model_copy(update=update_data)
     updated_candidate.updated_at = get_utc_now()
-    db["candidates"][candidate_id] = updated_candidate
+    replace_row("candidates", candidate_id, updated_candidate)
     return updated_candidate
 
 
@@ -520,25 +763,18 @@ def handle_candidate_deletion_cascades(candidate_id: int):
         candidate_id: The ID of the candidate being deleted.
     """
     # Cascade to candidate_skills
-    skills_to_remove = [
-        (c_id, s_id) for c_id, s_id in db_junction["candidate_skills"]
-        if c_id == candidate_id
-    ]
-    for skill_link in skills_to_remove:
-        db_junction["candidate_skills"].remove(skill_link)
+    for skill_link in junction_links("candidate_skills", 0, candidate_id):
+        remove_junction_link("candidate_skills", skill_link)
 
     # Cascade to applications
-    apps_to_delete = [
-        app_id for app_id, app in db["applications"].items()
-        if app.candidate_id == candidate_id
-    ]
-    for app_id in apps_to_delete:
+    for app_id in children_of("applications", "candidate_id", candidate_id):
         # This will trigger further cascades for documents, interviews, etc.
         handle_application_deletion_cascades(app_id)
-        del db["applications"][app_id]
+        delete_row("applications", app_id)
 
 
 @app.delete("/candidates/{candidate_id}", status_code=status.HTTP_204_NO_CONTENT, tags=["Candidates"])
+@db_write
 def delete_candidate(candidate_id: int):
     """
     Deletes a candidate and all their associated data.
@@ -559,7 +795,7 @@ def delete_candidate(candidate_id: int):
         )
 
     handle_candidate_deletion_cascades(candidate_id)
-    del db["candidates"][candidate_id]
+    delete_row("candidates", candidate_id)
     return
 
 # --- Job Models and Endpoints ---
@@ -616,15 +852,15 @@ def check_application_uniqueness(job_id: int, candidate_id: int):
     Raises:
         HTTPException: 409 Conflict if the application already exists.
     """
-    for app in db["applications"].values():
-        if app.job_id == job_id and app.candidate_id == candidate_id:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Candidate {candidate_id} has already applied for job {job_id}.",
-            )
+    if (job_id, candidate_id) in db_application_index:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Candidate {candidate_id} has already applied for job {job_id}.",
+        )
 
 
 @app.post("/applications/", response_model=Application, status_code=status.HTTP_201_CREATED, tags=["Applications"])
+@db_write
 def create_application(application: ApplicationCreate) -> Application:
     """
     Creates a new job application.
@@ -653,14 +889,39 @@ def create_application(application: ApplicationCreate) -> Application:
         updated_at=now,
         **application.model_dump()
     )
-    db["applications"][application_id] = new_application
+    insert_row("applications", application_id, new_application)
     return new_application
 
 
 @app.get("/applications/", response_model=List[Application], tags=["Applications"])
-def get_all_applications() -> List[Application]:
-    """Retrieves all applications."""
-    return list(db["applications"].values())
+def get_all_applications(
+    job_id: Optional[int] = Query(None, description="Only return applications for this job."),
+    candidate_id: Optional[int] = Query(None, description="Only return applications by this candidate."),
+) -> List[Application]:
+    """
+    Retrieves all applications, optionally filtered by job and/or candidate.
+
+    Filters are answered from the indexes, without scanning the applications:
+    both filters together hit the `(job_id, candidate_id)` index, and a single
+    filter reads the reverse foreign key index of its column.
+
+    Args:
+        job_id: If given, only applications for this job are returned.
+        candidate_id: If given, only applications by this candidate are returned.
+
+    Returns:
+        A list of application objects, ordered by application ID.
+    """
+    if job_id is not None and candidate_id is not None:
+        application_id = db_application_index.get((job_id, candidate_id))
+        application_ids = [] if application_id is None else [application_id]
+    elif job_id is not None:
+        application_ids = children_of("applications", "job_id", job_id)
+    elif candidate_id is not None:
+        application_ids = children_of("applications", "candidate_id", candidate_id)
+    else:
+        return list(db["applications"].values())
+    return [db["applications"][application_id] for application_id in application_ids]
 
 
 @app.get("/applications/{application_id}", response_model=Application, tags=["Applications"])
@@ -687,6 +948,7 @@ def get_application(application_id: int) -> Application:
 
 
 @app.put("/applications/{application_id}", response_model=Application, tags=["Applications"])
+@db_write
 def update_application(application_id: int, app_update: ApplicationUpdate) -> Application:
     """
     Updates the status of an application.
@@ -714,7 +976,7 @@ def update_application(application_id: int, app_update: ApplicationUpdate) -> Ap
 
     updated_app = db_app.model_copy(update=update_data)
     updated_app.updated_at = get_utc_now()
-    db["applications"][application_id] = updated_app
+    replace_row("applications", application_id, updated_app)
     return updated_app
 
 
@@ -723,46 +985,35 @@ def handle_application_deletion_cascades(application_id: int):
     Handles cascading deletes when an application is removed.
 
     Deletes all associated documents, interviews (and their participants),
-    feedback, and decision logs.
+    feedback, and decision logs. Feedback of other applications that
+    referenced a deleted interview has its `interview_id` set to null.
 
     Args:
         application_id: The ID of the application being deleted.
     """
     # Cascade to documents
-    docs_to_delete = [doc_id for doc_id, doc in db["documents"].items() if doc.application_id == application_id]
-    for doc_id in docs_to_delete:
-        del db["documents"][doc_id]
+    for doc_id in children_of("documents", "application_id", application_id):
+        delete_row("documents", doc_id)
+
+    # Cascade to feedback
+    for f_id in children_of("feedback", "application_id", application_id):
+        delete_row("feedback", f_id)
 
     # Cascade to interviews
-    interviews_to_delete = [
-        iv_id for iv_id, iv in db["interviews"].items() if iv.application_id == application_id
-    ]
-    for iv_id in interviews_to_delete:
+    for iv_id in children_of("interviews", "application_id", application_id):
         # Cascade to interview_participants
-        participants_to_remove = [
-            (i_id, u_id) for i_id, u_id in db_junction["interview_participants"]
-            if i_id == iv_id
-        ]
-        for p in participants_to_remove:
-            db_junction["interview_participants"].remove(p)
-        del db["interviews"][iv_id]
-
-    # Cascade to feedback
-    feedback_to_delete = [
-        f_id for f_id, f in db["feedback"].items() if f.application_id == application_id
-    ]
-    for f_id in feedback_to_delete:
-        del db["feedback"][f_id]
+        for p in junction_links("interview_participants", 0, iv_id):
+            remove_junction_link("interview_participants", p)
+        set_foreign_key_null("feedback", "interview_id", iv_id)
+        delete_row("interviews", iv_id)
 
     # Cascade to decision_logs
-    logs_to_delete = [
-        log_id for log_id, log in db["decision_logs"].items() if log.application_id == application_id
-    ]
-    for log_id in logs_to_delete:
-        del db["decision_logs"][log_id]
+    for log_id in children_of("decision_logs", "application_id", application_id):
+        delete_row("decision_logs", log_id)
 
 
 @app.delete("/applications/{application_id}", status_code=status.HTTP_204_NO_CONTENT, tags=["Applications"])
+@db_write
 def delete_application(application_id: int):
     """
     Deletes an application and all its associated data.
@@ -782,10 +1033,268 @@ def delete_application(application_id: int):
         )
 
     handle_application_deletion_cascades(application_id)
-    del db["applications"][application_id]
+    delete_row("applications", application_id)
     return
 
 
+# --- Snapshot Persistence ---
+
+# File holding the latest snapshot; None disables persistence.
+SNAPSHOT_PATH: Optional[str] = os.path.join(os.path.dirname(os.path.abspath(__file__)), "in_memory_snapshot.pickle")
+
+# Path prefix of the write-ahead log segments, `<prefix>.<generation>`;
+# None keeps snapshots only, losing the writes made since the last one.
+WAL_PATH: Optional[str] = os.path.join(os.path.dirname(os.path.abspath(__file__)), "in_memory.wal")
+
+# Seconds between periodic snapshots. A snapshot is skipped if nothing changed.
+# Each one also compacts the write-ahead log.
+SNAPSHOT_INTERVAL_SECONDS = 300
+
+# Bumped whenever the layout of the snapshot state changes.
+SNAPSHOT_FORMAT_VERSION = 2
+
+# Older formats `restore_state` still reads. Format 1 pickled the rows of
+# tables without a model as objects.
+READABLE_SNAPSHOT_FORMATS = (1, SNAPSHOT_FORMAT_VERSION)
+
+# Tables whose rows are stored column by column as plain values. This is
+# compact, and a snapshot taken when the app runs as a script can be loaded
+# when it is imported by Uvicorn and vice versa.
+TABLE_MODELS: Dict[str, type] = {"users": User, "candidates": Candidate, "applications": Application}
+
+
+class Record(BaseModel):
+    """
+    A row of a table without a model in `TABLE_MODELS` (jobs, documents,
+    interviews, feedback, decision logs), with any fields. Snapshots and log
+    records store these rows as dicts of plain values and restore them as
+    `Record`s, so they do not depend on the class a row was created with.
+    """
+    model_config = ConfigDict(extra="allow")
+
+# `db_changes` when the last snapshot was taken or loaded.
+snapshot_changes = 0
+
+
+@lru_cache(maxsize=None)
+def enum_fields(model: type) -> Dict[str, type]:
+    """Returns the fields of a model whose type is an Enum, mapped to that type."""
+    return {
+        name: field.annotation
+        for name, field in model.model_fields.items()
+        if isinstance(field.annotation, type) and issubclass(field.annotation, Enum)
+    }
+
+
+def construct_rows(model: type, ids: List[int], columns: Dict[str, list]) -> Dict[int, Any]:
+    """
+    Rebuilds model instances from stored columns without validation, like
+    `model.model_construct` but without its per-field default handling, which
+    dominates restore time at a million rows. Every field is present in
+    `columns`, so the instances are the same as validated ones.
+    """
+    new, set_attribute = object.__new__, object.__setattr__
+    names = list(columns)
+    fields_set = set(names)
+    rows = {}
+    for row_id, values in zip(ids, zip(*columns.values())):
+        row = new(model)
+        set_attribute(row, "__dict__", dict(zip(names, values)))
+        set_attribute(row, "__pydantic_fields_set__", fields_set)
+        set_attribute(row, "__pydantic_extra__", None)
+        set_attribute(row, "__pydantic_private__", None)
+        rows[row_id] = row
+    return rows
+
+
+def capture_state() -> Dict[str, Any]:
+    """
+    Copies `db`, `db_junction` and `id_counters` into a picklable state.
+    Must be called while holding `db_lock`.
+
+    Returns:
+        A dict whose `tables` maps each table to its `ids` plus either
+        `columns` (field name -> list of values, with enums stored as their
+        values) or, for tables without a model here, `rows` (each one's
+        fields as a dict of plain values, see `encode_row`).
+    """
+    tables: Dict[str, Any] = {}
+    for table, rows in db.items():
+        model = TABLE_MODELS.get(table)
+        if model is None:
+            tables[table] = {"ids": list(rows), "rows": [encode_row(table, row) for row in rows.values()]}
+            continue
+        enums = enum_fields(model)
+        columns = {}
+        for name in model.model_fields:
+            values = list(map(attrgetter(name), rows.values()))
+            columns[name] = [getattr(value, "value", value) for value in values] if name in enums else values
+        tables[table] = {"ids": list(rows), "columns": columns}
+    return {
+        "version": SNAPSHOT_FORMAT_VERSION,
+        "taken_at": get_utc_now(),
+        "tables": tables,
+        "db_junction": {name: list(links) for name, links in db_junction.items()},
+        "id_counters": dict(id_counters),
+    }
+
+
+def restore_state(state: Dict[str, Any]):
+    """
+    Replaces `db`, `db_junction` and `id_counters` with a captured state and
+    rebuilds the secondary indexes. Must be called while holding `db_lock`.
+
+    Raises:
+        ValueError: If the state was written in an unknown format.
+    """
+    if state.get("version") not in READABLE_SNAPSHOT_FORMATS:
+        raise ValueError(f"Unsupported snapshot format {state.get('version')!r}.")
+    # Millions of new objects would trigger repeated full collections that find nothing to free.
+    gc.disable()
+    try:
+        for table, stored in state["tables"].items():
+            if "objects" in stored:
+                db[table] = stored["objects"]
+                continue
+            if "rows" in stored:
+                db[table] = {row_id: decode_row(table, values) for row_id, values in zip(stored["ids"], stored["rows"])}
+                continue
+            model = TABLE_MODELS[table]
+            columns = dict(stored["columns"])
+            for name, enum in enum_fields(model).items():
+                columns[name] = list(map(enum, columns[name]))
+            db[table] = construct_rows(model, stored["ids"], columns)
+        for name, links in state["db_junction"].items():
+            db_junction[name] = set(links)
+        id_counters.update(state["id_counters"])
+        rebuild_indexes()
+    finally:
+        gc.enable()
+
+
+def encode_row(table: str, row: Any) -> Dict[str, Any]:
+    """Returns a row as stored in snapshots and log records: a dict of plain values."""
+    model = TABLE_MODELS.get(table)
+    if model is None:
+        return row.model_dump(mode="json")
+    values = dict(row.__dict__)
+    for name in enum_fields(model):
+        values[name] = getattr(values[name], "value", values[name])
+    return values
+
+
+def decode_row(table: str, values: Any) -> Any:
+    """Rebuilds a row from the form `encode_row` stored it in."""
+    model = TABLE_MODELS.get(table)
+    if model is None:
+        return Record.model_construct(**values)
+    for name, enum in enum_fields(model).items():
+        values[name] = enum(values[name])
+    return model.model_construct(**values)
+
+
+def apply_log_record(record: tuple):
+    """
+    Replays one write-ahead log record. Records hold whole rows, so replaying
+    one the state already reflects is harmless.
+    """
+    operation, name, key, *values = record
+    if operation == "put":
+        row = decode_row(name, values[0])
+        if key in db[name]:
+            replace_row(name, key, row)
+        else:
+            insert_row(name, key, row)
+        id_counters[name] = max(id_counters[name], key)
+    elif operation == "delete":
+        if key in db[name]:
+            delete_row(name, key)
+    elif operation == "link":
+        add_junction_link(name, key)
+    elif operation == "unlink":
+        remove_junction_link(name, key)
+    else:
+        raise ValueError(f"Unknown log record {operation!r}.")
+
+
+def take_snapshot() -> bool:
+    """
+    Writes the current state to `SNAPSHOT_PATH` unless nothing changed since
+    the last snapshot, then compacts the write-ahead log. Only copying the
+    state and starting a new log segment hold `db_lock`; pickling and writing
+    the file do not block writes.
+
+    Returns:
+        True if a snapshot was written.
+    """
+    global snapshot_changes
+    with db_lock:
+        if db_changes == snapshot_changes:
+            return False
+        state = capture_state()
+        changes = db_changes
+        log = wal
+        # The snapshot covers every segment up to the one closed here.
+        state["wal_generation"] = log.rotate() if log is not None else 0
+    write_snapshot(SNAPSHOT_PATH, state)
+    snapshot_changes = changes
+    if log is not None:
+        log.remove_segments(state["wal_generation"])
+    return True
+
+
+def load_snapshot() -> int:
+    """
+    Restores the state stored at `SNAPSHOT_PATH`, if any.
+
+    Returns:
+        The generation of the last write-ahead log segment the snapshot
+        covers, or 0 if there is no snapshot.
+    """
+    global snapshot_changes
+    state = read_snapshot(SNAPSHOT_PATH)
+    if state is None:
+        return 0
+    with db_lock:
+        restore_state(state)
+        snapshot_changes = db_changes
+    return state.get("wal_generation", 0)
+
+
+def recover():
+    """
+    Restores the latest snapshot, replays the newer write-ahead log segments
+    on top of it, and opens a new segment for the writes to come. A crash
+    can leave a torn record at the end of the last segment; it was never
+    committed, and replay stops there.
+    """
+    global wal
+    generation = load_snapshot()
+    if WAL_PATH is None:
+        return
+    segments = log_segments(WAL_PATH)
+    with db_lock:
+        for segment_generation, path in segments:
+            if segment_generation > generation:
+                for record in read_log(path):
+                    apply_log_record(record)
+        wal = WriteAheadLog(WAL_PATH, max([generation, *(g for g, _ in segments)]) + 1)
+    wal.remove_segments(generation)
+
+
+def snapshot_periodically(stop: threading.Event):
+    """
+    Takes a snapshot every `SNAPSHOT_INTERVAL_SECONDS` until `stop` is set.
+    A failed snapshot is logged and retried at the next interval; until one
+    succeeds, the write-ahead log keeps every write since the last snapshot.
+    """
+    while not stop.wait(SNAPSHOT_INTERVAL_SECONDS):
+        try:
+            take_snapshot()
+        except Exception:
+            logger.exception("Snapshot to %s failed; retrying in %s s.", SNAPSHOT_PATH, SNAPSHOT_INTERVAL_SECONDS)
+
+
 # --- Welcome Endpoint ---
 @app.get("/", include_in_schema=False)
 def root():
@@ -15,6 +15,7 @@ from __future__ import annotations
 from sqlalchemy import (
     Column,
     ForeignKey,
+    Index,
     Integer,
     String,
     Table,
@@ -36,7 +37,15 @@ sqa_candidate_skills_table = Table(
     "candidate_skills",
     Base.metadata,
     Column("candidate_id", ForeignKey("candidates.candidate_id", ondelete="CASCADE"), primary_key=True),
-    Column("skill_id", ForeignKey("skills.skill_id", ondelete="CASCADE"), primary_key=True),
+    Column("skill_id", ForeignKey("skills.skill_id", ondelete="CASCADE"), primary_key=True, index=True),
+)
+
+# Association table for the many-to-many relationship between jobs and the skills they require
+sqa_job_skills_table = Table(
+    "job_skills",
+    Base.metadata,
+    Column("job_id", ForeignKey("jobs.job_id", ondelete="CASCADE"), primary_key=True),
+    Column("skill_id", ForeignKey("skills.skill_id", ondelete="CASCADE"), primary_key=True, index=True),
 )
 
 # Association table for the many-to-many relationship between interviews and users (participants)
@@ -44,7 +53,7 @@ sqa_interview_participants_table = Table(
     "interview_participants",
     Base.metadata,
     Column("interview_id", ForeignKey("interviews.interview_id", ondelete="CASCADE"), primary_key=True),
-    Column("user_id", ForeignKey("users.user_id", ondelete="CASCADE"), primary_key=True),
+    Column("user_id", ForeignKey("users.user_id", ondelete="CASCADE"), primary_key=True, index=True),
 )
 
 
@@ -104,8 +113,8 @@ class sqa_Job(Base):
     department: Mapped[str | None] = mapped_column(Text)
     location: Mapped[str | None] = mapped_column(Text)
     status: Mapped[str] = mapped_column(Text, nullable=False, server_default="open")
-    created_by_user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id", ondelete="RESTRICT"))
-    hiring_manager_user_id: Mapped[int | None] = mapped_column(ForeignKey("users.user_id", ondelete="SET NULL"))
+    created_by_user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id", ondelete="RESTRICT"), index=True)
+    hiring_manager_user_id: Mapped[int | None] = mapped_column(ForeignKey("users.user_id", ondelete="SET NULL"), index=True)
     created_at: Mapped[str] = mapped_column(
         Text, nullable=False, server_default=text("STRFTIME('%Y-%m-%d %H:%M:%S', 'now')")
     )
@@ -124,6 +133,9 @@ class sqa_Job(Base):
         "sqa_User", back_populates="jobs_managed", foreign_keys=[hiring_manager_user_id]
     )
     applications: Mapped[list["sqa_Application"]] = relationship("sqa_Application", back_populates="job")
+    skills: Mapped[list["sqa_Skill"]] = relationship(
+        "sqa_Skill", secondary=sqa_job_skills_table, back_populates="jobs"
+    )
 
 
 class sqa_Candidate(Base):
@@ -161,7 +173,7 @@ class sqa_Skill(Base):
     """
     ORM model for the 'skills' table.
 
-    Represents a skill that can be associated with a candidate.
+    Represents a skill that can be associated with a candidate or required by a job.
     """
 
     __tablename__ = "skills"
@@ -173,6 +185,9 @@ class sqa_Skill(Base):
     candidates: Mapped[list["sqa_Candidate"]] = relationship(
         "sqa_Candidate", secondary=sqa_candidate_skills_table, back_populates="skills"
     )
+    jobs: Mapped[list["sqa_Job"]] = relationship(
+        "sqa_Job", secondary=sqa_job_skills_table, back_populates="skills"
+    )
 
 
 class sqa_Application(Base):
@@ -186,9 +201,12 @@ class sqa_Application(Base):
     __table_args__ = (UniqueConstraint("job_id", "candidate_id"),)
 
     application_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    # job_id is the leading column of the (job_id, candidate_id) UNIQUE index, which
+    # already serves lookups by job, so it needs no index of its own.
     job_id: Mapped[int] = mapped_column(ForeignKey("jobs.job_id", ondelete="CASCADE"))
-    candidate_id: Mapped[int] = mapped_column(ForeignKey("candidates.candidate_id", ondelete="CASCADE"))
-    status: Mapped[str] = mapped_column(Text, nullable=False, server_default="applied")
+    candidate_id: Mapped[int] = mapped_column(ForeignKey("candidates.candidate_id", ondelete="CASCADE"), index=True)
+    # Filtered on by GET /applications/ and PATCH /applications/status.
+    status: Mapped[str] = mapped_column(Text, nullable=False, server_default="applied", index=True)
     applied_at: Mapped[str] = mapped_column(
         Text, nullable=False, server_default=text("STRFTIME('%Y-%m-%d %H:%M:%S', 'now')")
     )
@@ -218,7 +236,7 @@ class sqa_Document(Base):
     __tablename__ = "documents"
 
     document_id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    application_id: Mapped[int] = mapped_column(ForeignKey("applications.application_id", ondelete="CASCADE"))
+    application_id: Mapped[int] = mapped_column(ForeignKey("applications.application_id", ondelete="CASCADE"), index=True)
     type: Mapped[str] = mapped_column(Text)
     file_path: Mapped[str] = mapped_column(Text, unique=True)
     uploaded_at: Mapped[str] = mapped_column(
@@ -237,10 +255,11 @@ class sqa_Interview(Base):
     """
 
     __tablename__ = "interviews"
+    __table_args__ = (Index("ix_interviews_start_time_end_time", "start_time", "end_time"),)
 
     interview_id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    application_id: Mapped[int] = mapped_column(ForeignKey("applications.application_id", ondelete="CASCADE"))
-    scheduled_by_user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id", ondelete="SET NULL"))
+    application_id: Mapped[int] = mapped_column(ForeignKey("applications.application_id", ondelete="CASCADE"), index=True)
+    scheduled_by_user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id", ondelete="SET NULL"), index=True)
     interview_stage: Mapped[str] = mapped_column(Text)
     method: Mapped[str] = mapped_column(Text)
     location_or_link: Mapped[str | None] = mapped_column(Text)
@@ -278,9 +297,9 @@ class sqa_Feedback(Base):
     __tablename__ = "feedback"
 
     feedback_id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    application_id: Mapped[int] = mapped_column(ForeignKey("applications.application_id", ondelete="CASCADE"))
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id", ondelete="RESTRICT"))
-    interview_id: Mapped[int | None] = mapped_column(ForeignKey("interviews.interview_id", ondelete="SET NULL"))
+    application_id: Mapped[int] = mapped_column(ForeignKey("applications.application_id", ondelete="CASCADE"), index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id", ondelete="RESTRICT"), index=True)
+    interview_id: Mapped[int | None] = mapped_column(ForeignKey("interviews.interview_id", ondelete="SET NULL"), index=True)
     content: Mapped[str] = mapped_column(Text)
     created_at: Mapped[str] = mapped_column(
         Text, nullable=False, server_default=text("STRFTIME('%Y-%m-%d %H:%M:%S', 'now')")
@@ -302,8 +321,8 @@ class sqa_DecisionLog(Base):
     __tablename__ = "decision_logs"
 
     decision_log_id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    application_id: Mapped[int] = mapped_column(ForeignKey("applications.application_id", ondelete="CASCADE"))
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id", ondelete="RESTRICT"))
+    application_id: Mapped[int] = mapped_column(ForeignKey("applications.application_id", ondelete="CASCADE"), index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id", ondelete="RESTRICT"), index=True)
     decision: Mapped[str] = mapped_column(Text)
     reason: Mapped[str | None] = mapped_column(Text)
     created_at: Mapped[str] = mapped_column(
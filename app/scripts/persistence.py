@@ -0,0 +1,214 @@
+"""
+Durable storage for the in-memory backend (`main_in_memory.py`).
+
+Snapshots are whole-state pickles (protocol 5) written atomically: the state
+goes to a temporary file in the same directory, which is fsynced and then
+renamed over the previous snapshot with `os.replace`. A crash mid-write thus
+leaves the previous snapshot intact, never a torn file.
+
+Writes made between snapshots go to a write-ahead log (`WriteAheadLog`): an
+append-only sequence of records split into numbered segments. Taking a
+snapshot starts a new segment, and the segments the snapshot covers are
+deleted once it is on disk. On startup the snapshot is loaded and the newer
+segments are replayed on top of it.
+"""
+import glob
+import os
+import pickle
+import struct
+import threading
+import zlib
+from typing import Any, Iterator, List, Optional, Tuple
+
+PICKLE_PROTOCOL = 5
+
+# Log record framing: payload length and CRC-32, then the pickled payload.
+RECORD_HEADER = struct.Struct("<II")
+
+
+def fsync_directory(path: str) -> None:
+    """Makes a rename inside `path` durable. A no-op where directories cannot be opened (Windows)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_snapshot(path: str, state: Any) -> int:
+    """
+    Pickles `state` to `path` atomically.
+
+    Returns:
+        The size of the snapshot in bytes.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(state, f, protocol=PICKLE_PROTOCOL)
+        f.flush()
+        os.fsync(f.fileno())
+        size = f.tell()
+    os.replace(tmp_path, path)
+    fsync_directory(os.path.dirname(os.path.abspath(path)))
+    return size
+
+
+def read_snapshot(path: str) -> Optional[Any]:
+    """Returns the state stored at `path`, or None if no snapshot was written yet."""
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def log_segments(prefix: str) -> List[Tuple[int, str]]:
+    """Returns the `(generation, path)` of every log segment named `<prefix>.<generation>`, oldest first."""
+    segments = []
+    for path in glob.glob(f"{glob.escape(prefix)}.*"):
+        suffix = path[len(prefix) + 1:]
+        if suffix.isdigit():
+            segments.append((int(suffix), path))
+    return sorted(segments)
+
+
+def read_log(path: str) -> Iterator[Any]:
+    """
+    Yields the records of a log segment in order. Reading stops at the first
+    incomplete or corrupt record: the tail of a write cut short by a crash,
+    which was never acknowledged as committed.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    offset = 0
+    while offset + RECORD_HEADER.size <= len(data):
+        length, checksum = RECORD_HEADER.unpack_from(data, offset)
+        start = offset + RECORD_HEADER.size
+        payload = data[start:start + length]
+        if len(payload) < length or zlib.crc32(payload) != checksum:
+            return
+        yield pickle.loads(payload)
+        offset = start + length
+
+
+class WriteAheadLog:
+    """
+    An append-only log of records with group commit.
+
+    `append` only buffers a record in memory; `commit` makes it durable.
+    Commits share fsyncs: the committer that finds no flush in progress
+    writes and fsyncs everything buffered so far, including the records of
+    every thread waiting behind it, so under load one fsync covers a whole
+    batch of writes instead of one each.
+
+    Args:
+        prefix: Path prefix of the segment files, `<prefix>.<generation>`.
+        generation: Generation of the segment to start appending to. It
+            should be newer than every existing segment.
+    """
+
+    def __init__(self, prefix: str, generation: int):
+        self.prefix = prefix
+        self._cond = threading.Condition()
+        self._buffer = bytearray()
+        self._flushing = False
+        self._error: Optional[BaseException] = None
+        self.last_lsn = 0  # Sequence number of the last appended record.
+        self.durable_lsn = 0  # Sequence number of the last record on disk.
+        self.fsyncs = 0
+        self._open(generation)
+
+    def _open(self, generation: int) -> None:
+        self.generation = generation
+        self._file = open(f"{self.prefix}.{generation:08d}", "ab")
+        fsync_directory(os.path.dirname(os.path.abspath(self.prefix)))
+
+    def _write(self, data: bytes) -> None:
+        self._file.write(data)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.fsyncs += 1
+
+    def append(self, record: Any) -> int:
+        """Buffers a record and returns its sequence number. The record is not durable until committed."""
+        payload = pickle.dumps(record, protocol=PICKLE_PROTOCOL)
+        frame = RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+        with self._cond:
+            self._buffer += frame
+            self.last_lsn += 1
+            return self.last_lsn
+
+    def commit(self, lsn: int) -> None:
+        """
+        Blocks until every record up to `lsn` has been written and fsynced.
+
+        Raises:
+            OSError: If writing the log failed, now or in an earlier commit.
+                A failed fsync may have dropped data the kernel reported as
+                written, so the log refuses further commits instead of retrying.
+        """
+        with self._cond:
+            while self.durable_lsn < lsn:
+                if self._error is not None:
+                    raise OSError("The write-ahead log failed; restart to recover.") from self._error
+                if self._flushing:
+                    self._cond.wait()
+                    continue
+                self._flushing = True
+                data, upto, self._buffer = bytes(self._buffer), self.last_lsn, bytearray()
+                self._cond.release()
+                try:
+                    self._write(data)
+                except BaseException as exc:
+                    self._error = exc
+                    raise
+                else:
+                    self.durable_lsn = upto
+                finally:
+                    self._cond.acquire()
+                    self._flushing = False
+                    self._cond.notify_all()
+
+    def rotate(self) -> int:
+        """
+        Commits every buffered record, then continues in a new segment.
+
+        Returns:
+            The generation of the segment that was closed.
+
+        Raises:
+            OSError: If writing the log failed, now or in an earlier commit,
+                as for `commit`.
+        """
+        with self._cond:
+            while self._flushing:
+                self._cond.wait()
+            if self._error is not None:
+                raise OSError("The write-ahead log failed; restart to recover.") from self._error
+            try:
+                self._write(bytes(self._buffer))
+            except BaseException as exc:
+                self._error = exc
+                raise
+            self._buffer.clear()
+            self.durable_lsn = self.last_lsn
+            self._file.close()
+            closed = self.generation
+            self._open(closed + 1)
+            return closed
+
+    def remove_segments(self, up_to: int) -> None:
+        """Deletes the segments of generation `up_to` and older, once a snapshot covers them."""
+        for generation, path in log_segments(self.prefix):
+            if generation <= up_to and generation != self.generation:
+                os.remove(path)
+
+    def close(self) -> None:
+        """Commits every buffered record and closes the current segment."""
+        self.commit(self.last_lsn)
+        self._file.close()
@@ -10,6 +10,18 @@ import json
 # API base URL
 API_BASE_URL = "http://localhost:8081"
 
+# Rows per bulk create request; the API rejects batches over MAX_BULK_ROWS (1000).
+BULK_BATCH_SIZE = 1000
+
+def post_in_batches(path, rows):
+    """POSTs `rows` to a bulk create endpoint in batches and returns the per-row results in order."""
+    results = []
+    for start in range(0, len(rows), BULK_BATCH_SIZE):
+        response = requests.post(f"{API_BASE_URL}{path}", json=rows[start:start + BULK_BATCH_SIZE])
+        response.raise_for_status()
+        results.extend(response.json())
+    return results
+
 def create_test_data():
     """Create test users, jobs, candidates, and applications."""
     
@@ -257,14 +269,12 @@ def create_test_data():
     try:
         # Create users
         print("Creating users...")
-        for user in users:
-            response = requests.post(f"{API_BASE_URL}/users/", json=user)
-            if response.status_code == 201:
-                created_user = response.json()
-                created_users.append(created_user)
+        for user, result in zip(users, post_in_batches("/users/bulk", users)):
+            if result["status_code"] == 201:
+                created_users.append(result)
                 print(f"✓ Created user: {user['first_name']} {user['last_name']}")
             else:
-                print(f"✗ Failed to create user {user['first_name']} {user['last_name']}: {response.text}")
+                print(f"✗ Failed to create user {user['first_name']} {user['last_name']}: {result['detail']}")
         
         # Create jobs
         print("\nCreating jobs...")
@@ -279,14 +289,12 @@ def create_test_data():
         
         # Create candidates
         print("\nCreating candidates...")
-        for candidate in candidates:
-            response = requests.post(f"{API_BASE_URL}/candidates/", json=candidate)
-            if response.status_code == 201:
-                created_candidate = response.json()
-                created_candidates.append(created_candidate)
+        for candidate, result in zip(candidates, post_in_batches("/candidates/bulk", candidates)):
+            if result["status_code"] == 201:
+                created_candidates.append(result)
                 print(f"✓ Created candidate: {candidate['first_name']} {candidate['last_name']}")
             else:
-                print(f"✗ Failed to create candidate {candidate['first_name']} {candidate['last_name']}: {response.text}")
+                print(f"✗ Failed to create candidate {candidate['first_name']} {candidate['last_name']}: {result['detail']}")
         
         # Create applications (candidates applying to jobs with diverse statuses)
         print("\nCreating applications...")
@@ -389,12 +397,11 @@ def create_test_data():
             {"job_id": 15, "candidate_id": 12, "status": "applied"},
         ]
         
-        for app in applications:
-            response = requests.post(f"{API_BASE_URL}/applications/", json=app)
-            if response.status_code == 201:
+        for app, result in zip(applications, post_in_batches("/applications/bulk", applications)):
+            if result["status_code"] == 201:
                 print(f"✓ Created application: Candidate {app['candidate_id']} -> Job {app['job_id']}")
             else:
-                print(f"✗ Failed to create application: {response.text}")
+                print(f"✗ Failed to create application: {result['detail']}")
         
         print(f"\n🎉 Test data creation complete!")
         print(f"Created {len(created_users)} users, {len(created_jobs)} jobs, {len(created_candidates)} candidates")
@@ -2,7 +2,9 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from main import app, get_db, Base
+from sqlalchemy import text
+from main import app, get_db, Base, ENTITY_CACHE, INTERVIEW_INDEX, SKILL_INDEX
+from database import apply_sqlite_pragmas
 
 # Set up the test database
 SQLALCHEMY_DATABASE_URL = "sqlite:///./recruitment_app.db"
@@ -27,9 +29,12 @@ client = TestClient(app)
 
 @pytest.fixture(autouse=True)
 def run_around_tests():
-    # Before each test, clear the database
+    # Before each test, clear the database and the rows cached from it
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    ENTITY_CACHE.clear()
+    SKILL_INDEX.clear()
+    INTERVIEW_INDEX.clear()
     yield
     # After each test, clear the database
     Base.metadata.drop_all(bind=engine)
@@ -158,5 +163,1119 @@ def test_create_and_get_application():
     assert response.status_code == 200
     assert response.json()["status"] == "applied"
 
+def test_user_email_conflicts_map_to_409():
+    payload = {"first_name": "Ivy", "last_name": "Jones", "email": "ivy.jones@example.com", "role": "HR Manager"}
+    assert client.post("/users/", json=payload).status_code == 201
+    assert client.post("/users/", json=payload).status_code == 409
+
+    response = client.post("/users/", json={**payload, "email": "ivy.other@example.com"})
+    user_id = response.json()["user_id"]
+
+    response = client.put(f"/users/{user_id}", json={"email": "ivy.jones@example.com"})
+    assert response.status_code == 409
+    response = client.put(f"/users/{user_id}", json={"last_name": "Other"})
+    assert response.status_code == 200
+    assert response.json()["last_name"] == "Other"
+    assert response.json()["email"] == "ivy.other@example.com"
+    assert client.put(f"/users/{user_id}", json={}).status_code == 200
+    assert client.put("/users/9999", json={"last_name": "Nobody"}).status_code == 404
+
+def test_get_all_candidates_cursor_pagination():
+    # Create five candidates
+    for i in range(5):
+        response = client.post(
+            "/candidates/",
+            json={
+                "first_name": "Page",
+                "last_name": f"Candidate{i}",
+                "email": f"page.candidate{i}@example.com",
+            },
+        )
+        assert response.status_code == 201
+
+    # Walk the list two at a time using the cursor header
+    seen = []
+    response = client.get("/candidates/", params={"limit": 2})
+    while True:
+        assert response.status_code == 200
+        seen.extend(c["candidate_id"] for c in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        response = client.get("/candidates/", params={"limit": 2, "cursor": cursor})
+
+    assert len(seen) == 5
+    assert seen == sorted(seen)
+
+    # A malformed cursor is rejected
+    response = client.get("/candidates/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+    # Page sizes outside 1..MAX_PAGE_SIZE are rejected rather than returning a look-ahead row.
+    from main import MAX_PAGE_SIZE
+
+    for limit in (0, -1, MAX_PAGE_SIZE + 1):
+        assert client.get("/candidates/", params={"limit": limit}).status_code == 422
+    response = client.get("/candidates/", params={"limit": 1})
+    assert len(response.json()) == 1
+    assert "X-Next-Cursor" in response.headers
+    assert len(client.get("/candidates/", params={"limit": MAX_PAGE_SIZE}).json()) == 5
+
+def test_filter_applications_by_job_and_status():
+    response = client.post(
+        "/users/",
+        json={
+            "first_name": "Carol",
+            "last_name": "White",
+            "email": "carol.white@example.com",
+            "role": "Hiring Manager",
+        },
+    )
+    user_id = response.json()["user_id"]
+
+    job_ids = []
+    for title in ("Backend Engineer", "Frontend Engineer"):
+        response = client.post(
+            "/jobs/",
+            json={"title": title, "description": "Build things.", "created_by_user_id": user_id},
+        )
+        job_ids.append(response.json()["job_id"])
+
+    response = client.post(
+        "/candidates/",
+        json={"first_name": "Dan", "last_name": "Green", "email": "dan.green@example.com"},
+    )
+    candidate_id = response.json()["candidate_id"]
+
+    client.post("/applications/", json={"job_id": job_ids[0], "candidate_id": candidate_id})
+    client.post(
+        "/applications/",
+        json={"job_id": job_ids[1], "candidate_id": candidate_id, "status": "screening"},
+    )
+
+    response = client.get("/applications/", params={"job_id": job_ids[0]})
+    assert response.status_code == 200
+    assert [a["job_id"] for a in response.json()] == [job_ids[0]]
+
+    response = client.get("/applications/", params={"candidate_id": candidate_id, "status": "screening"})
+    assert [a["job_id"] for a in response.json()] == [job_ids[1]]
+
+def test_dashboard_jobs_counts_applicants_by_status():
+    response = client.post(
+        "/users/",
+        json={
+            "first_name": "Erin",
+            "last_name": "Black",
+            "email": "erin.black@example.com",
+            "role": "HR Manager",
+        },
+    )
+    user_id = response.json()["user_id"]
+
+    response = client.post(
+        "/jobs/",
+        json={"title": "Staffed Job", "description": "Has applicants.", "created_by_user_id": user_id},
+    )
+    staffed_job_id = response.json()["job_id"]
+    response = client.post(
+        "/jobs/",
+        json={"title": "Empty Job", "description": "No applicants.", "created_by_user_id": user_id},
+    )
+    empty_job_id = response.json()["job_id"]
+
+    for i, app_status in enumerate(["applied", "interviewing", "interviewing"]):
+        response = client.post(
+            "/candidates/",
+            json={"first_name": "Cand", "last_name": str(i), "email": f"dash.cand{i}@example.com"},
+        )
+        client.post(
+            "/applications/",
+            json={
+                "job_id": staffed_job_id,
+                "candidate_id": response.json()["candidate_id"],
+                "status": app_status,
+            },
+        )
+
+    response = client.get("/dashboard/jobs")
+    assert response.status_code == 200
+    summaries = {job["job_id"]: job for job in response.json()}
+    assert summaries[staffed_job_id]["applicant_count"] == 3
+    assert summaries[staffed_job_id]["status_counts"]["interviewing"] == 2
+    assert summaries[staffed_job_id]["status_counts"]["hired"] == 0
+    assert summaries[empty_job_id]["applicant_count"] == 0
+
+def test_get_job_applicants_includes_candidates():
+    response = client.post(
+        "/users/",
+        json={
+            "first_name": "Frank",
+            "last_name": "Gray",
+            "email": "frank.gray@example.com",
+            "role": "Hiring Manager",
+        },
+    )
+    user_id = response.json()["user_id"]
+    response = client.post(
+        "/jobs/",
+        json={"title": "QA Engineer", "description": "Test things.", "created_by_user_id": user_id},
+    )
+    job_id = response.json()["job_id"]
+    response = client.post(
+        "/candidates/",
+        json={"first_name": "Gina", "last_name": "Hall", "email": "gina.hall@example.com"},
+    )
+    candidate_id = response.json()["candidate_id"]
+    client.post("/applications/", json={"job_id": job_id, "candidate_id": candidate_id})
+
+    response = client.get(f"/jobs/{job_id}/applicants")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["title"] == "QA Engineer"
+    assert len(body["applications"]) == 1
+    assert body["applications"][0]["candidate"]["email"] == "gina.hall@example.com"
+
+    response = client.get("/jobs/9999/applicants")
+    assert response.status_code == 404
+
+def test_sqlite_pragmas_applied_per_connection(tmp_path):
+    pragma_engine = create_engine(f"sqlite:///{tmp_path / 'pragmas.db'}")
+    apply_sqlite_pragmas(pragma_engine)
+    with pragma_engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+    pragma_engine.dispose()
+
+def test_bulk_create_candidates_and_applications():
+    client.post(
+        "/candidates/",
+        json={"first_name": "Existing", "last_name": "One", "email": "existing@example.com"},
+    )
+    response = client.post(
+        "/candidates/bulk",
+        json=[
+            {"first_name": "Bulk", "last_name": "A", "email": "bulk.a@example.com"},
+            {"first_name": "Bulk", "last_name": "B", "email": "existing@example.com"},
+            {"first_name": "Bulk", "last_name": "C", "email": "bulk.a@example.com"},
+            {"first_name": "Bulk", "last_name": "D", "email": "bulk.d@example.com"},
+        ],
+    )
+    assert response.status_code == 200
+    results = response.json()
+    assert [r["status_code"] for r in results] == [201, 409, 409, 201]
+    candidate_ids = [results[0]["id"], results[3]["id"]]
+    assert client.get(f"/candidates/{candidate_ids[1]}").json()["last_name"] == "D"
+
+    response = client.post(
+        "/users/bulk",
+        json=[{"first_name": "Bulk", "last_name": "User", "email": "bulk.user@example.com", "role": "HR Manager"}],
+    )
+    user_id = response.json()[0]["id"]
+    response = client.post(
+        "/jobs/",
+        json={"title": "Bulk Job", "description": "Bulk hiring.", "created_by_user_id": user_id},
+    )
+    job_id = response.json()["job_id"]
+
+    response = client.post(
+        "/applications/bulk",
+        json=[
+            {"job_id": job_id, "candidate_id": candidate_ids[0]},
+            {"job_id": job_id, "candidate_id": candidate_ids[1], "status": "screening"},
+            {"job_id": job_id, "candidate_id": candidate_ids[0]},
+            {"job_id": 9999, "candidate_id": candidate_ids[0]},
+        ],
+    )
+    assert [r["status_code"] for r in response.json()] == [201, 201, 409, 404]
+    response = client.get("/applications/", params={"job_id": job_id, "status": "screening"})
+    assert [a["candidate_id"] for a in response.json()] == [candidate_ids[1]]
+
+    # Batches over MAX_BULK_ROWS are rejected as a whole.
+    from main import MAX_BULK_ROWS
+
+    rows = [{"first_name": "Too", "last_name": "Many", "email": f"many{i}@example.com"} for i in range(MAX_BULK_ROWS + 1)]
+    assert client.post("/candidates/bulk", json=rows).status_code == 422
+    assert client.get("/candidates/", params={"limit": MAX_BULK_ROWS}).json()[-1]["last_name"] == "D"
+    response = client.post("/candidates/bulk", json=rows[:MAX_BULK_ROWS])
+    assert [r["status_code"] for r in response.json()] == [201] * MAX_BULK_ROWS
+
+def test_bulk_status_transition_writes_decision_logs():
+    from main import sqa_DecisionLog
+
+    response = client.post(
+        "/users/",
+        json={"first_name": "Hank", "last_name": "Ives", "email": "hank.ives@example.com", "role": "HR Manager"},
+    )
+    user_id = response.json()["user_id"]
+    response = client.post(
+        "/jobs/",
+        json={"title": "Support Agent", "description": "Help customers.", "created_by_user_id": user_id},
+    )
+    job_id = response.json()["job_id"]
+    response = client.post(
+        "/candidates/bulk",
+        json=[{"first_name": "Status", "last_name": str(i), "email": f"status{i}@example.com"} for i in range(4)],
+    )
+    candidate_ids = [r["id"] for r in response.json()]
+    client.post(
+        "/applications/bulk",
+        json=[
+            {"job_id": job_id, "candidate_id": candidate_id, "status": "screening" if i < 3 else "applied"}
+            for i, candidate_id in enumerate(candidate_ids)
+        ],
+    )
+
+    response = client.patch(
+        "/applications/status",
+        json={
+            "job_id": job_id,
+            "current_status": "screening",
+            "status": "rejected",
+            "decision": "reject",
+            "decided_by_user_id": user_id,
+            "reason": "Position filled.",
+        },
+    )
+    assert response.status_code == 200
+    assert response.json()["updated"] == 3
+
+    response = client.get("/applications/", params={"job_id": job_id, "status": "rejected"})
+    assert len(response.json()) == 3
+    with TestingSessionLocal() as db:
+        assert db.query(sqa_DecisionLog).filter(sqa_DecisionLog.decision == "reject").count() == 3
+
+    # Applications already in the target status are not transitioned again
+    applied_ids = [a["application_id"] for a in client.get("/applications/", params={"status": "applied"}).json()]
+    response = client.patch(
+        "/applications/status",
+        json={"job_id": job_id, "status": "rejected", "decision": "reject", "decided_by_user_id": user_id},
+    )
+    assert response.json()["updated"] == 1
+    assert response.json()["application_ids"] == applied_ids
+    with TestingSessionLocal() as db:
+        assert db.query(sqa_DecisionLog).filter(sqa_DecisionLog.decision == "reject").count() == 4
+
+    # Refuses to run without any selection
+    response = client.patch("/applications/status", json={"status": "hired"})
+    assert response.status_code == 422
+
+def test_export_table_as_ndjson_and_csv():
+    import csv
+    import io
+    import json
+
+    client.post(
+        "/candidates/bulk",
+        json=[{"first_name": "Export", "last_name": str(i), "email": f"export{i}@example.com"} for i in range(3)],
+    )
+
+    response = client.get("/export/candidates")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["email"] for row in rows] == [f"export{i}@example.com" for i in range(3)]
+
+    response = client.get("/export/candidates", params={"format": "csv"})
+    assert response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["last_name"] for row in rows] == ["0", "1", "2"]
+
+    assert client.get("/export/not_a_table").status_code == 404
+
+def test_fast_list_matches_pydantic_serialization(monkeypatch):
+    import main
+
+    response = client.post(
+        "/users/",
+        json={"first_name": "Fast", "last_name": "Path", "email": "fast.path@example.com", "role": "HR Manager"},
+    )
+    assert response.status_code == 201
+    detail = client.get(f"/users/{response.json()['user_id']}").json()
+
+    # The list rows skip Pydantic but serialize exactly like the detail endpoint.
+    assert client.get("/users/").json() == [detail]
+
+    # Without orjson the standard library encoder produces the same body.
+    monkeypatch.setattr(main, "orjson", None)
+    assert client.get("/users/").json() == [detail]
+
+def test_sparse_fieldsets_on_list_and_get():
+    user_id = client.post(
+        "/users/",
+        json={"first_name": "Sparse", "last_name": "Fields", "email": "sparse@example.com", "role": "HR Manager"},
+    ).json()["user_id"]
+    for i in range(3):
+        client.post("/jobs/", json={"title": f"Job {i}", "description": "Long text.", "created_by_user_id": user_id})
+
+    # The primary key is always returned so pagination keeps working.
+    response = client.get("/jobs/", params={"fields": "title", "limit": 2})
+    assert response.status_code == 200
+    assert [set(job) for job in response.json()] == [{"job_id", "title"}] * 2
+    response = client.get("/jobs/", params={"fields": "title", "cursor": response.headers["X-Next-Cursor"]})
+    assert [job["title"] for job in response.json()] == ["Job 2"]
+
+    response = client.get(f"/users/{user_id}", params={"fields": "email,role"})
+    assert response.json() == {"user_id": user_id, "email": "sparse@example.com", "role": "HR Manager"}
+    assert client.get("/users/999", params={"fields": "email"}).status_code == 404
+    assert client.get("/jobs/", params={"fields": "title,salary"}).status_code == 400
+
+def test_conditional_get_returns_304_until_data_changes():
+    from datetime import datetime, timezone
+    from email.utils import format_datetime
+
+    user_id = client.post(
+        "/users/",
+        json={"first_name": "Etag", "last_name": "User", "email": "etag@example.com", "role": "HR Manager"},
+    ).json()["user_id"]
+    job_id = client.post(
+        "/jobs/", json={"title": "Cached job", "description": "Text.", "created_by_user_id": user_id}
+    ).json()["job_id"]
+
+    for path in ("/jobs/", f"/jobs/{job_id}"):
+        response = client.get(path)
+        etag = response.headers["ETag"]
+
+        response = client.get(path, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+
+    # Only single resources are validated by date; deletes don't advance a list's max(updated_at).
+    last_modified = client.get(f"/jobs/{job_id}").headers["Last-Modified"]
+    assert client.get(f"/jobs/{job_id}", headers={"If-Modified-Since": last_modified}).status_code == 304
+    assert "Last-Modified" not in client.get("/jobs/").headers
+
+    # Query parameters are part of the ETag.
+    etag = client.get("/jobs/").headers["ETag"]
+    assert client.get("/jobs/", params={"fields": "title"}, headers={"If-None-Match": etag}).status_code == 200
+
+    # Any write invalidates it.
+    client.post("/jobs/", json={"title": "Another job", "description": "Text.", "created_by_user_id": user_id})
+    response = client.get("/jobs/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+
+    # So does a delete, even for a client revalidating by date.
+    candidate_ids = [
+        client.post(
+            "/candidates/", json={"first_name": "Etag", "last_name": str(i), "email": f"etag{i}@example.com"}
+        ).json()["candidate_id"]
+        for i in range(2)
+    ]
+    since = format_datetime(datetime.now(timezone.utc), usegmt=True)
+    client.delete(f"/candidates/{candidate_ids[0]}")
+    response = client.get("/candidates/", headers={"If-Modified-Since": since})
+    assert response.status_code == 200
+    assert [c["candidate_id"] for c in response.json()] == candidate_ids[1:]
+
+def test_read_through_cache_counts_hits_and_invalidates_on_write():
+    candidate_id = client.post(
+        "/candidates/", json={"first_name": "Cache", "last_name": "Me", "email": "cache@example.com"}
+    ).json()["candidate_id"]
+    before = client.get("/metrics/cache").json()
+
+    assert client.get(f"/candidates/{candidate_id}").json()["last_name"] == "Me"
+    assert client.get(f"/candidates/{candidate_id}").json()["last_name"] == "Me"
+    after = client.get("/metrics/cache").json()
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 1
+
+    # The PUT statement names the entry to drop on commit, so the next read sees the change.
+    client.put(f"/candidates/{candidate_id}", json={"last_name": "Updated"})
+    assert client.get(f"/candidates/{candidate_id}").json()["last_name"] == "Updated"
+
+    # Writes through the ORM session are caught by the after_commit hook.
+    from main import sqa_Candidate
+
+    db = TestingSessionLocal()
+    db.get(sqa_Candidate, candidate_id).last_name = "Session"
+    db.commit()
+    db.close()
+    assert client.get(f"/candidates/{candidate_id}").json()["last_name"] == "Session"
+
+    client.delete(f"/candidates/{candidate_id}")
+    assert client.get(f"/candidates/{candidate_id}").status_code == 404
+
+def test_put_invalidates_only_its_own_cache_entry():
+    user_ids = [
+        client.post(
+            "/users/",
+            json={"first_name": "Cached", "last_name": str(i), "email": f"cached{i}@example.com", "role": "HR Manager"},
+        ).json()["user_id"]
+        for i in range(3)
+    ]
+    for user_id in user_ids:
+        client.get(f"/users/{user_id}")
+    assert client.get("/metrics/cache").json()["size"] == 3
+
+    assert client.put(f"/users/{user_ids[0]}", json={"last_name": "Changed"}).status_code == 200
+    assert client.get("/metrics/cache").json()["size"] == 2
+    before = client.get("/metrics/cache").json()
+    assert client.get(f"/users/{user_ids[1]}").json()["last_name"] == "1"
+    assert client.get("/metrics/cache").json()["hits"] - before["hits"] == 1
+    assert client.get(f"/users/{user_ids[0]}").json()["last_name"] == "Changed"
+
+    # An untagged bulk update cannot name its rows and still drops the whole table.
+    from sqlalchemy import update
+    from main import sqa_User
+
+    db = TestingSessionLocal()
+    db.execute(update(sqa_User).values(last_name="Bulk"))
+    db.commit()
+    db.close()
+    assert client.get("/metrics/cache").json()["size"] == 0
+
+def test_full_text_search_ranks_and_tracks_writes():
+    user_id = client.post(
+        "/users/",
+        json={"first_name": "Search", "last_name": "Owner", "email": "search.owner@example.com", "role": "HR Manager"},
+    ).json()["user_id"]
+    for title, description in [
+        ("Backend Engineer", "Python services."),
+        ("Data Analyst", "Works with backend engineers on reporting."),
+        ("Designer", "Figma."),
+    ]:
+        client.post("/jobs/", json={"title": title, "description": description, "created_by_user_id": user_id})
+    client.post("/candidates/", json={"first_name": "Grace", "last_name": "Hopper", "email": "grace@example.com"})
+
+    # Title matches outrank description matches; words match as prefixes.
+    results = client.get("/search", params={"q": "engin"}).json()
+    assert [hit["title"] for hit in results["jobs"]] == ["Backend Engineer", "Data Analyst"]
+    assert "<mark>Engineer</mark>" in results["jobs"][0]["snippet"]
+    assert results["candidates"] == []
+
+    results = client.get("/search", params={"q": "hop"}).json()
+    assert [hit["email"] for hit in results["candidates"]] == ["grace@example.com"]
+
+    # FTS5 syntax in the input is searched literally rather than rejected.
+    assert client.get("/search", params={"q": 'engineer OR "('}).status_code == 200
+
+    # Triggers keep the index in sync with updates and deletes.
+    candidate_id = results["candidates"][0]["id"]
+    client.put(f"/candidates/{candidate_id}", json={"last_name": "Murray"})
+    assert client.get("/search", params={"q": "hopper"}).json()["candidates"] == []
+    assert client.get("/search", params={"q": "murray"}).json()["candidates"][0]["id"] == candidate_id
+    client.delete(f"/candidates/{candidate_id}")
+    assert client.get("/search", params={"q": "grace"}).json()["candidates"] == []
+
+def test_job_matches_rank_candidates_by_skill_overlap():
+    python, sql, docker = (
+        client.post("/skills/", json={"name": name}).json()["skill_id"] for name in ("Python", "SQL", "Docker")
+    )
+    assert client.post("/skills/", json={"name": "Python"}).status_code == 409
+
+    user_id = client.post(
+        "/users/",
+        json={"first_name": "Match", "last_name": "Maker", "email": "match@example.com", "role": "HR Manager"},
+    ).json()["user_id"]
+    job_id = client.post(
+        "/jobs/", json={"title": "Data Engineer", "description": "Pipelines.", "created_by_user_id": user_id}
+    ).json()["job_id"]
+    assert client.put(f"/jobs/{job_id}/skills", json={"skill_ids": [python, sql, docker]}).status_code == 200
+
+    candidate_ids = [
+        client.post(
+            "/candidates/", json={"first_name": "C", "last_name": str(i), "email": f"c{i}@example.com"}
+        ).json()["candidate_id"]
+        for i in range(3)
+    ]
+    client.put(f"/candidates/{candidate_ids[0]}/skills", json={"skill_ids": [python]})
+    client.put(f"/candidates/{candidate_ids[1]}/skills", json={"skill_ids": [python, sql, docker]})
+    assert client.put(f"/candidates/{candidate_ids[2]}/skills", json={"skill_ids": [999]}).status_code == 404
+
+    matches = client.get(f"/jobs/{job_id}/matches").json()
+    assert [(m["candidate"]["candidate_id"], m["overlap"]) for m in matches] == [(candidate_ids[1], 3), (candidate_ids[0], 1)]
+    assert matches[0]["score"] == 1.0
+
+    # Later skill changes and deletes are applied to the loaded index incrementally.
+    client.put(f"/candidates/{candidate_ids[2]}/skills", json={"skill_ids": [python, sql]})
+    client.put(f"/candidates/{candidate_ids[1]}/skills", json={"skill_ids": []})
+    client.delete(f"/candidates/{candidate_ids[0]}")
+    matches = client.get(f"/jobs/{job_id}/matches").json()
+    assert [(m["candidate"]["candidate_id"], m["matched_skill_ids"]) for m in matches] == [(candidate_ids[2], [python, sql])]
+    assert client.get(f"/jobs/{job_id}/matches", params={"min_overlap": 3}).json() == []
+
+def test_skill_changes_committed_during_index_load_are_kept(monkeypatch):
+    python = client.post("/skills/", json={"name": "Python"}).json()["skill_id"]
+    user_id = client.post(
+        "/users/",
+        json={"first_name": "Race", "last_name": "Loader", "email": "race@example.com", "role": "HR Manager"},
+    ).json()["user_id"]
+    job_id = client.post(
+        "/jobs/", json={"title": "Backend", "description": "APIs.", "created_by_user_id": user_id}
+    ).json()["job_id"]
+    client.put(f"/jobs/{job_id}/skills", json={"skill_ids": [python]})
+    candidate_id = client.post(
+        "/candidates/", json={"first_name": "Late", "last_name": "Skill", "email": "late@example.com"}
+    ).json()["candidate_id"]
+
+    load = SKILL_INDEX.load
+
+    def load_then_commit(pairs):
+        # The load has read the table when another request commits a new skill.
+        pairs = list(pairs)
+        client.put(f"/candidates/{candidate_id}/skills", json={"skill_ids": [python]})
+        load(pairs)
+
+    monkeypatch.setattr(SKILL_INDEX, "load", load_then_commit)
+    matches = client.get(f"/jobs/{job_id}/matches").json()
+    assert [m["candidate"]["candidate_id"] for m in matches] == [candidate_id]
+
+def test_funnel_counts_follow_status_transitions():
+    user_id = client.post(
+        "/users/",
+        json={"first_name": "Funnel", "last_name": "Owner", "email": "funnel@example.com", "role": "HR Manager"},
+    ).json()["user_id"]
+    job_id = client.post(
+        "/jobs/", json={"title": "Funnel job", "description": "Text.", "created_by_user_id": user_id}
+    ).json()["job_id"]
+    results = client.post(
+        "/candidates/bulk",
+        json=[{"first_name": "F", "last_name": str(i), "email": f"funnel{i}@example.com"} for i in range(3)],
+    ).json()
+    application_ids = [
+        client.post("/applications/", json={"job_id": job_id, "candidate_id": result["id"]}).json()["application_id"]
+        for result in results
+    ]
+
+    client.put(f"/applications/{application_ids[0]}", json={"status": "screening"})
+    client.patch("/applications/status", json={"status": "rejected", "application_ids": application_ids[1:]})
+    client.delete(f"/applications/{application_ids[2]}")
+
+    funnel = client.get("/analytics/funnel", params={"job_id": job_id}).json()
+    assert funnel["total"] == 2
+    assert funnel["status_counts"]["screening"] == 1
+    assert funnel["status_counts"]["rejected"] == 1
+    assert funnel["status_counts"]["applied"] == 0
+    assert client.get("/analytics/funnel").json()["status_counts"] == funnel["status_counts"]
+
+    # Three applications left "applied", each after well under an hour.
+    durations = {d["status"]: d for d in funnel["stage_durations"]}
+    assert durations["applied"]["transitions"] == 3
+    assert durations["applied"]["p50_hours"] == 1.0
+    assert durations["hired"]["p50_hours"] is None
+
+    assert client.get("/analytics/funnel", params={"job_id": 999}).status_code == 404
+
+def test_histogram_percentile_reports_bucket_bounds():
+    from main import STAGE_DURATION_BUCKETS, histogram_percentile
+
+    # Five stays under an hour, four of 12-24 hours and one beyond 90 days.
+    counts = [0] * (len(STAGE_DURATION_BUCKETS) + 1)
+    counts[0], counts[3], counts[-1] = 5, 4, 1
+    assert histogram_percentile(counts, 0.5) == 3600
+    assert histogram_percentile(counts, 0.6) == 86400
+    assert histogram_percentile(counts, 0.9) == 86400
+    assert histogram_percentile(counts, 1.0) == 90 * 86400
+    assert histogram_percentile([0] * len(counts), 0.5) is None
+
+def test_time_to_hire_analytics():
+    pytest.importorskip("numpy")
+
+    db = TestingSessionLocal()
+    db.execute(text("INSERT INTO users (user_id, first_name, last_name, email, role) VALUES (1, 'A', 'B', 'a@example.com', 'HR Manager')"))
+    db.execute(text("INSERT INTO jobs (job_id, title, description, created_by_user_id) VALUES (1, 'Job', 'Text.', 1)"))
+    for i in range(1, 4):
+        db.execute(text(f"INSERT INTO candidates (candidate_id, first_name, last_name, email) VALUES ({i}, 'C', '{i}', 'c{i}@example.com')"))
+    # Applications 1 and 2 were submitted in the week of Monday 2025-01-06, application 3 a week later.
+    db.execute(text(
+        "INSERT INTO applications (application_id, job_id, candidate_id, status, applied_at) VALUES "
+        "(1, 1, 1, 'hired', '2025-01-06 00:00:00'), (2, 1, 2, 'hired', '2025-01-08 00:00:00'), "
+        "(3, 1, 3, 'applied', '2025-01-13 00:00:00')"
+    ))
+    db.execute(text(
+        "INSERT INTO decision_logs (application_id, user_id, decision, created_at) VALUES "
+        "(1, 1, 'move_to_next_stage', '2025-01-08 00:00:00'), (1, 1, 'hire', '2025-01-16 00:00:00'), "
+        "(2, 1, 'hire', '2025-01-12 00:00:00')"
+    ))
+    db.commit()
+    db.close()
+
+    report = client.get("/analytics/time-to-hire").json()
+    assert report["time_to_hire"]["count"] == 2
+    assert report["time_to_hire"]["p50_days"] == 7.0  # median of 10 and 4 days
+    stages = {stage["stage"]: stage for stage in report["stage_medians"]}
+    assert stages["applied"] == {"stage": "applied", "transitions": 2, "median_days": 3.0}
+    assert stages["move_to_next_stage"]["median_days"] == 8.0
+    assert [(c["week_start"], c["applications"], c["hires"]) for c in report["weekly_cohorts"]] == [
+        ("2025-01-06", 2, 2),
+        ("2025-01-13", 1, 0),
+    ]
+
+    # A new decision changes the cache key, so the report is recomputed.
+    db = TestingSessionLocal()
+    db.execute(text("INSERT INTO decision_logs (application_id, user_id, decision, created_at) VALUES (3, 1, 'hire', '2025-01-14 00:00:00')"))
+    db.commit()
+    db.close()
+    assert client.get("/analytics/time-to-hire").json()["time_to_hire"]["count"] == 3
+
+def test_time_to_hire_report_ignores_null_decisions():
+    pytest.importorskip("numpy")
+    import analytics
+    from sqlalchemy import Column, Integer, MetaData, Table, Text
+
+    # The schema makes `decision` NOT NULL, so use lenient tables to store a NULL one.
+    metadata = MetaData()
+    applications = Table(
+        "applications", metadata, Column("application_id", Integer, primary_key=True), Column("applied_at", Text)
+    )
+    decision_logs = Table(
+        "decision_logs", metadata,
+        Column("decision_log_id", Integer, primary_key=True),
+        Column("application_id", Integer),
+        Column("decision", Text, nullable=True),
+        Column("created_at", Text),
+    )
+    lenient_engine = create_engine("sqlite://")
+    metadata.create_all(lenient_engine)
+    with lenient_engine.begin() as connection:
+        connection.execute(applications.insert(), [{"application_id": 1, "applied_at": "2025-01-06 00:00:00"}])
+        connection.execute(decision_logs.insert(), [
+            {"application_id": 1, "decision": None, "created_at": "2025-01-07 00:00:00"},
+            {"application_id": 1, "decision": "hire", "created_at": "2025-01-10 00:00:00"},
+        ])
+        report = analytics.time_to_hire_report(connection, applications, decision_logs)
+    lenient_engine.dispose()
+
+    assert report["time_to_hire"]["count"] == 1
+    assert report["time_to_hire"]["p50_days"] == 4.0
+    assert report["stage_medians"] == [{"stage": "applied", "transitions": 1, "median_days": 4.0}]
+
+def test_interview_conflicts_and_availability(monkeypatch):
+    from datetime import datetime
+
+    interviewers = [
+        client.post(
+            "/users/",
+            json={"first_name": "I", "last_name": str(i), "email": f"interviewer{i}@example.com", "role": "Hiring Manager"},
+        ).json()["user_id"]
+        for i in range(2)
+    ]
+    job_id = client.post(
+        "/jobs/", json={"title": "SRE", "description": "On call.", "created_by_user_id": interviewers[0]}
+    ).json()["job_id"]
+    candidate_id = client.post(
+        "/candidates/", json={"first_name": "Booked", "last_name": "Candidate", "email": "booked@example.com"}
+    ).json()["candidate_id"]
+    application_id = client.post(
+        "/applications/", json={"job_id": job_id, "candidate_id": candidate_id}
+    ).json()["application_id"]
+
+    def book(start, end, user_ids):
+        return client.post(
+            "/interviews/",
+            json={
+                "application_id": application_id,
+                "interview_stage": "Technical",
+                "start_time": f"2030-01-07T{start}:00",
+                "end_time": f"2030-01-07T{end}:00",
+                "participant_user_ids": user_ids,
+            },
+        )
+
+    first = book("10:00", "11:00", [interviewers[0]])
+    assert first.status_code == 201
+    assert first.json()["participant_user_ids"] == [interviewers[0]]
+    # The interviewer, or the candidate alone, is already booked.
+    assert book("10:30", "11:30", [interviewers[0]]).status_code == 409
+    conflict = book("10:59", "12:00", [interviewers[1]])
+    assert conflict.status_code == 409
+    assert "candidate" in conflict.json()["detail"]
+    # Intervals are half-open, so back-to-back interviews are fine.
+    second = book("11:00", "12:00", [interviewers[1]])
+    assert second.status_code == 201
+    assert book("09:00", "10:00", [999]).status_code == 404
+
+    second_id = second.json()["interview_id"]
+    moved = client.put(f"/interviews/{second_id}", json={"start_time": "2030-01-07T10:30:00Z"})
+    assert moved.status_code == 409
+    moved = client.put(
+        f"/interviews/{second_id}",
+        json={"start_time": "2030-01-07T14:00:00+02:00", "end_time": "2030-01-07T12:30:00Z", "participant_user_ids": interviewers},
+    )
+    assert moved.status_code == 200
+    assert moved.json()["start_time"] == "2030-01-07T12:00:00"
+
+    availability = client.get(
+        f"/users/{interviewers[0]}/availability",
+        params={"start": "2030-01-07T09:00:00", "end": "2030-01-07T13:00:00", "min_minutes": 45},
+    ).json()
+    assert [slot["interview_id"] for slot in availability["busy"]] == [first.json()["interview_id"], second_id]
+    assert availability["free"] == [
+        {"start": "2030-01-07T09:00:00", "end": "2030-01-07T10:00:00"},
+        {"start": "2030-01-07T11:00:00", "end": "2030-01-07T12:00:00"},
+    ]
+    assert client.get(
+        f"/users/{interviewers[0]}/availability",
+        params={"start": "2030-01-07T13:00:00", "end": "2030-01-07T09:00:00"},
+    ).status_code == 400
+
+    def busy(user_id):
+        return client.get(
+            f"/users/{user_id}/availability", params={"start": "2030-01-07T09:00:00", "end": "2030-01-07T13:00:00"}
+        ).json()["busy"]
+
+    # Deleting a participant drops only their entries; the index is not reloaded.
+    assert client.delete(f"/users/{interviewers[1]}").status_code == 204
+    assert INTERVIEW_INDEX.loaded
+    assert INTERVIEW_INDEX.overlapping(("user", interviewers[1]), datetime(2030, 1, 7), datetime(2030, 1, 8)) == []
+    assert len(busy(interviewers[0])) == 2
+
+    # Interviews cascading away with their application while the index loads are removed from it too.
+    INTERVIEW_INDEX.clear()
+    load = INTERVIEW_INDEX.load
+
+    def load_then_delete(items):
+        items = list(items)
+        assert client.delete(f"/applications/{application_id}").status_code == 204
+        load(items)
+
+    monkeypatch.setattr(INTERVIEW_INDEX, "load", load_then_delete)
+    assert busy(interviewers[0]) == []
+    assert INTERVIEW_INDEX.loaded
+
+def empty_in_memory_store(store):
+    """Drops every row and link of the in-memory backend, as a restart would."""
+    for rows in store.db.values():
+        rows.clear()
+    for links in store.db_junction.values():
+        links.clear()
+    store.id_counters.update(dict.fromkeys(store.id_counters, 0))
+    store.rebuild_indexes()
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """The in-memory backend, emptied, with its snapshot and write-ahead log under `tmp_path`."""
+    import main_in_memory as store
+
+    monkeypatch.setattr(store, "SNAPSHOT_PATH", str(tmp_path / "snapshot.pickle"))
+    monkeypatch.setattr(store, "WAL_PATH", str(tmp_path / "in_memory.wal"))
+    empty_in_memory_store(store)
+    yield store
+    if store.wal is not None:
+        store.wal.close()
+        store.wal = None
+    empty_in_memory_store(store)
+
+def test_in_memory_emails_are_freed_by_update_and_delete(store):
+    memory_client = TestClient(store.app)
+    user = {"first_name": "Mem", "last_name": "User", "email": "old@example.com", "role": "HR Manager"}
+    user_id = memory_client.post("/users/", json=user).json()["user_id"]
+    assert memory_client.post("/users/", json=user).status_code == 409
+    # Keeping one's own email is not a conflict.
+    assert memory_client.put(f"/users/{user_id}", json={"email": "old@example.com"}).status_code == 200
+
+    assert memory_client.put(f"/users/{user_id}", json={"email": "new@example.com"}).status_code == 200
+    assert memory_client.post("/users/", json={**user, "email": "new@example.com"}).status_code == 409
+    other_id = memory_client.post("/users/", json=user).json()["user_id"]
+    assert memory_client.put(f"/users/{other_id}", json={"email": "new@example.com"}).status_code == 409
+
+    assert memory_client.delete(f"/users/{user_id}").status_code == 204
+    assert memory_client.put(f"/users/{other_id}", json={"email": "new@example.com"}).status_code == 200
+    assert store.db_email_index["users"] == {"new@example.com": other_id}
+
+    candidate = {"first_name": "Mem", "last_name": "Candidate", "email": "cand@example.com"}
+    candidate_id = memory_client.post("/candidates/", json=candidate).json()["candidate_id"]
+    assert memory_client.post("/candidates/", json=candidate).status_code == 409
+    assert memory_client.delete(f"/candidates/{candidate_id}").status_code == 204
+    assert memory_client.post("/candidates/", json=candidate).status_code == 201
+
+def assert_in_memory_indexes_consistent(store):
+    """Checks the incrementally maintained indexes against ones rebuilt from the tables."""
+    import copy
+
+    maintained = copy.deepcopy(
+        (store.db_email_index, store.db_application_index, store.db_fk_index, store.db_junction_index)
+    )
+    store.rebuild_indexes()
+    assert maintained == (store.db_email_index, store.db_application_index, store.db_fk_index, store.db_junction_index)
+
+def test_in_memory_candidate_delete_cascades(store):
+    memory_client = TestClient(store.app)
+    user_id = memory_client.post(
+        "/users/", json={"first_name": "Case", "last_name": "Cade", "email": "cascade@example.com", "role": "HR Manager"}
+    ).json()["user_id"]
+    store.insert_row("jobs", 1, store.Record(job_id=1, created_by_user_id=user_id, hiring_manager_user_id=user_id))
+    leaving, staying = (
+        memory_client.post(
+            "/candidates/", json={"first_name": "C", "last_name": str(i), "email": f"cascade{i}@example.com"}
+        ).json()["candidate_id"]
+        for i in range(2)
+    )
+    leaving_app, staying_app = (
+        memory_client.post("/applications/", json={"job_id": 1, "candidate_id": candidate_id}).json()["application_id"]
+        for candidate_id in (leaving, staying)
+    )
+    store.insert_row("documents", 1, store.Record(document_id=1, application_id=leaving_app))
+    store.insert_row("interviews", 1, store.Record(interview_id=1, application_id=leaving_app, scheduled_by_user_id=user_id))
+    store.add_junction_link("interview_participants", (1, user_id))
+    store.insert_row("feedback", 1, store.Record(feedback_id=1, application_id=leaving_app, user_id=user_id, interview_id=1))
+    # Feedback on another application that refers to the interview outlives it.
+    store.insert_row("feedback", 2, store.Record(feedback_id=2, application_id=staying_app, user_id=user_id, interview_id=1))
+    store.insert_row("decision_logs", 1, store.Record(decision_log_id=1, application_id=leaving_app, user_id=user_id))
+    store.add_junction_link("candidate_skills", (leaving, 1))
+
+    assert memory_client.put(f"/applications/{staying_app}", json={"status": "screening"}).status_code == 200
+    assert memory_client.put(f"/candidates/{staying}", json={"email": "moved@example.com"}).status_code == 200
+    assert_in_memory_indexes_consistent(store)
+
+    assert memory_client.delete(f"/candidates/{leaving}").status_code == 204
+    assert list(store.db["applications"]) == [staying_app]
+    for table in ("documents", "interviews", "decision_logs"):
+        assert store.db[table] == {}
+    assert list(store.db["feedback"]) == [2]
+    assert store.db["feedback"][2].interview_id is None
+    assert store.db_junction == {"candidate_skills": set(), "interview_participants": set()}
+    assert_in_memory_indexes_consistent(store)
+    assert store.db_fk_index[("feedback", "interview_id")] == {}
+    assert store.db_application_index == {(1, staying): staying_app}
+
+    # The user still created the job and wrote feedback 2, so cannot be deleted.
+    assert memory_client.delete(f"/users/{user_id}").status_code == 409
+
+def test_in_memory_applications_are_unique_and_filterable(store):
+    memory_client = TestClient(store.app)
+    for job_id in (1, 2):
+        store.insert_row("jobs", job_id, store.Record(job_id=job_id))
+    candidate_ids = [
+        memory_client.post(
+            "/candidates/", json={"first_name": "F", "last_name": str(i), "email": f"filter{i}@example.com"}
+        ).json()["candidate_id"]
+        for i in range(2)
+    ]
+    ids = {
+        (job_id, candidate_id): memory_client.post(
+            "/applications/", json={"job_id": job_id, "candidate_id": candidate_id}
+        ).json()["application_id"]
+        for job_id in (1, 2)
+        for candidate_id in candidate_ids
+    }
+    duplicate = memory_client.post("/applications/", json={"job_id": 1, "candidate_id": candidate_ids[0]})
+    assert duplicate.status_code == 409
+    assert memory_client.post("/applications/", json={"job_id": 3, "candidate_id": candidate_ids[0]}).status_code == 404
+
+    def listed(**params):
+        return [a["application_id"] for a in memory_client.get("/applications/", params=params).json()]
+
+    assert listed() == sorted(ids.values())
+    assert listed(job_id=2) == [ids[2, candidate_ids[0]], ids[2, candidate_ids[1]]]
+    assert listed(candidate_id=candidate_ids[1]) == [ids[1, candidate_ids[1]], ids[2, candidate_ids[1]]]
+    assert listed(job_id=1, candidate_id=candidate_ids[0]) == [ids[1, candidate_ids[0]]]
+    assert listed(job_id=3) == []
+
+    # Once deleted, the candidate may apply for the job again.
+    assert memory_client.delete(f"/applications/{ids[1, candidate_ids[0]]}").status_code == 204
+    assert listed(job_id=1, candidate_id=candidate_ids[0]) == []
+    assert memory_client.post("/applications/", json={"job_id": 1, "candidate_id": candidate_ids[0]}).status_code == 201
+
+def test_in_memory_snapshot_survives_restart(store):
+    import os
+    from persistence import log_segments, read_log
+
+    with TestClient(store.app) as memory_client:
+        user_id = memory_client.post(
+            "/users/", json={"first_name": "Snap", "last_name": "Shot", "email": "snap@example.com", "role": "HR Manager"}
+        ).json()["user_id"]
+        candidate_id = memory_client.post(
+            "/candidates/", json={"first_name": "Snap", "last_name": "Candidate", "email": "snapc@example.com"}
+        ).json()["candidate_id"]
+        store.insert_row("jobs", 1, store.Record(job_id=1, created_by_user_id=user_id, hiring_manager_user_id=None))
+        application = memory_client.post("/applications/", json={"job_id": 1, "candidate_id": candidate_id}).json()
+    assert os.path.exists(store.SNAPSHOT_PATH)
+    # The shutdown snapshot covers every write, so the log holds none.
+    assert all(not list(read_log(path)) for _, path in log_segments(store.WAL_PATH))
+
+    empty_in_memory_store(store)
+    with TestClient(store.app) as memory_client:
+        assert memory_client.get(f"/applications/{application['application_id']}").json() == application
+        assert memory_client.get(f"/users/{user_id}").json()["email"] == "snap@example.com"
+        # Rows of tables without a model come back as plain-valued records.
+        assert store.db["jobs"][1] == store.Record(job_id=1, created_by_user_id=user_id, hiring_manager_user_id=None)
+        # Indexes and ID counters are restored too.
+        assert memory_client.post(
+            "/candidates/", json={"first_name": "Snap", "last_name": "Again", "email": "snapc@example.com"}
+        ).status_code == 409
+        assert memory_client.post("/applications/", json={"job_id": 1, "candidate_id": candidate_id}).status_code == 409
+        assert memory_client.post(
+            "/candidates/", json={"first_name": "Snap", "last_name": "Next", "email": "next@example.com"}
+        ).json()["candidate_id"] == candidate_id + 1
+        assert_in_memory_indexes_consistent(store)
+
+def test_in_memory_snapshotter_keeps_running_after_a_failure(store, monkeypatch):
+    import threading
+
+    attempts = []
+    retried = threading.Event()
+
+    def take_snapshot():
+        attempts.append(True)
+        if len(attempts) == 1:
+            raise OSError("disk full")
+        retried.set()
+        return True
+
+    monkeypatch.setattr(store, "SNAPSHOT_INTERVAL_SECONDS", 0.01)
+    monkeypatch.setattr(store, "take_snapshot", take_snapshot)
+    stop = threading.Event()
+    snapshotter = threading.Thread(target=store.snapshot_periodically, args=(stop,))
+    snapshotter.start()
+    try:
+        assert retried.wait(5)
+    finally:
+        stop.set()
+        snapshotter.join()
+
+def crash_in_memory_store(store):
+    """Loses the in-memory state and the open log, committed records aside, as a crash would."""
+    store.wal._file.close()
+    store.wal = None
+    empty_in_memory_store(store)
+
+def create_in_memory_candidates(store, count):
+    from main_in_memory import CandidateCreate
+
+    return [
+        store.create_candidate(CandidateCreate(first_name="Log", last_name=str(i), email=f"log{i}@example.com"))
+        .candidate_id
+        for i in range(count)
+    ]
+
+def log_record_offsets(path):
+    """Returns the contents of a log segment and the offset of each record in it."""
+    from persistence import RECORD_HEADER
+
+    with open(path, "rb") as f:
+        data = f.read()
+    offsets, offset = [], 0
+    while offset < len(data):
+        offsets.append(offset)
+        offset += RECORD_HEADER.size + RECORD_HEADER.unpack_from(data, offset)[0]
+    return data, offsets
+
+def test_in_memory_log_replays_committed_writes_after_a_crash(store):
+    store.recover()
+    candidate_ids = create_in_memory_candidates(store, 3)
+    store.update_candidate(candidate_ids[0], store.CandidateUpdate(email="renamed@example.com"))
+    store.delete_candidate(candidate_ids[1])
+    # Buffered but never committed, so lost in the crash.
+    store.wal.append(("delete", "candidates", candidate_ids[2]))
+    crash_in_memory_store(store)
+
+    store.recover()
+    assert sorted(store.db["candidates"]) == [candidate_ids[0], candidate_ids[2]]
+    assert store.db["candidates"][candidate_ids[0]].email == "renamed@example.com"
+    assert store.id_counters["candidates"] == 3
+    assert_in_memory_indexes_consistent(store)
+
+def test_in_memory_log_replay_stops_at_a_torn_or_corrupt_record(store):
+    from persistence import RECORD_HEADER
+
+    store.recover()
+    path = f"{store.WAL_PATH}.{store.wal.generation:08d}"
+    candidate_ids = create_in_memory_candidates(store, 3)
+    crash_in_memory_store(store)
+    data, offsets = log_record_offsets(path)
+
+    # The last record was cut short mid-write: it is ignored.
+    with open(path, "wb") as f:
+        f.write(data[:-3])
+    store.recover()
+    assert sorted(store.db["candidates"]) == candidate_ids[:2]
+
+    # A record failing its CRC ends the replay of its segment.
+    crash_in_memory_store(store)
+    corrupt = bytearray(data)
+    corrupt[offsets[1] + RECORD_HEADER.size] ^= 0xFF
+    with open(path, "wb") as f:
+        f.write(corrupt)
+    store.recover()
+    assert sorted(store.db["candidates"]) == candidate_ids[:1]
+
+def test_in_memory_snapshot_removes_the_log_segments_it_covers(store):
+    import os
+    from persistence import WriteAheadLog, log_segments
+
+    store.recover()
+    create_in_memory_candidates(store, 2)
+    covered = store.wal.generation
+    assert store.take_snapshot()
+    assert log_segments(store.WAL_PATH) == [(covered + 1, f"{store.WAL_PATH}.{covered + 1:08d}")]
+
+    # A segment the snapshot covers, left behind by a crash before its removal, is deleted rather than replayed.
+    stale = WriteAheadLog(store.WAL_PATH, covered)
+    stale.commit(stale.append(("delete", "candidates", 1)))
+    stale.close()
+    crash_in_memory_store(store)
+    store.recover()
+    assert len(store.db["candidates"]) == 2
+    assert not os.path.exists(f"{store.WAL_PATH}.{covered:08d}")
+    assert [generation for generation, _ in log_segments(store.WAL_PATH)] == [covered + 1, covered + 2]
+
+def test_write_ahead_log_refuses_to_rotate_after_a_failed_commit(tmp_path, monkeypatch):
+    from persistence import WriteAheadLog
+
+    log = WriteAheadLog(str(tmp_path / "wal"), 1)
+    write = log._write
+
+    def failing_write(data):
+        raise OSError("fsync failed")
+
+    monkeypatch.setattr(log, "_write", failing_write)
+    with pytest.raises(OSError):
+        log.commit(log.append(("put", "candidates", 1, {})))
+    monkeypatch.setattr(log, "_write", write)
+    with pytest.raises(OSError, match="restart to recover"):
+        log.rotate()
+    assert log.generation == 1
+    log._file.close()
+
+@pytest.fixture
+def async_client():
+    """A client for `main_async.app` on the test database; the override and engine are cleaned up after."""
+    pytest.importorskip("aiosqlite")
+    pytest.importorskip("greenlet")
+    import asyncio
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    import main_async
+
+    test_async_engine = create_async_engine("sqlite+aiosqlite:///./recruitment_app.db")
+    TestingAsyncSessionLocal = async_sessionmaker(bind=test_async_engine, autoflush=False)
+
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as db:
+            yield db
+
+    main_async.app.dependency_overrides[main_async.get_db] = override_get_async_db
+    try:
+        yield TestClient(main_async.app)
+    finally:
+        main_async.app.dependency_overrides.pop(main_async.get_db, None)
+        asyncio.run(test_async_engine.dispose())
+
+def test_async_app_create_and_list_candidates(async_client):
+    for i in range(3):
+        response = async_client.post(
+            "/candidates/",
+            json={"first_name": "Async", "last_name": str(i), "email": f"async{i}@example.com"},
+        )
+        assert response.status_code == 201
+
+    response = async_client.post(
+        "/candidates/",
+        json={"first_name": "Async", "last_name": "Dup", "email": "async0@example.com"},
+    )
+    assert response.status_code == 409
+
+    response = async_client.get("/candidates/", params={"limit": 2})
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+    response = async_client.get("/candidates/", params={"cursor": response.headers["X-Next-Cursor"]})
+    assert [c["last_name"] for c in response.json()] == ["2"]
+
+    candidate_id = response.json()[0]["candidate_id"]
+    response = async_client.delete(f"/candidates/{candidate_id}")
+    assert response.status_code == 204
+    assert async_client.get(f"/candidates/{candidate_id}").status_code == 404
+
 if __name__ == "__main__":
     pytest.main()
\ No newline at end of file
@@ -0,0 +1,152 @@
+"""
+In-memory inverted index from skills to the candidates who have them.
+
+`SkillIndex` keeps, for every skill, a sorted array of candidate IDs (a
+posting list). Ranking candidates for a job then only touches the posting
+lists of the job's required skills instead of scanning `candidate_skills`.
+The index is loaded once from the database and updated incrementally as
+candidate skills change.
+
+NumPy is used to merge posting lists when it is installed; otherwise a pure
+Python counter is used, which is slower on very large indexes.
+"""
+import heapq
+import threading
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; `match` falls back to a Counter.
+    np = None
+
+
+class SkillIndex:
+    """
+    A thread-safe inverted index: skill_id -> sorted array of candidate IDs.
+
+    All methods are idempotent, so replaying a change the index already
+    reflects is harmless.
+    """
+
+    def __init__(self):
+        self._postings: Dict[int, array] = {}
+        self._lock = threading.RLock()
+        self._pending: Optional[list] = None  # Changes committed while a load reads the database.
+        self.loaded = False
+
+    def start_load(self) -> None:
+        """
+        Starts queuing the changes passed to `apply` until `load` finishes.
+        Call it before reading the pairs to load, so a change committed while
+        they are read is replayed over them instead of lost.
+        """
+        with self._lock:
+            self._pending = []
+
+    def load(self, pairs: Iterable[Tuple[int, int]]) -> None:
+        """Replaces the whole index with `(skill_id, candidate_id)` pairs, then replays the queued changes."""
+        postings: Dict[int, array] = {}
+        for skill_id, candidate_id in pairs:
+            postings.setdefault(skill_id, array("q")).append(candidate_id)
+        for skill_id, posting in postings.items():
+            postings[skill_id] = array("q", sorted(set(posting)))
+        with self._lock:
+            self._postings = postings
+            self.loaded = True
+            pending, self._pending = self._pending or (), None
+            self.apply(pending)
+
+    def apply(self, changes: Iterable[tuple]) -> None:
+        """
+        Applies committed `(method, *args)` changes: queued during a load,
+        dropped while the index is not loaded (the next load reads them).
+        """
+        with self._lock:
+            if self._pending is not None:
+                self._pending.extend(changes)
+            elif self.loaded:
+                for method, *args in changes:
+                    method(*args)
+
+    def clear(self) -> None:
+        """Empties the index, marks it as not loaded and abandons any load in progress."""
+        with self._lock:
+            self._postings = {}
+            self._pending = None
+            self.loaded = False
+
+    def add(self, skill_id: int, candidate_id: int) -> None:
+        """Records that a candidate has a skill."""
+        with self._lock:
+            posting = self._postings.setdefault(skill_id, array("q"))
+            i = bisect_left(posting, candidate_id)
+            if i == len(posting) or posting[i] != candidate_id:
+                posting.insert(i, candidate_id)
+
+    def remove(self, skill_id: int, candidate_id: int) -> None:
+        """Records that a candidate no longer has a skill."""
+        with self._lock:
+            self._discard(self._postings.get(skill_id), candidate_id)
+
+    def remove_candidate(self, candidate_id: int) -> None:
+        """Removes a candidate from every posting list."""
+        with self._lock:
+            for posting in self._postings.values():
+                self._discard(posting, candidate_id)
+
+    @staticmethod
+    def _discard(posting, candidate_id: int) -> None:
+        if posting is None:
+            return
+        i = bisect_left(posting, candidate_id)
+        if i < len(posting) and posting[i] == candidate_id:
+            del posting[i]
+
+    def skills_of(self, candidate_id: int, skill_ids: Iterable[int]) -> List[int]:
+        """Returns which of `skill_ids` the candidate has, by binary search of each posting list."""
+        matched = []
+        with self._lock:
+            for skill_id in skill_ids:
+                posting = self._postings.get(skill_id)
+                if posting is not None:
+                    i = bisect_left(posting, candidate_id)
+                    if i < len(posting) and posting[i] == candidate_id:
+                        matched.append(skill_id)
+        return matched
+
+    def match(self, skill_ids: Iterable[int], limit: int, min_overlap: int = 1) -> List[Tuple[int, int]]:
+        """
+        Ranks candidates by how many of `skill_ids` they have.
+
+        Returns:
+            Up to `limit` `(candidate_id, overlap)` pairs with at least
+            `min_overlap` shared skills, highest overlap first and then by
+            ascending candidate ID.
+        """
+        with self._lock:
+            postings = [self._postings[skill_id] for skill_id in set(skill_ids) if self._postings.get(skill_id)]
+            if np is not None:
+                # Copy while holding the lock: a buffer export would block inserts.
+                ids = np.concatenate([np.frombuffer(p, dtype=np.int64) for p in postings]) if postings else None
+            else:
+                counts = Counter(candidate_id for posting in postings for candidate_id in posting)
+
+        if np is None:
+            ranked = ((candidate_id, overlap) for candidate_id, overlap in counts.items() if overlap >= min_overlap)
+            return heapq.nsmallest(limit, ranked, key=lambda pair: (-pair[1], pair[0]))
+        if ids is None:
+            return []
+        candidate_ids, overlaps = np.unique(ids, return_counts=True)
+        keep = overlaps >= min_overlap
+        candidate_ids, overlaps = candidate_ids[keep], overlaps[keep]
+        if len(candidate_ids) > limit:
+            # Partition on the overlap first so only the best few are sorted.
+            top = np.argpartition(-overlaps, limit - 1)[:limit]
+            cutoff = overlaps[top].min()
+            keep = overlaps >= cutoff
+            candidate_ids, overlaps = candidate_ids[keep], overlaps[keep]
+        order = np.lexsort((candidate_ids, -overlaps))[:limit]
+        return [(int(candidate_ids[i]), int(overlaps[i])) for i in order]
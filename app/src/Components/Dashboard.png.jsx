@@ -78,9 +78,9 @@ const StatusBadge = ({ status }) => {
 };
 
 // API utility functions
-const fetchJobs = async () => {
+const fetchDashboardJobs = async () => {
   try {
-    const response = await fetch(`${API_BASE_URL}/jobs/`);
+    const response = await fetch(`${API_BASE_URL}/dashboard/jobs`);
     if (!response.ok) {
       throw new Error(`HTTP error! status: ${response.status}`);
     }
@@ -91,25 +91,26 @@ const fetchJobs = async () => {
   }
 };
 
-const fetchApplicationsForJob = async (jobId) => {
+// Full-text search over job titles and descriptions, best matches first
+const searchJobIds = async (query) => {
   try {
-    const response = await fetch(`${API_BASE_URL}/applications/`);
+    const params = new URLSearchParams({ q: query, limit: '100' });
+    const response = await fetch(`${API_BASE_URL}/search?${params}`);
     if (!response.ok) {
       throw new Error(`HTTP error! status: ${response.status}`);
     }
-    const applications = await response.json();
-    return applications.filter(app => app.job_id === jobId);
+    const results = await response.json();
+    return results.jobs.map(hit => hit.id);
   } catch (error) {
-    console.error('Error fetching applications:', error);
-    return [];
+    console.error('Error searching jobs:', error);
+    throw error;
   }
 };
 
 // Transform backend data to match frontend expectations
-const transformJobData = (jobs, applicationsData) => {
+const transformJobData = (jobs) => {
   return jobs.map(job => {
-    const applications = applicationsData[job.job_id] || [];
-    const applicantCount = applications.length;
+    const applicantCount = job.applicant_count;
     
     // Map job titles to departments based on common patterns
     let department = 'Not specified';
@@ -139,7 +140,7 @@ const transformJobData = (jobs, applicationsData) => {
     let status = 'Open';
     if (applicantCount === 0) {
       status = 'Open';
-    } else if (applications.some(app => app.status === 'interviewing')) {
+    } else if (job.status_counts.interviewing > 0) {
       status = 'Interviewing';
     }
 
@@ -186,19 +187,11 @@ export default function Dashboard({ onJobClick }) {
         setLoading(true);
         setError(null);
         
-        // Fetch jobs and applications
-        const jobsData = await fetchJobs();
-        
-        // Fetch applications for each job
-        const applicationsData = {};
-        await Promise.all(
-          jobsData.map(async (job) => {
-            applicationsData[job.job_id] = await fetchApplicationsForJob(job.job_id);
-          })
-        );
+        // Fetch jobs with their applicant counts in one request
+        const jobsData = await fetchDashboardJobs();
         
         // Transform data for the UI
-        const transformedJobs = transformJobData(jobsData, applicationsData);
+        const transformedJobs = transformJobData(jobsData);
         setJobs(transformedJobs);
         setFilteredJobs(transformedJobs); // Initialize filtered jobs
       } catch (err) {
@@ -212,20 +205,31 @@ export default function Dashboard({ onJobClick }) {
     loadData();
   }, []);
 
-  // Filter jobs based on search term
+  // Filter jobs with the server-side full-text search, debounced while typing
   useEffect(() => {
+    // Reset to first page when search changes
+    setCurrentPage(1);
     if (!searchTerm.trim()) {
       setFilteredJobs(jobs);
-    } else {
-      const filtered = jobs.filter(job => 
-        job.title.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        job.department.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        job.status.toLowerCase().includes(searchTerm.toLowerCase())
-      );
-      setFilteredJobs(filtered);
+      return;
     }
-    // Reset to first page when search changes
-    setCurrentPage(1);
+
+    let cancelled = false;
+    const timer = setTimeout(async () => {
+      try {
+        const ids = await searchJobIds(searchTerm);
+        if (cancelled) return;
+        const jobsById = new Map(jobs.map(job => [job.job_id, job]));
+        setFilteredJobs(ids.map(id => jobsById.get(id)).filter(Boolean));
+      } catch (err) {
+        if (!cancelled) setError(err.message);
+      }
+    }, 200);
+
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
   }, [searchTerm, jobs]);
 
   const handleSearchChange = (e) => {
@@ -277,7 +281,7 @@ export default function Dashboard({ onJobClick }) {
               <input
                 type="text"
                 ref={searchInputRef}
-                placeholder="Search jobs by title, description, or status... (Ctrl+K)"
+                placeholder="Search jobs by title or description... (Ctrl+K)"
                 value={searchTerm}
                 onChange={handleSearchChange}
                 style={{ 
@@ -52,14 +52,9 @@ const formatDate = (dateString) => {
 };
 
 // Helper function to transform API data to component format
-const transformApplicationData = (applications, candidates) => {
-  const candidateMap = candidates.reduce((acc, candidate) => {
-    acc[candidate.candidate_id] = candidate;
-    return acc;
-  }, {});
-
+const transformApplicationData = (applications) => {
   return applications.map((app) => {
-    const candidate = candidateMap[app.candidate_id];
+    const candidate = app.candidate;
     return {
       id: app.application_id,
       name: candidate ? `${candidate.first_name} ${candidate.last_name}` : 'Unknown',
@@ -131,33 +126,16 @@ export default function JobDetailsScreen({ jobId = 1, jobTitle = "UI/UX Senior P
 
         console.log('JobDetails: Fetching data for job ID:', jobId);
 
-        // Fetch job details
-        const jobResponse = await fetch(`${API_BASE_URL}/jobs/${jobId}`);
+        // Fetch job details with its applications and candidates
+        const jobResponse = await fetch(`${API_BASE_URL}/jobs/${jobId}/applicants`);
         if (!jobResponse.ok) {
           throw new Error(`Failed to fetch job details: ${jobResponse.status}`);
         }
         const job = await jobResponse.json();
 
-        // Fetch all applications
-        const applicationsResponse = await fetch(`${API_BASE_URL}/applications/`);
-        if (!applicationsResponse.ok) {
-          throw new Error(`Failed to fetch applications: ${applicationsResponse.status}`);
-        }
-        const allApplications = await applicationsResponse.json();
-
-        // Filter applications for this job
-        const jobApplications = allApplications.filter(app => app.job_id === jobId);
-
-        // Fetch all candidates to get names
-        const candidatesResponse = await fetch(`${API_BASE_URL}/candidates/`);
-        if (!candidatesResponse.ok) {
-          throw new Error(`Failed to fetch candidates: ${candidatesResponse.status}`);
-        }
-        const candidates = await candidatesResponse.json();
-
         // Transform and set data
         setJobData(job);
-        const transformedData = transformApplicationData(jobApplications, candidates);
+        const transformedData = transformApplicationData(job.applications);
         setApplicantsData(transformedData);
         
         // Set first applicant as selected if any exist
@@ -182,14 +160,10 @@ export default function JobDetailsScreen({ jobId = 1, jobTitle = "UI/UX Senior P
     // Refresh data when modal closes (in case new applicant was added)
     const refreshData = async () => {
       try {
-        const applicationsResponse = await fetch(`${API_BASE_URL}/applications/`);
-        const allApplications = await applicationsResponse.json();
-        const jobApplications = allApplications.filter(app => app.job_id === jobId);
-        
-        const candidatesResponse = await fetch(`${API_BASE_URL}/candidates/`);
-        const candidates = await candidatesResponse.json();
+        const jobResponse = await fetch(`${API_BASE_URL}/jobs/${jobId}/applicants`);
+        const job = await jobResponse.json();
         
-        const transformedData = transformApplicationData(jobApplications, candidates);
+        const transformedData = transformApplicationData(job.applications);
         setApplicantsData(transformedData);
       } catch (err) {
         console.error('Error refreshing data:', err);
@@ -30,11 +30,28 @@ export const api = {
     return await handleResponse(response);
   },
 
+  async getDashboardJobs() {
+    const response = await fetch(`${API_BASE_URL}/dashboard/jobs`);
+    return await handleResponse(response);
+  },
+
   async getJob(jobId) {
     const response = await fetch(`${API_BASE_URL}/jobs/${jobId}`);
     return await handleResponse(response);
   },
 
+  async getJobApplicants(jobId) {
+    const response = await fetch(`${API_BASE_URL}/jobs/${jobId}/applicants`);
+    return await handleResponse(response);
+  },
+
+  // Full-text search over jobs and candidates
+  async search(query, limit = 20) {
+    const params = new URLSearchParams({ q: query, limit: String(limit) });
+    const response = await fetch(`${API_BASE_URL}/search?${params}`);
+    return await handleResponse(response);
+  },
+
   async createJob(jobData) {
     const response = await fetch(`${API_BASE_URL}/jobs/`, {
       method: 'POST',
@@ -69,8 +86,9 @@ export const api = {
   },
 
   // Applications
-  async getApplications() {
-    const response = await fetch(`${API_BASE_URL}/applications/`);
+  async getApplications(filters = {}) {
+    const query = new URLSearchParams(filters).toString();
+    const response = await fetch(`${API_BASE_URL}/applications/${query ? `?${query}` : ''}`);
     return await handleResponse(response);
   },
 